@@ -127,13 +127,19 @@ from aeidon import locales
 from aeidon import scripts
 from aeidon.metadata import MetadataItem
 from aeidon.calculator import Calculator
+from aeidon import bulk
 from aeidon.finder import Finder
 from aeidon.parser import Parser
 from aeidon.liner import Liner
 from aeidon import containers
 from aeidon.subtitle import Subtitle
+from aeidon.table import SubtitleRow
+from aeidon.table import SubtitleTable
 from aeidon.file import SubtitleFile
+from aeidon.interval import IntervalIndex
+from aeidon.journal import Journal
 from aeidon import files
+from aeidon import cache
 from aeidon.markup import Markup
 from aeidon import markups
 from aeidon.markupconv import MarkupConverter
@@ -147,4 +153,5 @@ from aeidon.spell import SpellCheckNavigator
 from aeidon.spell import SpellCheckTokenizer
 from aeidon import agents
 from aeidon.project import Project
+from aeidon import parallel
 from aeidon.unittest import TestCase
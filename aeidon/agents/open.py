@@ -18,7 +18,9 @@
 """Reading and parsing data from subtitle files."""
 
 import aeidon
-import bisect
+import io
+
+from pathlib import Path
 
 class OpenAgent(aeidon.Delegate):
 
@@ -63,11 +65,15 @@ class OpenAgent(aeidon.Delegate):
             i += 1
 
     @aeidon.deco.export
-    def open(self, doc, path, encoding=None, align_method=None):
+    def open(self, doc, path, encoding=None, align_method=None, data=None,
+             cache=False):
         """
         Read and parse subtitle data for `doc` from `path`.
 
         `encoding` can be ``None`` to use the system default encoding.
+        `data` can be the bytes of the file, if already read, or the text
+        of the file decoded using `encoding`.
+        `cache` can be ``True`` to use :mod:`aeidon.cache`.
         Return the amount of subtitles that needed to be moved in order
         to arrange them in ascending chronological order.
 
@@ -77,18 +83,39 @@ class OpenAgent(aeidon.Delegate):
         Raise :exc:`aeidon.ParseError` if parsing fails.
         """
         if doc == aeidon.documents.MAIN:
-            return self.open_main(path, encoding)
+            return self.open_main(path, encoding, data, cache)
         if doc == aeidon.documents.TRAN:
-            return self.open_translation(path, encoding, align_method)
+            return self.open_translation(path,
+                                         encoding,
+                                         align_method,
+                                         data,
+                                         cache)
         raise ValueError(f"Invalid document: {doc!r}")
 
+    def _open_file(self, path, encoding, data, cache):
+        """Return file, sorted subtitles and sort count for `path`."""
+        encoding = encoding or aeidon.util.get_default_encoding()
+        key = aeidon.cache.get_key(path, encoding) if cache else None
+        found = aeidon.cache.load(key)
+        if found is not None:
+            return found
+        file = self._new_file(path, encoding, data)
+        subtitles = self._read_file(file)
+        subtitles, sort_count = self._sort_subtitles(subtitles)
+        aeidon.cache.store(key, file, subtitles, sort_count)
+        return file, subtitles, sort_count
+
     @aeidon.deco.export
     @aeidon.deco.notify_frozen
-    def open_main(self, path, encoding=None):
+    def open_main(self, path, encoding=None, data=None, cache=False):
         """
         Read and parse subtitle data for main file from `path`.
 
         `encoding` can be ``None`` to use the system default encoding.
+        `data` can be the bytes of the file, if already read, or the text
+        of the file decoded using `encoding`.
+        `cache` can be ``True`` to use :mod:`aeidon.cache` to skip reading
+        and parsing a file opened before and unchanged since.
         Return the amount of subtitles that needed to be moved in order
         to arrange them in ascending chronological order.
 
@@ -97,29 +124,23 @@ class OpenAgent(aeidon.Delegate):
         Raise :exc:`aeidon.FormatError` if unable to detect format.
         Raise :exc:`aeidon.ParseError` if parsing fails.
         """
-        encoding = encoding or aeidon.util.get_default_encoding()
-        bom_encoding = aeidon.encodings.detect_bom(path)
-        if not bom_encoding in (encoding, None):
-            return self.open_main(path, bom_encoding)
-        format = aeidon.util.detect_format(path, encoding)
-        self.main_file = aeidon.files.new(format, path, encoding)
-        subtitles = self._read_file(self.main_file)
-        self.subtitles, sort_count = self._sort_subtitles(subtitles)
-        self.set_framerate(self.framerate, register=None)
-        self.main_changed = 0
-        # Deactivate possible translation file.
-        self.tran_file = None
-        self.tran_changed = None
-        self.emit("main-file-opened", self.main_file)
+        file, subtitles, sort_count = self._open_file(
+            path, encoding, data, cache)
+        self._set_main_file(file, subtitles)
         return sort_count
 
     @aeidon.deco.export
     @aeidon.deco.notify_frozen
-    def open_translation(self, path, encoding=None, align_method=None):
+    def open_translation(self, path, encoding=None, align_method=None,
+                         data=None, cache=False):
         """
         Read and parse subtitle data for translation file from `path`.
 
         `encoding` can be ``None`` to use the system default encoding.
+        `data` can be the bytes of the file, if already read, or the text
+        of the file decoded using `encoding`.
+        `cache` can be ``True`` to use :mod:`aeidon.cache` to skip reading
+        and parsing a file opened before and unchanged since.
         `align_method` specifies how translation texts are attached to existing
         subtitles. :attr:`aeidon.align_methods.NUMBER` is the simple way, which
         adds the translation texts in order, one-by-one to the exising
@@ -139,15 +160,9 @@ class OpenAgent(aeidon.Delegate):
         Raise :exc:`aeidon.FormatError` if unable to detect format.
         Raise :exc:`aeidon.ParseError` if parsing fails.
         """
-        encoding = encoding or aeidon.util.get_default_encoding()
         align_method = align_method or aeidon.align_methods.POSITION
-        bom_encoding = aeidon.encodings.detect_bom(path)
-        if not bom_encoding in (encoding, None):
-            return self.open_translation(path, bom_encoding, align_method)
-        format = aeidon.util.detect_format(path, encoding)
-        self.tran_file = aeidon.files.new(format, path, encoding)
-        subtitles = self._read_file(self.tran_file)
-        subtitles, sort_count = self._sort_subtitles(subtitles)
+        self.tran_file, subtitles, sort_count = self._open_file(
+            path, encoding, data, cache)
         for subtitle in subtitles:
             subtitle.framerate = self.framerate
         for subtitle in self.subtitles:
@@ -162,6 +177,49 @@ class OpenAgent(aeidon.Delegate):
         self.emit("translation-file-opened", self.tran_file)
         return sort_count
 
+    def _new_file(self, path, encoding, data):
+        """
+        Return a new file for `path` with its content read once.
+
+        Only the beginning of the file or `data` is read to check for a BOM
+        and detect format. The rest is left to the file, which can memory-map
+        the file or scan `data`, decoding a block at a time while parsing.
+        """
+        encoding = encoding or aeidon.util.get_default_encoding()
+        if data is None:
+            encoding = aeidon.encodings.detect_bom(path) or encoding
+            format = aeidon.util.detect_format(path, encoding)
+            return aeidon.files.new(format, path, encoding)
+        if isinstance(data, str):
+            # Already decoded, e.g. while checking encodings.
+            text = data
+        else:
+            encoding = aeidon.encodings.detect_bom(path, data) or encoding
+            text = io.TextIOWrapper(io.BytesIO(data),
+                                    encoding=encoding,
+                                    newline=None)
+
+        format = aeidon.util.detect_format(path, encoding, text)
+        file = aeidon.files.new(format, path, encoding)
+        file.set_data(data)
+        return file
+
+    def _read_batches(self, file, size):
+        """Read `file` and iterate over batches of subtitles."""
+        batch = []
+        try:
+            for subtitle in file.iter_subtitles():
+                batch.append(subtitle)
+                if len(batch) < size: continue
+                yield batch
+                batch = []
+        except (IOError, UnicodeError):
+            raise
+        except Exception:
+            raise aeidon.ParseError(f"Failed to parse file {file.path!r}")
+        if batch:
+            yield batch
+
     def _read_file(self, file):
         """Read `file` and return subtitles."""
         try:
@@ -174,12 +232,108 @@ class OpenAgent(aeidon.Delegate):
             # code. Raise both as parse errors.
             raise aeidon.ParseError(f"Failed to parse file {file.path!r}")
 
+    @aeidon.deco.export
+    def read_main(self, path, encoding=None, data=None, size=1000,
+                  cache=False):
+        """
+        Return file and an iterator of batches of subtitles read from `path`.
+
+        `encoding` can be ``None`` to use the system default encoding.
+        `data` can be the bytes of the file, if already read, or the text
+        of the file decoded using `encoding`.
+        `size` is the amount of subtitles in a batch.
+        `cache` can be ``True`` to use :mod:`aeidon.cache`, in which case a
+        cached file is returned as a single batch and a file read is stored
+        in the cache once all batches have been iterated over.
+
+        Batches are tuples of a list of subtitles and the fraction of the
+        file read so far. Unlike :meth:`open_main`, this doesn't touch the
+        project, which allows reading a large file in a worker thread and
+        handing over batches to be shown while the rest is being read. Once
+        done, use :meth:`set_main_file` with all subtitles read.
+
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        Raise :exc:`aeidon.FormatError` if unable to detect format.
+        Iterating raises :exc:`aeidon.ParseError` if parsing fails.
+        """
+        encoding = encoding or aeidon.util.get_default_encoding()
+        key = aeidon.cache.get_key(path, encoding) if cache else None
+        found = aeidon.cache.load(key)
+        if found is not None:
+            return found[0], iter([(found[1], 1)])
+        if data is None:
+            # Read all of the file to know how much of it has been parsed.
+            data = Path(path).read_bytes()
+        file = self._new_file(path, encoding, data)
+        if isinstance(data, str):
+            stream = raw = io.StringIO(data, newline=None)
+        else:
+            # Fail before any batches instead of halfway through.
+            if not aeidon.encodings.is_decodable(data, file.encoding):
+                raise UnicodeError(f"Failed to decode {str(path)!r}")
+            raw = io.BytesIO(data)
+            stream = io.TextIOWrapper(raw,
+                                      encoding=file.encoding,
+                                      newline=None)
+
+        file.set_data(stream)
+        def iter_batches():
+            subtitles = []
+            for batch in self._read_batches(file, size):
+                if key is not None:
+                    subtitles.extend(batch)
+                # The stream is closed once the whole file is read.
+                fraction = (1 if stream.closed else
+                            min(1, raw.tell() / max(1, len(data))))
+                yield batch, fraction
+            if key is not None:
+                subtitles, sort_count = self._sort_subtitles(subtitles)
+                aeidon.cache.store(key, file, subtitles, sort_count)
+        return file, iter_batches()
+
+    @aeidon.deco.export
+    @aeidon.deco.notify_frozen
+    def set_main_file(self, file, subtitles):
+        """
+        Use `file` and `subtitles` read from it as the main file.
+
+        `subtitles` are sorted as in :meth:`open_main`.
+        Return the amount of subtitles that needed to be moved in order
+        to arrange them in ascending chronological order.
+        """
+        subtitles, sort_count = self._sort_subtitles(subtitles)
+        self._set_main_file(file, subtitles)
+        return sort_count
+
+    def _set_main_file(self, file, subtitles):
+        """Use `file` and sorted `subtitles` as the main file."""
+        self.main_file = file
+        self.subtitles = subtitles
+        self.set_framerate(self.framerate, register=None)
+        self.main_changed = 0
+        # Deactivate possible translation file.
+        self.tran_file = None
+        self.tran_changed = None
+        self.emit("main-file-opened", self.main_file)
+
     def _sort_subtitles(self, subtitles):
         """Return sorted `subtitles` and sort count."""
+        if not subtitles: return subtitles, 0
+        keys = ([x.start_seconds for x in subtitles]
+                if subtitles[0].mode == aeidon.modes.TIME else
+                [x.start_frame for x in subtitles])
+
+        # Count subtitles that start before some preceding subtitle,
+        # i.e. those that need to be moved to arrange subtitles in order.
         sort_count = 0
-        sorted_starts = []
-        for start in (x.start_frame for x in subtitles):
-            bisect.insort(sorted_starts, start)
-            if sorted_starts[-1] != start:
+        latest = keys[0]
+        for key in keys:
+            if key < latest:
                 sort_count += 1
-        return sorted(subtitles), sort_count
+            else:
+                latest = key
+        if sort_count == 0:
+            return subtitles, 0
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        return [subtitles[i] for i in order], sort_count
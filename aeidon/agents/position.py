@@ -18,6 +18,7 @@
 """Manipulating times and frames."""
 
 import aeidon
+import array
 
 from aeidon.i18n import _
 
@@ -42,11 +43,15 @@ class PositionAgent(aeidon.Delegate):
         Using a gap of at least zero is always a good idea if overlapping
         is not desired. Return changed indices.
         """
+        indices = indices or self.get_all_indices()
+        mode, starts, ends = self._get_positions(self.get_all_indices())
+        start_seconds = aeidon.bulk.to_seconds(starts, mode, self.calc)
+        end_seconds = aeidon.bulk.to_seconds(ends, mode, self.calc)
         new_indices = []
-        new_subtitles = []
-        for index in indices or self.get_all_indices():
-            start = self.subtitles[index].start_seconds
-            end = self.subtitles[index].end_seconds
+        new_ends = []
+        for index in indices:
+            start = start_seconds[index]
+            end = end_seconds[index]
             if speed is not None:
                 length = self.get_text_length(index, aeidon.documents.MAIN)
                 optimal_duration = length / speed
@@ -57,19 +62,24 @@ class PositionAgent(aeidon.Delegate):
             domax = maximum and end - start > maximum
             end = start + minimum if domin else end
             end = start + maximum if domax else end
-            end_max = (self.subtitles[index + 1].start_seconds
+            end_max = (start_seconds[index + 1]
                        if index < len(self.subtitles) - 1
                        else 360000)
 
             dogap = gap is not None and end_max - end < gap
             end = max(start, end_max - gap) if dogap else end
-            if end != self.subtitles[index].end_seconds:
+            if end != end_seconds[index]:
                 new_indices.append(index)
-                subtitle = self.subtitles[index].copy()
-                subtitle.end_seconds = end
-                new_subtitles.append(subtitle)
+                new_ends.append(end)
         if not new_indices: return []
-        self.replace_positions(new_indices, new_subtitles, register=register)
+        new_starts = array.array("q", (starts[i] for i in new_indices))
+        new_ends = aeidon.bulk.from_seconds(new_ends, mode, self.calc)
+        self._replace_positions(new_indices,
+                                mode,
+                                new_starts,
+                                new_ends,
+                                register=register)
+
         self.set_action_description(register, _("Adjusting durations"))
         return new_indices
 
@@ -83,15 +93,19 @@ class PositionAgent(aeidon.Delegate):
         `indices` can be ``None`` to process all subtitles. `framerate_in` and
         `framerate_out` should be constants from :attr:`aeidon.framerates`.
         """
-        new_subtitles = []
         indices = indices or self.get_all_indices()
         self.set_framerate(framerate_in, register=None)
-        for index in indices:
-            subtitle = self.subtitles[index].copy()
-            subtitle.convert_framerate(framerate_out)
-            new_subtitles.append(subtitle)
+        coefficient = framerate_out.value / framerate_in.value
+        mode, starts, ends = self._get_positions(indices)
+        starts = aeidon.bulk.convert_framerate(starts, mode, coefficient)
+        ends = aeidon.bulk.convert_framerate(ends, mode, coefficient)
         self.set_framerate(framerate_out)
-        self.replace_positions(indices, new_subtitles, register=register)
+        self._replace_positions(indices,
+                                mode,
+                                starts,
+                                ends,
+                                register=register)
+
         self.group_actions(register, 2, _("Converting framerate"))
 
     def _get_frame_transform(self, p1, p2):
@@ -106,6 +120,29 @@ class PositionAgent(aeidon.Delegate):
         constant = int(round(-coefficient * x1 + y1, 0))
         return coefficient, constant
 
+    def _get_positions(self, indices):
+        """
+        Return mode and start and end positions at `indices`.
+
+        Positions are returned as integer arrays in native units, see
+        :mod:`aeidon.bulk`, converted to the current mode if needed.
+        """
+        if isinstance(self.subtitles, aeidon.SubtitleTable):
+            return (self.subtitles.mode,
+                    self.subtitles.get_column("start", indices),
+                    self.subtitles.get_column("end", indices))
+        mode = self.get_mode()
+        starts = array.array("q")
+        ends = array.array("q")
+        for index in indices:
+            subtitle = self.subtitles[index]
+            if subtitle.mode != mode:
+                subtitle = subtitle.copy()
+                subtitle.mode = mode
+            starts.append(subtitle._start)
+            ends.append(subtitle._end)
+        return mode, starts, ends
+
     def _get_seconds_transform(self, p1, p2):
         """Return a formula for linear correction of positions."""
         # Think of this as a linear transformation where input positions
@@ -131,6 +168,25 @@ class PositionAgent(aeidon.Delegate):
         if aeidon.is_seconds(p1[1]): return self._get_seconds_transform(p1, p2)
         raise ValueError(f"Bad position argument: {p1!r}")
 
+    @aeidon.deco.revertable
+    @aeidon.deco.notify_frozen
+    def _replace_positions(self, indices, mode, starts, ends, register=-1):
+        """
+        Replace positions at `indices` with `starts` and `ends`.
+
+        `starts` and `ends` should be integer arrays of positions in `mode`
+        as returned by :meth:`_get_positions`.
+        """
+        orig_mode, orig_starts, orig_ends = self._get_positions(indices)
+        self._set_positions(indices, mode, starts, ends)
+        action = aeidon.RevertableAction(register=register)
+        action.docs = tuple(aeidon.documents)
+        action.description = _("Replacing positions")
+        action.revert_function = self._replace_positions
+        action.revert_args = (indices, orig_mode, orig_starts, orig_ends)
+        self.register_action(action)
+        self.emit("positions-changed", indices)
+
     @aeidon.deco.export
     @aeidon.deco.revertable
     def set_framerate(self, framerate, register=-1):
@@ -147,6 +203,24 @@ class PositionAgent(aeidon.Delegate):
         action.revert_args = (orig_framerate,)
         self.register_action(action)
 
+    def _set_positions(self, indices, mode, starts, ends):
+        """Set positions at `indices` from integer `starts` and `ends`."""
+        if (isinstance(self.subtitles, aeidon.SubtitleTable) and
+            self.subtitles.mode == mode):
+            self.subtitles.set_column("start", starts, indices)
+            self.subtitles.set_column("end", ends, indices)
+            return
+        for index, start, end in zip(indices, starts, ends):
+            subtitle = self.subtitles[index]
+            if subtitle.mode != mode:
+                # Convert via a temporary subtitle in given mode.
+                temp = aeidon.Subtitle(mode, subtitle.framerate)
+                temp._start, temp._end = start, end
+                subtitle.start, subtitle.end = temp.start, temp.end
+                continue
+            subtitle._start, subtitle._end = start, end
+            subtitle._start_time = subtitle._end_time = None
+
     @aeidon.deco.export
     @aeidon.deco.revertable
     def shift_positions(self, indices, value, register=-1):
@@ -157,13 +231,16 @@ class PositionAgent(aeidon.Delegate):
         `value` can be any valid position type, negative to make subtitles
         appear ealier, positive to make subtitles appear later.
         """
-        new_subtitles = []
         indices = indices or self.get_all_indices()
-        for index in indices:
-            subtitle = self.subtitles[index].copy()
-            subtitle.shift_positions(value)
-            new_subtitles.append(subtitle)
-        self.replace_positions(indices, new_subtitles, register=register)
+        mode, starts, ends = self._get_positions(indices)
+        starts = aeidon.bulk.shift_positions(starts, mode, value, self.calc)
+        ends = aeidon.bulk.shift_positions(ends, mode, value, self.calc)
+        self._replace_positions(indices,
+                                mode,
+                                starts,
+                                ends,
+                                register=register)
+
         self.set_action_description(register, _("Shifting positions"))
 
     @aeidon.deco.export
@@ -175,13 +252,17 @@ class PositionAgent(aeidon.Delegate):
         `indices` can be ``None`` to process all subtitles.
         `p1` and `p2` should be tuples of index, position.
         """
-        new_subtitles = []
         indices = indices or self.get_all_indices()
         coefficient, constant = self._get_transform(p1, p2)
-        for index in indices:
-            subtitle = self.subtitles[index].copy()
-            subtitle.scale_positions(coefficient)
-            subtitle.shift_positions(constant)
-            new_subtitles.append(subtitle)
-        self.replace_positions(indices, new_subtitles, register=register)
+        mode, starts, ends = self._get_positions(indices)
+        starts = aeidon.bulk.scale_positions(starts, mode, coefficient)
+        ends = aeidon.bulk.scale_positions(ends, mode, coefficient)
+        starts = aeidon.bulk.shift_positions(starts, mode, constant, self.calc)
+        ends = aeidon.bulk.shift_positions(ends, mode, constant, self.calc)
+        self._replace_positions(indices,
+                                mode,
+                                starts,
+                                ends,
+                                register=register)
+
         self.set_action_description(register, _("Transforming positions"))
@@ -23,7 +23,7 @@ class SaveAgent(aeidon.Delegate):
 
     """Writing subtitle data to file."""
 
-    def _save(self, doc, file, keep_changes):
+    def _save(self, doc, file, keep_changes, durability):
         """
         Write subtitle data from `doc` to `file`.
 
@@ -43,40 +43,47 @@ class SaveAgent(aeidon.Delegate):
                 if new_text == text: continue
                 subtitle.set_text(doc, new_text)
                 indices.append(i)
-        file.write(self.subtitles, doc)
+        file.write(self.subtitles, doc, durability)
         if keep_changes: return indices
         for i, subtitle in enumerate(self.subtitles):
             subtitle.set_text(doc, orig_texts[i])
         return []
 
     @aeidon.deco.export
-    def save(self, doc, file=None, keep_changes=True):
+    def save(self, doc, file=None, keep_changes=True, durability="fsync"):
         """
         Write subtitle data from `doc` to `file`.
 
-        `file` can be ``None`` to use existing file.
+        `file` can be ``None`` to use existing file. `durability` can be
+        "fsync", "rename-only" or "direct", see
+        :func:`aeidon.util.atomic_open`.
         Raise :exc:`IOError` if writing fails.
         Raise :exc:`UnicodeError` if encoding fails.
         """
         if doc == aeidon.documents.MAIN:
-            return self.save_main(file, keep_changes)
+            return self.save_main(file, keep_changes, durability)
         if doc == aeidon.documents.TRAN:
-            return self.save_translation(file, keep_changes)
+            return self.save_translation(file, keep_changes, durability)
         raise ValueError(f"Invalid document: {doc!r}")
 
     @aeidon.deco.export
-    def save_main(self, file=None, keep_changes=True):
+    def save_main(self, file=None, keep_changes=True, durability="fsync"):
         """
         Write subtitle data from main document to `file`.
 
-        `file` can be ``None`` to use :attr:`main_file`.
+        `file` can be ``None`` to use :attr:`main_file`. `durability` can be
+        "fsync", "rename-only" or "direct", see
+        :func:`aeidon.util.atomic_open`.
         Raise :exc:`IOError` if writing fails.
         Raise :exc:`UnicodeError` if encoding fails.
         """
         file = file or self.main_file
         if file is not None and self.main_file is not None:
             file.copy_from(self.main_file)
-        indices = self._save(aeidon.documents.MAIN, file, keep_changes)
+        indices = self._save(aeidon.documents.MAIN,
+                             file,
+                             keep_changes,
+                             durability)
         if keep_changes:
             if (self.main_file is not None and
                 file.mode != self.main_file.mode):
@@ -90,18 +97,24 @@ class SaveAgent(aeidon.Delegate):
         self.emit("main-file-saved", file)
 
     @aeidon.deco.export
-    def save_translation(self, file=None, keep_changes=True):
+    def save_translation(self, file=None, keep_changes=True,
+                         durability="fsync"):
         """
         Write subtitle data from translation document to `file`.
 
-        `file` can be ``None`` to use :attr:`tran_file`.
+        `file` can be ``None`` to use :attr:`tran_file`. `durability` can be
+        "fsync", "rename-only" or "direct", see
+        :func:`aeidon.util.atomic_open`.
         Raise :exc:`IOError` if writing fails.
         Raise :exc:`UnicodeError` if encoding fails.
         """
         file = file or self.tran_file
         if file is not None and self.tran_file is not None:
             file.copy_from(self.tran_file)
-        indices = self._save(aeidon.documents.TRAN, file, keep_changes)
+        indices = self._save(aeidon.documents.TRAN,
+                             file,
+                             keep_changes,
+                             durability)
         if keep_changes:
             self.tran_file = file
             self.tran_changed = 0
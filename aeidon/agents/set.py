@@ -19,6 +19,7 @@
 
 import aeidon
 import bisect
+import operator
 
 from aeidon.i18n import _
 
@@ -29,8 +30,24 @@ class SetAgent(aeidon.Delegate):
     def _move_if_needed(self, index):
         """Move subtitle for correct order and return new index."""
         subtitle = self.subtitles[index]
-        subtitles = self.subtitles[:index] + self.subtitles[(index + 1):]
-        new_index = bisect.bisect_right(subtitles, subtitle)
+        # Positions are stored as integers, so keys are cheap to read and
+        # other subtitles can be bisected in place on both sides of index.
+        key = (operator.attrgetter("start_seconds")
+               if subtitle.mode == aeidon.modes.TIME else
+               operator.attrgetter("start_frame"))
+        value = key(subtitle)
+        new_index = bisect.bisect_right(self.subtitles,
+                                        value,
+                                        0,
+                                        index,
+                                        key=key)
+        if new_index == index:
+            new_index = bisect.bisect_right(self.subtitles,
+                                            value,
+                                            index + 1,
+                                            len(self.subtitles),
+                                            key=key) - 1
+
         if new_index == index: return new_index
         subtitle = self.subtitles.pop(index)
         self.emit("subtitles-removed", (index,))
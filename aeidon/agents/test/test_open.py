@@ -38,6 +38,31 @@ class TestOpenAgent(aeidon.TestCase):
         assert self.project.subtitles
         assert self.project.main_file.encoding == "utf_8_sig"
 
+    def test_open_main__cache(self, monkeypatch):
+        directory = aeidon.temp.create_directory()
+        monkeypatch.setattr(aeidon, "CONFIG_HOME_DIR", directory)
+        path = self.new_subrip_file()
+        self.project.open_main(path, "ascii", cache=True)
+        subtitles = list(self.project.subtitles)
+        monkeypatch.setattr(self.project.open_main.__self__,
+                            "_read_file",
+                            lambda file: [])
+
+        self.project.open_main(path, "ascii", cache=True)
+        assert self.project.subtitles == subtitles
+        assert self.project.main_file.path == path
+
+    def test_open_main__map(self, monkeypatch):
+        calls = []
+        map = aeidon.SubtitleFile._map
+        def _map(file):
+            calls.append(file)
+            return map(file)
+        monkeypatch.setattr(aeidon.SubtitleFile, "_map", _map)
+        self.project.open_main(self.new_subrip_file(), "ascii")
+        assert len(calls) == 1
+        assert self.project.subtitles
+
     def test_open_main__sort(self):
         path = self.new_microdvd_file()
         with open(path, "w") as f:
@@ -47,6 +72,26 @@ class TestOpenAgent(aeidon.TestCase):
         sort_count = self.project.open_main(path, "ascii")
         assert sort_count == 1
 
+    def test_open_main__sort_stable(self):
+        path = self.new_microdvd_file()
+        with open(path, "w") as f:
+            f.write("{500}{600}a\n")
+            f.write("{100}{200}b\n")
+            f.write("{300}{400}c\n")
+            f.write("{100}{200}d\n")
+            f.write("{700}{800}e\n")
+        sort_count = self.project.open_main(path, "ascii")
+        assert sort_count == 3
+        texts = [x.main_text for x in self.project.subtitles]
+        assert texts == ["b", "d", "c", "a", "e"]
+
+    def test_open_main__text(self):
+        path = self.new_subrip_file()
+        text = path.read_text(encoding="ascii")
+        self.project.open_main(path, "ascii", text)
+        assert self.project.subtitles
+        assert self.project.main_file.encoding == "ascii"
+
     @pytest.mark.parametrize("format", aeidon.formats)
     def test_open_translation__align_number(self, format):
         path = self.new_temp_file(format)
@@ -66,3 +111,58 @@ class TestOpenAgent(aeidon.TestCase):
         self.project.open_translation(path, "ascii")
         assert self.project.subtitles
         assert self.project.tran_file.encoding == "utf_8_sig"
+
+    @pytest.mark.parametrize("format", aeidon.formats)
+    def test_read_main(self, format):
+        path = self.new_temp_file(format)
+        subtitles = list(self.project.subtitles)
+        file, batches = self.project.read_main(path, "ascii", size=2)
+        batches = list(batches)
+        assert file.format == format
+        assert all(len(x) <= 2 for x, y in batches)
+        assert [y for x, y in batches] == sorted(y for x, y in batches)
+        assert batches[-1][1] == 1
+        assert self.project.subtitles == subtitles
+
+    def test_read_main__cache(self, monkeypatch):
+        directory = aeidon.temp.create_directory()
+        monkeypatch.setattr(aeidon, "CONFIG_HOME_DIR", directory)
+        path = self.new_subrip_file()
+        file, batches = self.project.read_main(path, "ascii", cache=True)
+        subtitles = [x for batch, fraction in batches for x in batch]
+        monkeypatch.setattr(self.project.open_main.__self__,
+                            "_new_file",
+                            None)
+
+        file, batches = self.project.read_main(path, "ascii", cache=True)
+        assert list(batches) == [(subtitles, 1)]
+        assert file.path == path
+
+    def test_read_main__parse_error(self):
+        path = self.new_subrip_file()
+        file, batches = self.project.read_main(path, "ascii")
+        def iter_subtitles():
+            raise ValueError
+        file.iter_subtitles = iter_subtitles
+        with pytest.raises(aeidon.ParseError):
+            list(batches)
+
+    def test_read_main__unicode_error(self):
+        path = self.new_subrip_file()
+        path.write_bytes(path.read_bytes() + b"\xff\n")
+        with pytest.raises(UnicodeError):
+            self.project.read_main(path, "ascii")
+
+    def test_set_main_file(self):
+        path = self.new_microdvd_file()
+        with open(path, "w") as f:
+            f.write("{100}{200}\n")
+            f.write("{500}{600}\n")
+            f.write("{300}{400}\n")
+        file, batches = self.project.read_main(path, "ascii")
+        subtitles = [x for batch, fraction in batches for x in batch]
+        sort_count = self.project.set_main_file(file, subtitles)
+        assert sort_count == 1
+        assert self.project.main_file is file
+        assert len(self.project.subtitles) == 3
+        assert self.project.main_changed == 0
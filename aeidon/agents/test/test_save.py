@@ -43,3 +43,11 @@ class TestSaveAgent(aeidon.TestCase):
         assert self.project.tran_changed == 1
         self.project.save_translation(file, keep_changes=True)
         assert self.project.tran_changed == 0
+
+    @pytest.mark.parametrize("durability", ["fsync", "rename-only", "direct"])
+    def test_save__durability(self, durability):
+        self.project.clear_texts((0,), aeidon.documents.MAIN)
+        self.project.save(aeidon.documents.MAIN, durability=durability)
+        assert self.project.main_changed == 0
+        subtitles = self.project.main_file.read()
+        assert subtitles[0].main_text == ""
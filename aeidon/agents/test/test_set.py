@@ -56,6 +56,15 @@ class TestSetAgent(aeidon.TestCase):
         assert subtitles[0].main_text == text_3
         assert subtitles[1].main_text == text_0
 
+    @aeidon.deco.reversion_test
+    def test_set_start__reorder_forward(self):
+        subtitles = self.project.subtitles
+        text_0 = subtitles[0].main_text
+        self.project.set_start(0, subtitles[3].start)
+        assert subtitles[3].main_text == text_0
+        starts = [x.start_frame for x in subtitles]
+        assert starts == sorted(starts)
+
     @aeidon.deco.reversion_test
     def test_set_text__main(self):
         subtitles = self.project.subtitles
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import aeidon
+import codecs
+
+MAIN = aeidon.documents.MAIN
+
+class TestUtilityAgent(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.project = self.new_project()
+
+    def test_new_temp_file__event_fields(self):
+        text = self.get_sample_text(aeidon.formats.ASS)
+        old = "Layer, Start, End, Style, Name,"
+        new = "Layer, Start, End, Name, Style,"
+        path = aeidon.temp.create(".ass")
+        path.write_text(text.replace(old, new), encoding="ascii")
+        self.project.open_main(path, "ascii")
+        path = self.project.new_temp_file(MAIN)
+        assert f"Format: {new}" in path.read_text(encoding="ascii")
+
+    def test_new_temp_file__utf_16_bom(self):
+        path = self.new_subrip_file()
+        text = path.read_text(encoding="ascii")
+        path.write_bytes(codecs.BOM_UTF16_LE + text.encode("utf_16_le"))
+        self.project.open_main(path, "utf_16_le")
+        assert self.project.main_file.has_utf_16_bom
+        path = self.project.new_temp_file(MAIN)
+        assert path.read_bytes().startswith(codecs.BOM_UTF16_LE)
@@ -23,6 +23,11 @@ class UtilityAgent(aeidon.Delegate):
 
     """Miscellaneous helper methods."""
 
+    def __init__(self, master):
+        """Initialize a :class:`UtilityAgent` instance."""
+        aeidon.Delegate.__init__(self, master)
+        self._interval_index = None
+
     @aeidon.deco.export
     def get_all_indices(self):
         """Return a list of all indices of subtitles."""
@@ -64,6 +69,17 @@ class UtilityAgent(aeidon.Delegate):
             return self.get_format(aeidon.documents.MAIN)
         raise ValueError(f"Invalid document: {doc!r}")
 
+    @aeidon.deco.export
+    def get_interval_index(self):
+        """
+        Return :class:`aeidon.IntervalIndex` of subtitles.
+
+        The index is created on first call and kept up to date after that.
+        """
+        if self._interval_index is None:
+            self._interval_index = aeidon.IntervalIndex(self.master)
+        return self._interval_index
+
     @aeidon.deco.export
     def get_liner(self, doc):
         """Return a new :class:`aeidon.Liner` instance."""
@@ -127,7 +143,7 @@ class UtilityAgent(aeidon.Delegate):
     @aeidon.deco.export
     def new_subtitle(self):
         """Return a new :class:`aeidon.Subtitle` instance."""
-        return aeidon.Subtitle(self.get_mode(), self.framerate)
+        return aeidon.Subtitle(self.get_mode(), self.framerate, self.calc)
 
     @aeidon.deco.export
     def new_temp_file(self, doc, encoding=None):
@@ -143,16 +159,24 @@ class UtilityAgent(aeidon.Delegate):
             # fall back to main document's properties.
             file = self.get_file(aeidon.documents.MAIN)
         if file is not None:
-            path = aeidon.temp.create(file.format.extension)
+            format = file.format
             encoding = encoding or file.encoding
-            temp_file = aeidon.files.new(file.format, path, encoding)
-            temp_file.copy_from(file)
+            newline = file.newline
         else:
             # If no saved document to pull properties from,
             # fall back to SubRip format and UTF-8 encoding.
             format = aeidon.formats.SUBRIP
-            path = aeidon.temp.create(format.extension)
             encoding = encoding or "utf_8"
-            temp_file = aeidon.files.new(format, path, encoding)
-        self.save(doc, temp_file, keep_changes=False)
-        return temp_file.path
+            newline = None
+        # Serialize directly instead of saving, which would
+        # emit signals as if the project had been saved.
+        data = aeidon.files.serialize(self.subtitles,
+                                      format,
+                                      encoding,
+                                      newline,
+                                      doc=doc,
+                                      template=file)
+
+        path = aeidon.temp.create(format.extension)
+        path.write_bytes(data)
+        return path
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Arithmetic on arrays of subtitle positions.
+
+Positions are integers in native units, milliseconds in time mode and frames
+in frame mode, as stored by :class:`aeidon.Subtitle` and
+:class:`aeidon.SubtitleTable`. Functions return new integer arrays, or float
+arrays for seconds, and round exactly like the corresponding methods of
+:class:`aeidon.Subtitle`. :mod:`numpy` is used if available, otherwise
+positions are processed one by one with the standard :mod:`array` module.
+"""
+
+import aeidon
+import array
+
+# Maximum absolute value of milliseconds, 99:59:59.999.
+_MAX_MILLISECONDS = 359999999
+
+def _from_numpy(np, values):
+    """Return :mod:`numpy` array `values` as an integer array."""
+    return array.array("q", values.astype(np.int64).tobytes())
+
+def _numpy():
+    """Return :mod:`numpy` module or ``None`` if not available."""
+    if not aeidon.util.numpy_available(): return None
+    import numpy
+    return numpy
+
+def _round_frames(np, frames):
+    """Return float `frames` rounded like :func:`round`."""
+    # Both round halves to even and neither rounds twice.
+    return _from_numpy(np, np.rint(frames))
+
+def _round_milliseconds(np, seconds):
+    """Return `seconds` as milliseconds, see ``seconds_to_milliseconds``."""
+    milliseconds = seconds * 1000
+    rounded = np.rint(milliseconds)
+    # The calculator rounds the exact decimal value of seconds, which can
+    # differ from rounding the float product only very close to halves.
+    near = np.abs(milliseconds - np.floor(milliseconds) - 0.5) < 1e-6
+    for i in np.flatnonzero(near).tolist():
+        rounded[i] = _seconds_to_milliseconds(float(seconds[i]))
+    rounded = np.clip(rounded, -_MAX_MILLISECONDS, _MAX_MILLISECONDS)
+    return _from_numpy(np, rounded)
+
+def _seconds_to_milliseconds(seconds):
+    """Convert `seconds` to milliseconds."""
+    return aeidon.Calculator().seconds_to_milliseconds(seconds)
+
+def _to_numpy(np, positions):
+    """Return integer `positions` as a :mod:`numpy` float array."""
+    if not isinstance(positions, array.array) or positions.typecode != "q":
+        positions = array.array("q", positions)
+    return np.frombuffer(positions, dtype=np.int64).astype(np.float64)
+
+def convert_framerate(positions, mode, coefficient):
+    """
+    Return `positions` converted to a different framerate.
+
+    `coefficient` is the output framerate divided by the input framerate,
+    see :meth:`aeidon.Subtitle.convert_framerate`.
+    """
+    np = _numpy()
+    if mode == aeidon.modes.TIME:
+        if np is None:
+            return array.array("q", (_seconds_to_milliseconds(
+                x / 1000 / coefficient) for x in positions))
+        values = _to_numpy(np, positions) / 1000 / coefficient
+        return _round_milliseconds(np, values)
+    if mode == aeidon.modes.FRAME:
+        if np is None:
+            return array.array("q", (round(coefficient * x)
+                                     for x in positions))
+        return _round_frames(np, coefficient * _to_numpy(np, positions))
+    raise ValueError(f"Invalid mode: {mode!r}")
+
+def from_seconds(seconds, mode, calc):
+    """Return `seconds` converted to positions in `mode`."""
+    np = _numpy()
+    if mode == aeidon.modes.TIME:
+        if np is None:
+            return array.array("q", map(_seconds_to_milliseconds, seconds))
+        values = np.asarray(seconds, dtype=np.float64)
+        return _round_milliseconds(np, values)
+    if mode == aeidon.modes.FRAME:
+        if np is None:
+            return array.array("q", map(calc.seconds_to_frame, seconds))
+        values = np.asarray(seconds, dtype=np.float64)
+        return _round_frames(np, values * calc.fps)
+    raise ValueError(f"Invalid mode: {mode!r}")
+
+def scale_positions(positions, mode, coefficient):
+    """
+    Return `positions` multiplied by `coefficient`.
+
+    See :meth:`aeidon.Subtitle.scale_positions`.
+    """
+    np = _numpy()
+    if mode == aeidon.modes.TIME:
+        if np is None:
+            return array.array("q", (_seconds_to_milliseconds(
+                x / 1000 * coefficient) for x in positions))
+        values = _to_numpy(np, positions) / 1000 * coefficient
+        return _round_milliseconds(np, values)
+    if mode == aeidon.modes.FRAME:
+        if np is None:
+            return array.array("q", (round(x * coefficient)
+                                     for x in positions))
+        return _round_frames(np, _to_numpy(np, positions) * coefficient)
+    raise ValueError(f"Invalid mode: {mode!r}")
+
+def shift_positions(positions, mode, value, calc):
+    """
+    Return `positions` with position `value` added.
+
+    See :meth:`aeidon.Subtitle.shift_positions`.
+    """
+    if mode == aeidon.modes.TIME and not aeidon.is_time(value):
+        # Round the sum, not the parts, to match Subtitle.shift_positions.
+        seconds = calc.to_seconds(value)
+        np = _numpy()
+        if np is None:
+            return array.array("q", (_seconds_to_milliseconds(
+                x / 1000 + seconds) for x in positions))
+        values = _to_numpy(np, positions) / 1000 + seconds
+        return _round_milliseconds(np, values)
+    if mode == aeidon.modes.TIME:
+        value = calc.time_to_milliseconds(value)
+    elif mode == aeidon.modes.FRAME:
+        value = calc.to_frame(value)
+    else:
+        raise ValueError(f"Invalid mode: {mode!r}")
+    return array.array("q", (x + value for x in positions))
+
+def to_seconds(positions, mode, calc):
+    """Return `positions` in `mode` converted to seconds."""
+    np = _numpy()
+    if mode == aeidon.modes.TIME:
+        return array.array("d", (x / 1000 for x in positions))
+    if mode == aeidon.modes.FRAME:
+        # Frames are first rounded to milliseconds like in Subtitle.
+        if np is None:
+            return array.array("d", (calc.frame_to_milliseconds(x) / 1000
+                                     for x in positions))
+        values = _to_numpy(np, positions) / calc.fps
+        return array.array("d", (x / 1000 for x in
+                                 _round_milliseconds(np, values)))
+    raise ValueError(f"Invalid mode: {mode!r}")
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Binary cache of parsed subtitle files.
+
+Parsed subtitles are stored under :attr:`aeidon.CONFIG_HOME_DIR` using
+:mod:`marshal`, which unlike :mod:`pickle` handles only built-in types and
+can thus not run code when loading a tampered cache file. Entries are keyed
+by path, size, modification time and encoding of the file, which are
+compared before loading the rest of the entry.
+"""
+
+import aeidon
+import array
+import contextlib
+import hashlib
+import marshal
+import os
+import struct
+
+from pathlib import Path
+
+# Maximum amount of files in the cache.
+_CACHE_SIZE = 20
+
+# Bump if the format of cache files changes.
+_MAGIC = b"AEIDON\x00\x01"
+
+def _get_containers(subtitle):
+    """Return values of containers of `subtitle`."""
+    containers = {}
+    for name in aeidon.containers.NAMES:
+        if subtitle.has_container(name):
+            values = vars(getattr(subtitle, name))
+            if values:
+                containers[name] = dict(values)
+    return containers
+
+def get_key(path, encoding):
+    """
+    Return key of entry for file at `path` read with `encoding`.
+
+    Return ``None`` if unable to read properties of the file. Call this
+    before reading the file, so that changes during reading would
+    invalidate the entry.
+    """
+    path = Path(path).resolve()
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (aeidon.__version__,
+            str(path),
+            stat.st_size,
+            stat.st_mtime_ns,
+            encoding)
+
+def _get_path(key):
+    """Return path to cache file of `key`."""
+    name = hashlib.sha1(key[1].encode("utf_8")).hexdigest()
+    return aeidon.CONFIG_HOME_DIR / "cache" / f"{name}.bin"
+
+def load(key):
+    """
+    Return file, subtitles and sort count of `key` from cache.
+
+    Return ``None`` if not found or not valid.
+    """
+    if key is None: return None
+    path = _get_path(key)
+    try:
+        with open(path, "rb") as f:
+            if f.read(len(_MAGIC)) != _MAGIC: return None
+            size = struct.unpack("<I", f.read(4))[0]
+            if marshal.loads(f.read(size)) != key: return None
+            data = marshal.loads(f.read())
+        # Mark as recently used.
+        os.utime(path)
+        return unpack(key[1], data)
+    except Exception:
+        # Treat any kind of broken file as a cache miss.
+        return None
+
+def _new_containers(values):
+    """Return containers with attribute values from `values`."""
+    containers = {}
+    for name in values:
+        containers[name] = aeidon.containers.new(name)
+        for attr, value in values[name].items():
+            setattr(containers[name], attr, value)
+    return containers
+
+def pack(file, subtitles, sort_count):
+    """
+    Return data of `file`, `subtitles` and `sort_count` as built-in types.
+
+    Built-in types are fast to serialize, which makes this useful also for
+    passing parsed files between processes, see :func:`unpack`.
+    """
+    state = {k: v for k, v in vars(file).items()
+             if k not in ("_calc", "_data", "newline", "path")}
+    starts = array.array("q", (x._start for x in subtitles))
+    ends = array.array("q", (x._end for x in subtitles))
+    # Store each distinct set of container values only once,
+    # subtitles commonly have equal values, e.g. the same style.
+    table, indices = [], {}
+    rows = array.array("q")
+    for subtitle in subtitles:
+        containers = _get_containers(subtitle)
+        key = tuple((k, *v.items()) for k, v in containers.items())
+        if key not in indices:
+            indices[key] = len(table)
+            table.append(containers)
+        rows.append(indices[key])
+    return (file.format.name,
+            file.newline.name,
+            state,
+            sort_count,
+            starts.tobytes(),
+            ends.tobytes(),
+            [x.main_text for x in subtitles],
+            table,
+            rows.tobytes())
+
+def store(key, file, subtitles, sort_count):
+    """Store `file`, `subtitles` and `sort_count` as `key` in cache."""
+    if key is None: return
+    path = _get_path(key)
+    with contextlib.suppress(Exception):
+        data = marshal.dumps(pack(file, subtitles, sort_count))
+        key = marshal.dumps(key)
+        aeidon.util.makedirs(path.parent)
+        with aeidon.util.atomic_open(path,
+                                     "wb",
+                                     durability="rename-only") as f:
+            f.write(_MAGIC)
+            f.write(struct.pack("<I", len(key)))
+            f.write(key)
+            f.write(data)
+        _trim(path.parent)
+
+def _trim(directory):
+    """Remove least recently used files beyond cache size."""
+    paths = list(directory.glob("*.bin"))
+    if len(paths) <= _CACHE_SIZE: return
+    paths.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+    for path in paths[_CACHE_SIZE:]:
+        with contextlib.suppress(OSError):
+            path.unlink()
+
+def unpack(path, data):
+    """Return file at `path`, subtitles and sort count from `data`."""
+    (format, newline, state, sort_count,
+     starts, ends, texts, table, rows) = data
+    format = aeidon.formats.find_item("name", format)
+    newline = aeidon.newlines.find_item("name", newline)
+    file = aeidon.files.new(format, path, state["encoding"], newline)
+    for name, value in state.items():
+        setattr(file, name, value)
+    starts = array.array("q", starts)
+    ends = array.array("q", ends)
+    rows = array.array("q", rows)
+    # Containers are copied on write, so subtitles with
+    # equal values can share them from a single container.
+    table = [_new_containers(x) for x in table]
+    subtitles = []
+    for start, end, text, row in zip(starts, ends, texts, rows):
+        subtitle = file._get_subtitle()
+        subtitle._start = start
+        subtitle._end = end
+        subtitle._main_text = text
+        for name, container in table[row].items():
+            setattr(subtitle, name, container.copy())
+        subtitles.append(subtitle)
+    return file, subtitles, sort_count
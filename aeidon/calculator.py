@@ -18,6 +18,7 @@
 """Time and frame calculator."""
 
 import aeidon
+import re
 
 class Calculator:
 
@@ -25,11 +26,19 @@ class Calculator:
     Time and frame calculator.
 
     Times are handled as strings, frames as integers and seconds as floats.
-    Only one instance of :class:`Calculator` exists for a given framerate.
+    Milliseconds as integers are available for internal storage of times,
+    see :class:`aeidon.Subtitle`. Only one instance of :class:`Calculator`
+    exists for a given framerate.
+
+    Batch methods :meth:`milliseconds_to_times` and :meth:`round_times`
+    convert sequences of times, as used when writing files.
     """
 
     _instances = {}
 
+    # Time already in valid format, except possibly for a decimal comma.
+    _re_time = re.compile(r"^-?\d\d:\d\d:\d\d[.,]\d\d\d\Z")
+
     def __new__(cls, framerate=None):
         """
         Return possibly existing instance for `framerate`.
@@ -73,6 +82,16 @@ class Calculator:
             return x + self.to_seconds(y)
         raise ValueError(f"Invalid type for x: {type(x)!r}")
 
+    @property
+    def fps(self):
+        """Return framerate as frames per second."""
+        return self._framerate
+
+    def frame_to_milliseconds(self, frame):
+        """Convert `frame` to milliseconds."""
+        seconds = self.frame_to_seconds(frame)
+        return self.seconds_to_milliseconds(seconds)
+
     def frame_to_seconds(self, frame):
         """Convert `frame` to seconds."""
         return aeidon.as_seconds(frame / self._framerate)
@@ -134,6 +153,67 @@ class Calculator:
                 0 <= seconds  <=  59 and
                 0 <= mseconds <= 999)
 
+    def milliseconds_to_frame(self, milliseconds):
+        """Convert `milliseconds` to frame."""
+        return self.seconds_to_frame(milliseconds / 1000)
+
+    def milliseconds_to_time(self, milliseconds):
+        """
+        Convert `milliseconds` to time.
+
+        >>> calc = aeidon.Calculator()
+        >>> calc.milliseconds_to_time(3723004)
+        '01:02:03.004'
+        """
+        sign = "-" if milliseconds < 0 else ""
+        milliseconds = min(abs(milliseconds), 359999999)
+        seconds, mseconds = divmod(milliseconds, 1000)
+        minutes, seconds = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        return f"{sign}{hours:02d}:{minutes:02d}:{seconds:02d}.{mseconds:03d}"
+
+    def milliseconds_to_times(self, milliseconds, ndigits=3):
+        """
+        Convert `milliseconds` to times rounded to `ndigits` decimals.
+
+        Equal to :meth:`round_times` of :meth:`milliseconds_to_time`,
+        but faster, since times are not parsed back to round them.
+
+        >>> calc = aeidon.Calculator()
+        >>> calc.milliseconds_to_times([3723004, 1236], 2)
+        ['01:02:03.000', '00:00:01.240']
+        """
+        milliseconds = list(milliseconds)
+        if (ndigits >= 3 and milliseconds and
+            0 <= min(milliseconds) and max(milliseconds) <= 359999999):
+            return ["%02d:%02d:%02d.%03d" % (x // 3600000,
+                                             x // 60000 % 60,
+                                             x // 1000 % 60,
+                                             x % 1000) for x in milliseconds]
+
+        times = []
+        for value in milliseconds:
+            if not 0 <= value <= 359999999:
+                time = self.milliseconds_to_time(value)
+                if ndigits < 3:
+                    time = self.round_times([time], ndigits)[0]
+                times.append(time)
+                continue
+            hours, value = divmod(value, 3600000)
+            minutes, value = divmod(value, 60000)
+            seconds, mseconds = divmod(value, 1000)
+            if ndigits < 3:
+                # Sum parts like time_to_seconds for identical rounding.
+                times.append(self._seconds_to_time(round(sum((
+                    hours * 3600.0,
+                    minutes * 60.0,
+                    float(seconds),
+                    mseconds / 1000)), ndigits)))
+                continue
+            times.append("%02d:%02d:%02d.%03d" %
+                         (hours, minutes, seconds, mseconds))
+        return times
+
     def normalize_time(self, time):
         """
         Convert `time` to valid format.
@@ -142,6 +222,8 @@ class Calculator:
         >>> calc.normalize_time("1:2:3,4")
         '01:02:03.400'
         """
+        if self._re_time.match(time):
+            return time.replace(",", ".")
         time = time.strip()
         sign = "-" if time.startswith("-") else ""
         time = time.replace("-", "")
@@ -175,10 +257,27 @@ class Calculator:
             return aeidon.as_seconds(pos)
         raise ValueError(f"Invalid type for pos: {type(pos)!r}")
 
+    def round_times(self, times, ndigits):
+        """
+        Round `times` to given precision in decimal digits.
+
+        >>> calc = aeidon.Calculator()
+        >>> calc.round_times(["00:00:01.234", "00:00:01.236"], 2)
+        ['00:00:01.230', '00:00:01.240']
+        """
+        return [self._seconds_to_time(round(self.time_to_seconds(x), ndigits))
+                for x in times]
+
     def seconds_to_frame(self, seconds):
         """Convert `seconds` to frame."""
         return int(round(seconds * self._framerate, 0))
 
+    def seconds_to_milliseconds(self, seconds):
+        """Convert `seconds` to milliseconds."""
+        # Round first to three decimals to match seconds_to_time.
+        milliseconds = int(round(round(seconds, 3) * 1000))
+        return max(-359999999, min(359999999, milliseconds))
+
     def seconds_to_time(self, seconds):
         """Convert `seconds` to time."""
         sign = "-" if seconds < 0 else ""
@@ -191,11 +290,33 @@ class Calculator:
         seconds = int(seconds % 60)
         return f"{sign}{hours:02.0f}:{minutes:02.0f}:{seconds:02.0f}.{mseconds:03.0f}"
 
+    def _seconds_to_time(self, seconds):
+        """Convert `seconds` to time."""
+        if seconds < 0:
+            return self.seconds_to_time(seconds)
+        # Equal to seconds_to_time, but with integer arithmetic.
+        mseconds = round(round(seconds, 3) * 1000)
+        if mseconds > 359999999:
+            return "99:59:59.999"
+        seconds, mseconds = divmod(mseconds, 1000)
+        minutes, seconds = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        return "%02d:%02d:%02d.%03d" % (hours, minutes, seconds, mseconds)
+
     def time_to_frame(self, time):
         """Convert `time` to frame."""
         seconds = self.time_to_seconds(time)
         return self.seconds_to_frame(seconds)
 
+    def time_to_milliseconds(self, time):
+        """Convert `time` to milliseconds."""
+        coefficient = -1 if time.startswith("-") else 1
+        time = time[1:] if time.startswith("-") else time
+        return coefficient * (int(time[ :2]) * 3600000 +
+                              int(time[3:5]) *   60000 +
+                              int(time[6:8]) *    1000 +
+                              int(time[9: ]))
+
     def time_to_seconds(self, time):
         """Convert `time` to seconds."""
         coefficient = -1 if time.startswith("-") else 1
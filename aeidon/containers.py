@@ -15,9 +15,65 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
-"""Containers for additional format-specific subtitle attributes."""
+"""
+Containers for additional format-specific subtitle attributes.
 
-class SubRip:
+:var NAMES: Names of all containers, as used in :attr:`aeidon.formats`
+"""
+
+NAMES = ("ssa", "subrip", "webvtt")
+
+class Container:
+
+    """
+    Base class for containers, copied on write.
+
+    Defaults are defined as class attributes and only changed values are
+    stored in the instance. A copy returned by :meth:`copy` shares stored
+    values with the original until either of the two is written to, which
+    makes copying independent of the amount of attributes. Values should be
+    immutable, as they are shared, not copied.
+    """
+
+    __slots__ = ("__dict__", "_shared")
+
+    def __init__(self):
+        """Initialize a :class:`Container` instance."""
+        object.__setattr__(self, "_shared", False)
+
+    def __copy__(self):
+        """Return a copy of container."""
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        """Return a copy of container."""
+        return self.copy()
+
+    def __delattr__(self, name):
+        """Reset attribute `name` to its default value."""
+        self._unshare()
+        object.__delattr__(self, name)
+
+    def __setattr__(self, name, value):
+        """Set attribute `name` to `value`."""
+        self._unshare()
+        object.__setattr__(self, name, value)
+
+    def copy(self):
+        """Return a copy of container sharing values until written to."""
+        container = object.__new__(type(self))
+        object.__setattr__(container, "__dict__", self.__dict__)
+        object.__setattr__(container, "_shared", True)
+        object.__setattr__(self, "_shared", True)
+        return container
+
+    def _unshare(self):
+        """Stop sharing values with copies before writing to them."""
+        if not self._shared: return
+        object.__setattr__(self, "__dict__", dict(self.__dict__))
+        object.__setattr__(self, "_shared", False)
+
+class SubRip(Container):
 
     """
     Subtitle box pixel coordinates for extended SubRip format.
@@ -33,7 +89,7 @@ class SubRip:
     x2 = 0
     y2 = 0
 
-class SubStationAlpha:
+class SubStationAlpha(Container):
 
     """
     Attributes for all versions of Sub Station Alpha formats.
@@ -57,7 +113,7 @@ class SubStationAlpha:
     margin_v = 0
     effect = ""
 
-class WebVTT:
+class WebVTT(Container):
 
     """
     Attributes for the WebVTT format.
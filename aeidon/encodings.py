@@ -23,10 +23,13 @@ For functions dealing with character encodings, see also :mod:`aeidon.util`.
 
 import aeidon
 import codecs
+import contextlib
+import json
 import locale
 import re
 
 from aeidon.i18n import _
+from pathlib import Path
 
 # Tuples of code, name and description for each supported character encoding.
 # Codes are the official names used by Python. Names are mostly taken from
@@ -139,6 +142,15 @@ CODE, NAME, DESC = range(3)
 # Illegal characters in encoding codes.
 _re_illegal = re.compile(r"[^a-z0-9_]")
 
+# Amount of results to keep in the cache of detected encodings.
+_CACHE_SIZE = 1000
+
+# Size of chunks of bytes to decode at once, see is_decodable.
+_DECODE_SIZE = 1048576
+
+# Size of chunks of bytes to detect encodings from, see detect.
+_SAMPLE_SIZE = 32768
+
 def code_to_description(code):
     """Convert encoding `code` to localized description."""
     for item in _encodings:
@@ -163,43 +175,127 @@ def code_to_name(code):
             return item[NAME]
     raise ValueError(f"Code {code!r} not found")
 
-def detect(path):
+def _decodes_fully(path, data, encoding):
+    """
+    Return ``True`` if `data` or file at `path` decodes as `encoding`.
+
+    If `data` is ``None``, the file is read in blocks, never holding all of
+    it in memory at once. ``None`` `encoding` is considered to decode.
+    """
+    if encoding is None: return True
+    if data is not None:
+        return is_decodable(data, encoding)
+    try:
+        decoder = codecs.getincrementaldecoder(encoding)()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(_DECODE_SIZE), b""):
+                decoder.decode(block)
+        decoder.decode(b"", True)
+        return True
+    except (LookupError, UnicodeError):
+        return False
+
+def detect(path, data=None, sample=False):
     """
     Detect the encoding of file at `path` and return code or ``None``.
 
+    `data` can be the bytes of the file, if already read. If `sample` is
+    ``True``, detect encoding from chunks at the beginning, middle and end
+    of the file instead of all of it and cache the result on disk, keyed by
+    path, size and modification time of the file. Sampling is much faster
+    for large files, but can miss characters outside the chunks, so the
+    encoding detected from sample is checked to decode all of `data` or the
+    file, read in blocks, or else detected again from all of it.
     Raise :exc:`IOError` if reading fails.
     """
-    bom_encoding = detect_bom(path)
+    if sample and path is not None:
+        return _detect_cached(path, data)
+    if data is None:
+        data = Path(path).read_bytes()
+    bom_encoding = detect_bom(path, data)
     if bom_encoding is not None:
         return bom_encoding
-    from charset_normalizer import from_path
-    detector = from_path(path)
+    from charset_normalizer import from_bytes
+    detector = from_bytes(data)
     result = detector.best()
     if result is None:
         return None
     return result.encoding
 
-def detect_bom(path):
-    """Return corresponding encoding if BOM found, else ``None``."""
-    with open(path, "rb") as f:
-        line = f.readline()
-    if (line.startswith(codecs.BOM_UTF32_BE) and
+def detect_bom(path, data=None):
+    """
+    Return corresponding encoding if BOM found, else ``None``.
+
+    `data` can be the bytes of the file, if already read.
+    """
+    if data is None:
+        with open(path, "rb") as f:
+            data = f.read(4)
+    if (data.startswith(codecs.BOM_UTF32_BE) and
         is_valid_code("utf_32_be")):
         return "utf_32_be"
-    if (line.startswith(codecs.BOM_UTF32_LE) and
+    if (data.startswith(codecs.BOM_UTF32_LE) and
         is_valid_code("utf_32_le")):
         return "utf_32_le"
-    if (line.startswith(codecs.BOM_UTF8) and
+    if (data.startswith(codecs.BOM_UTF8) and
         is_valid_code("utf_8_sig")):
         return "utf_8_sig"
-    if (line.startswith(codecs.BOM_UTF16_BE) and
+    if (data.startswith(codecs.BOM_UTF16_BE) and
         is_valid_code("utf_16_be")):
         return "utf_16_be"
-    if (line.startswith(codecs.BOM_UTF16_LE) and
+    if (data.startswith(codecs.BOM_UTF16_LE) and
         is_valid_code("utf_16_le")):
         return "utf_16_le"
     return None
 
+def _detect_cached(path, data=None):
+    """Detect the encoding of file at `path` from sample using cache."""
+    path = Path(path).resolve()
+    stat = path.stat()
+    key = [stat.st_size, stat.st_mtime_ns]
+    cache = _read_cache()
+    value = cache.get(str(path))
+    if isinstance(value, list) and value[:2] == key:
+        return value[2]
+    encoding = _detect_sample(path, data)
+    if not _decodes_fully(path, data, encoding):
+        # Characters outside the sample fail to decode,
+        # detect from all data and never cache a failing result.
+        encoding = detect(path, data)
+        if not _decodes_fully(path, data, encoding):
+            return encoding
+    # Keep most recently detected last, dropping the oldest.
+    cache.pop(str(path), None)
+    cache[str(path)] = key + [encoding]
+    while len(cache) > _CACHE_SIZE:
+        cache.pop(next(iter(cache)))
+    _write_cache(cache)
+    return encoding
+
+def _detect_sample(path, data=None):
+    """Detect the encoding of file at `path` from sample."""
+    chunks = _read_sample(path, data)
+    bom_encoding = detect_bom(path, chunks[0])
+    if bom_encoding is not None:
+        return bom_encoding
+    if len(chunks) == 1 or b"\x00" in chunks[0]:
+        # Small file or probably UTF-16 or UTF-32, which can't be
+        # chunked at line breaks, detect from the whole file.
+        return detect(path, chunks[0] if len(chunks) == 1 else data)
+    from charset_normalizer import from_bytes
+    result = from_bytes(chunks[0]).best()
+    if result is not None and result.encoding in ("ascii", "utf_8"):
+        # Decoding as ASCII or UTF-8 fails for almost anything else,
+        # so if the rest of the sample decodes too, stop early.
+        with contextlib.suppress(UnicodeError):
+            for chunk in chunks[1:]:
+                chunk.decode(result.encoding)
+            return result.encoding
+    result = from_bytes(b"".join(chunks)).best()
+    if result is None:
+        return None
+    return result.encoding
+
 @aeidon.deco.once
 def get_locale_code():
     """Return code of the locale encoding or ``None``."""
@@ -223,6 +319,22 @@ def get_valid():
         if is_valid_code(item[CODE]):
             yield item
 
+def is_decodable(data, encoding):
+    """
+    Return ``True`` if bytes `data` can be strictly decoded as `encoding`.
+
+    `data` is decoded in chunks, never holding all of it decoded at once.
+    """
+    try:
+        decoder = codecs.getincrementaldecoder(encoding)()
+        with memoryview(data) as view:
+            for i in range(0, len(view), _DECODE_SIZE):
+                decoder.decode(view[i:i+_DECODE_SIZE])
+        decoder.decode(b"", True)
+        return True
+    except (LookupError, UnicodeError):
+        return False
+
 def is_valid_code(code):
     """Return ``True`` if encoding `code` is valid."""
     try:
@@ -238,6 +350,37 @@ def name_to_code(name):
             return item[CODE]
     raise ValueError(f"Name {name!r} not found")
 
+def _read_cache():
+    """Return cache of detected encodings by path."""
+    path = aeidon.CONFIG_HOME_DIR / "encodings.json"
+    with contextlib.suppress(OSError, ValueError):
+        with open(path, "r", encoding="utf_8") as f:
+            cache = json.load(f)
+        if isinstance(cache, dict):
+            return cache
+    return {}
+
+def _read_sample(path, data=None):
+    """Return chunks of bytes from beginning, middle and end of file."""
+    size = len(data) if data is not None else Path(path).stat().st_size
+    if size <= 3 * _SAMPLE_SIZE:
+        return [data if data is not None else Path(path).read_bytes()]
+    offsets = (0, (size - _SAMPLE_SIZE) // 2, size - _SAMPLE_SIZE)
+    if data is not None:
+        chunks = [data[x:x+_SAMPLE_SIZE] for x in offsets]
+    else:
+        chunks = []
+        with open(path, "rb") as f:
+            for offset in offsets:
+                f.seek(offset)
+                chunks.append(f.read(_SAMPLE_SIZE))
+    # Cut chunks at line breaks to avoid splitting multibyte characters.
+    start, middle, end = chunks
+    start = start[:start.rfind(b"\n") + 1] or start
+    middle = middle[middle.find(b"\n") + 1:middle.rfind(b"\n") + 1] or middle
+    end = end[end.find(b"\n") + 1:] or end
+    return [start, middle, end]
+
 def translate_code(code):
     """Return normalized encoding `code`."""
     code = _re_illegal.sub("_", code.lower())
@@ -246,3 +389,15 @@ def translate_code(code):
         if item[CODE] == code:
             return item[CODE]
     raise ValueError(f"Code {code!r} not found")
+
+def _write_cache(cache):
+    """Write `cache` of detected encodings to file."""
+    path = aeidon.CONFIG_HOME_DIR / "encodings.json"
+    with contextlib.suppress(OSError):
+        aeidon.util.makedirs(path.parent)
+        # The cache is disposable, skip fsync.
+        with aeidon.util.atomic_open(path,
+                                     "w",
+                                     encoding="utf_8",
+                                     durability="rename-only") as f:
+            json.dump(cache, f, ensure_ascii=False)
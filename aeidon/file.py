@@ -19,7 +19,9 @@
 
 import aeidon
 import codecs
-import re
+import io
+import itertools
+import mmap
 
 from pathlib import Path
 
@@ -34,7 +36,7 @@ class SubtitleFile:
     :ivar has_utf_16_bom: True if BOM found for UTF-16-BE or UTF-16-LE
     :ivar header: String of metadata at the top of the file
     :ivar newline: :attr:`aeidon.newlines` item, detected upon read
-    :ivar path: Full, absolute path to the file on disk
+    :ivar path: Full, absolute path to the file on disk or ``None``
 
     If the file format contains a header, it will default to a fairly blank
     template header read upon instantiation of the class, from either
@@ -44,15 +46,24 @@ class SubtitleFile:
     format = aeidon.formats.NONE
     mode = aeidon.modes.NONE
 
+    # Approximate amount of bytes to decode at once when reading.
+    _block_size = 1048576
+
+    # Amount of subtitles to format or lines to parse at once.
+    _chunk_size = 1000
+
     def __init__(self, path, encoding, newline=None):
         """Initialize a :class:`SubtitleFile` instance."""
+        self._calc = aeidon.Calculator()
+        self._data = None
         self.encoding = encoding
         self.has_utf_16_bom = False
         self.header = (aeidon.util.get_template_header(self.format)
                        if self.format.has_header else "")
 
         self.newline = newline or aeidon.util.get_default_newline()
-        self.path = Path(path).resolve()
+        # Files parsed and serialized in memory have no path.
+        self.path = Path(path).resolve() if path is not None else None
 
     def copy_from(self, other):
         """Copy generic properties from `other`."""
@@ -62,87 +73,311 @@ class SubtitleFile:
 
     def _get_subtitle(self):
         """Return a new subtitle instance with proper properties."""
-        return aeidon.Subtitle(self.mode)
+        return aeidon.Subtitle(self.mode, calc=self._calc)
 
-    def read(self):
+    def _get_times(self, subtitles, name, ndigits=3):
         """
-        Read file and return subtitles.
+        Return list of times of `subtitles` rounded to `ndigits` decimals.
+
+        `name` should be either "start" or "end".
+        """
+        if all(x.mode == aeidon.modes.TIME for x in subtitles):
+            # Format native milliseconds directly in one go.
+            positions = [getattr(x, f"_{name}") for x in subtitles]
+            return self._calc.milliseconds_to_times(positions, ndigits)
+        times = [getattr(x, f"{name}_time") for x in subtitles]
+        if ndigits >= 3: return times
+        return self._calc.round_times(times, ndigits)
+
+    def _has_ascii_newlines(self):
+        """Return ``True`` if :attr:`encoding` encodes line breaks as ASCII."""
+        try:
+            return codecs.decode(b"\r\n", self.encoding, "replace") == "\r\n"
+        except LookupError:
+            return False
+
+    def _iter_chunks(self, subtitles):
+        """Iterate over lists of consecutive `subtitles` to write at once."""
+        subtitles = iter(subtitles)
+        while True:
+            chunk = list(itertools.islice(subtitles, self._chunk_size))
+            if not chunk: return
+            yield chunk
 
+    def _iter_blocks(self):
+        """
+        Read file and iterate over lists of consecutive lines.
+
+        All newlines are stripped.
+        All blank lines from beginning and end are skipped.
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        raise NotImplementedError
+        if self._data is None:
+            buffer = self._map()
+            if buffer is not None:
+                with buffer:
+                    yield from self._iter_mapped_blocks(buffer)
+                return
+        elif isinstance(self._data, bytes) and self._has_ascii_newlines():
+            # Scan bytes already read like a mapped file.
+            data, self._data = self._data, None
+            yield from self._iter_mapped_blocks(data)
+            return
+        with self._open_text() as f:
+            lines = self._strip_lines(f)
+            if self.encoding.startswith("utf_16"):
+                # Pairs of lines need to be checked across the whole file.
+                yield self._read_utf_16_lines(list(lines))
+            else:
+                yield from iter(lambda: list(itertools.islice(
+                    lines, self._chunk_size)), [])
+            newline = aeidon.util.get_newline(f.newlines)
+            if newline is not None:
+                self.newline = newline
 
-    def _read_lines(self):
+    def _iter_lines(self):
         """
-        Read file to a list of lines.
+        Read file and iterate over lines.
 
         All newlines are stripped.
-        All blank lines from beginning and end are removed.
+        All blank lines from beginning and end are skipped.
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
-        Return a list of lines read.
-        """
-        re_newline_char = re.compile(r"\r?\n?$")
-        with open(self.path, "r", encoding=self.encoding) as f:
-            lines = f.readlines()
-            lines = [re_newline_char.sub("", x) for x in lines]
-        for index in (0, -1):
-            while lines and not lines[index].strip():
-                lines.pop(index)
-        newline = aeidon.util.detect_newlines(self.path)
+        """
+        for lines in self._iter_blocks():
+            yield from lines
+
+    def _iter_mapped_blocks(self, buffer):
+        """
+        Iterate over lists of consecutive lines of bytes in `buffer`.
+
+        Line boundaries are located in the raw bytes and the file is decoded
+        in blocks of whole lines, which is only valid for encodings in which
+        line feeds and carriage returns are encoded as in ASCII. Lines are
+        stripped like in :meth:`_strip_lines`, but a block at a time.
+        """
+        decoder = codecs.getincrementaldecoder(self.encoding)()
+        newlines = set()
+        blank = None
+        start = 0
+        size = len(buffer)
+        with memoryview(buffer) as view:
+            while start < size:
+                end = min(start + self._block_size, size)
+                if end < size:
+                    # Cut after a line feed or a lone carriage return,
+                    # or if there are none, after the next line feed.
+                    cut = buffer.rfind(b"\n", start, end)
+                    if cut < 0:
+                        cut = buffer.rfind(b"\r", start, end - 1)
+                    if cut < 0:
+                        cut = buffer.find(b"\n", end)
+                    end = size if cut < 0 else cut + 1
+                with view[start:end] as block:
+                    text = decoder.decode(block, end == size)
+                start = end
+                if "\r" in text:
+                    crlf = text.count("\r\n")
+                    if crlf: newlines.add("\r\n")
+                    if text.count("\r") > crlf: newlines.add("\r")
+                    if text.count("\n") > crlf: newlines.add("\n")
+                    text = text.replace("\r\n", "\n").replace("\r", "\n")
+                elif "\n" in text:
+                    newlines.add("\n")
+                lines = text.split("\n")
+                if not lines[-1]:
+                    # Blocks end in newlines, nothing follows.
+                    lines.pop()
+                if blank is None:
+                    # Skip blank lines at beginning.
+                    i = 0
+                    while i < len(lines):
+                        if lines[i].strip():
+                            lines[i] = self._strip_bom(lines[i])
+                            if lines[i].strip(): break
+                        i += 1
+                    del lines[:i]
+                    if not lines: continue
+                    blank = []
+                # Hold blank lines at end until a non-blank line follows.
+                i = len(lines)
+                while i > 0 and not lines[i-1].strip():
+                    i -= 1
+                if i == 0:
+                    blank.extend(lines)
+                    continue
+                if blank:
+                    yield blank
+                blank = lines[i:]
+                del lines[i:]
+                yield lines
+        newline = aeidon.util.get_newline(tuple(newlines) or None)
         if newline is not None:
             self.newline = newline
-        if self.encoding == "utf_8":
-            bom = str(codecs.BOM_UTF8, "utf_8")
-            if lines and lines[0].startswith(bom):
-                # If a UTF-8 BOM (a.k.a. signature) is found, reread file with
-                # UTF-8-SIG encoding, which automatically strips the BOM when
-                # reading and adds it when writing.
-                self.encoding = "utf_8_sig"
-                return SubtitleFile._read_lines(self)
-        if self.encoding.startswith("utf_16"):
-            # Python automatically strips the UTF-16 BOM when reading, but only
-            # when using UTF-16. If using UTF-16-BE or UTF-16-LE, the BOM is
-            # kept at the beginning of the first line. It is read correctly, so
-            # it should FE FF for both BE and LE.
-            bom = str(codecs.BOM_UTF16_BE, "utf_16_be")
-            if lines and lines[0].startswith(bom):
-                self.has_utf_16_bom = True
-                lines[0] = lines[0].replace(bom, "")
-            # Handle erroneous (?) UTF-16 encoded subtitles that use
-            # NULL-character filled linebreaks '\x00\r\x00\n', which
-            # readlines interprets as two separate linebreaks.
-            if not any(lines[i] for i in range(1, len(lines), 2)):
-                lines = [lines[i] for i in range(0, len(lines), 2)]
+
+    def iter_subtitles(self):
+        """
+        Read file and iterate over subtitles.
+
+        Subtitles are parsed one by one while reading the file, which allows
+        processing large files without holding all of them in memory.
+        Attributes such as :attr:`header` and :attr:`newline` are set
+        while reading and only final once iteration is complete.
+
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        raise NotImplementedError
+
+    def _map(self):
+        """
+        Return file memory-mapped for reading or ``None``.
+
+        ``None`` is returned if the file cannot be mapped, e.g. if it is
+        empty, or if :attr:`encoding` is not compatible with ASCII line
+        breaks, in which case the file should be read as text instead.
+        Raise :exc:`IOError` if reading fails.
+        """
+        if not self._has_ascii_newlines():
+            return None
+        with open(self.path, "rb") as f:
+            try:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                return None
+
+    def _open_text(self):
+        """
+        Return a text file object to read content of file from.
+
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        data, self._data = self._data, None
+        if data is None:
+            return open(self.path, "r", encoding=self.encoding)
+        if isinstance(data, bytes):
+            # Decode as read instead of all at once.
+            return io.TextIOWrapper(io.BytesIO(data),
+                                    encoding=self.encoding,
+                                    newline=None)
+
+        if isinstance(data, str):
+            data = io.StringIO(data, newline=None)
+        return data
+
+    def read(self):
+        """
+        Read file and return subtitles.
+
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        return list(self.iter_subtitles())
+
+    def _read_utf_16_lines(self, lines):
+        """Return UTF-16 `lines` with BOM and extra blank lines removed."""
+        # Python automatically strips the UTF-16 BOM when reading, but only
+        # when using UTF-16. If using UTF-16-BE or UTF-16-LE, the BOM is
+        # kept at the beginning of the first line. It is read correctly, so
+        # it should FE FF for both BE and LE.
+        bom = str(codecs.BOM_UTF16_BE, "utf_16_be")
+        if lines and lines[0].startswith(bom):
+            self.has_utf_16_bom = True
+            lines[0] = lines[0].replace(bom, "")
+        # Handle erroneous (?) UTF-16 encoded subtitles that use
+        # NULL-character filled linebreaks '\x00\r\x00\n', which
+        # readlines interprets as two separate linebreaks.
+        if not any(lines[i] for i in range(1, len(lines), 2)):
+            lines = [lines[i] for i in range(0, len(lines), 2)]
         return lines
 
-    def write(self, subtitles, doc):
+    def set_data(self, data):
+        """
+        Set content to parse on next read instead of reading file.
+
+        `data` can be bytes, which are decoded using :attr:`encoding` a
+        block at a time while parsing, an already decoded string or a text
+        file object, which is closed once read. This allows reading the file
+        from disk once and using the same content to detect the format and
+        to parse.
+        """
+        self._data = data
+
+    def _strip_bom(self, line):
+        """Return first `line` of file with a UTF-8 BOM removed."""
+        if self.encoding != "utf_8": return line
+        bom = str(codecs.BOM_UTF8, "utf_8")
+        if not line.startswith(bom): return line
+        # If a UTF-8 BOM (a.k.a. signature) is found, switch to UTF-8-SIG
+        # encoding, which would have stripped the BOM when reading and adds
+        # it when writing.
+        self.encoding = "utf_8_sig"
+        return line[len(bom):]
+
+    def _strip_lines(self, lines):
+        """
+        Iterate over `lines` with newlines stripped.
+
+        Blank lines at beginning and end are skipped and a UTF-8 BOM at the
+        beginning is removed.
+        """
+        # Blank lines are held until a non-blank line follows,
+        # starting after the first non-blank line.
+        blank = None
+        for line in lines:
+            line = line.rstrip("\n")
+            if not line.strip():
+                if blank is not None:
+                    blank.append(line)
+                continue
+            if blank is None:
+                line = self._strip_bom(line)
+                if not line.strip(): continue
+                blank = []
+            elif blank:
+                yield from blank
+                blank.clear()
+            yield line
+
+    def write(self, subtitles, doc, durability="fsync"):
         """
         Write `subtitles` with text from `doc` to file.
 
+        `subtitles` can be any iterable of subtitles, which are formatted
+        and written in chunks, so e.g. a generator of subtitles is never
+        held in memory all at once. `durability` is passed to
+        :func:`aeidon.util.atomic_open`.
+
         Raise :exc:`IOError` if writing fails.
         Raise :exc:`UnicodeError` if encoding fails.
         """
         with aeidon.util.atomic_open(self.path,
                                      mode="w",
                                      encoding=self.encoding,
-                                     newline=self.newline.value) as f:
-
-            # UTF-8-SIG automatically adds the UTF-8 signature BOM. Likewise,
-            # UTF-16 automatically adds the system default BOM, but
-            # UTF-16-BE and UTF-16-LE don't. For the latter two, add the BOM,
-            # if it was originally read in the file.
-            if self.has_utf_16_bom and self.encoding == "utf_16_be":
-                f.write(str(codecs.BOM_UTF16_BE, "utf_16_be"))
-            if self.has_utf_16_bom and self.encoding == "utf_16_le":
-                f.write(str(codecs.BOM_UTF16_LE, "utf_16_le"))
+                                     newline=self.newline.value,
+                                     durability=durability) as f:
+            self.write_bom(f)
             self.write_to_file(subtitles, doc, f)
 
+    def write_bom(self, f):
+        """Write a UTF-16 BOM to text file `f` if needed by encoding."""
+        # UTF-8-SIG automatically adds the UTF-8 signature BOM. Likewise,
+        # UTF-16 automatically adds the system default BOM, but
+        # UTF-16-BE and UTF-16-LE don't. For the latter two, add the BOM,
+        # if it was originally read in the file.
+        if self.has_utf_16_bom and self.encoding == "utf_16_be":
+            f.write(str(codecs.BOM_UTF16_BE, "utf_16_be"))
+        if self.has_utf_16_bom and self.encoding == "utf_16_le":
+            f.write(str(codecs.BOM_UTF16_LE, "utf_16_le"))
+
     def write_to_file(self, subtitles, doc, f):
         """
         Write `subtitles` with text from `doc` to file `f`.
 
+        `subtitles` can be any iterable of subtitles, see :meth:`write`.
+
         Raise :exc:`IOError` if writing fails.
         Raise :exc:`UnicodeError` if encoding fails.
         """
@@ -18,6 +18,7 @@
 """Subtitle files of all formats."""
 
 import aeidon
+import io
 
 from .ssa        import SubStationAlpha
 from .ass        import AdvSubStationAlpha
@@ -52,3 +53,67 @@ def new(format, path, encoding, newline=None):
         if cls.format == format:
             return cls(path, encoding, newline)
     raise ValueError(f"Format {format!r} not found")
+
+def parse(data, format=None, encoding=None):
+    """
+    Parse `data` and return file and subtitles.
+
+    `data` can be a string, bytes or a file object of either. `format` can
+    be ``None`` to detect format from `data`. `encoding` is used to decode
+    bytes, ``None`` for UTF-8, unless a BOM is found. Return a tuple of an
+    :class:`aeidon.SubtitleFile` instance without a path, holding properties
+    read such as :attr:`header` and :attr:`newline`, and a list of subtitles.
+
+    Raise :exc:`UnicodeError` if decoding fails.
+    Raise :exc:`aeidon.FormatError` if unable to detect format.
+    Raise :exc:`aeidon.ParseError` if parsing fails.
+    """
+    if hasattr(data, "read"):
+        data = data.read()
+    encoding = encoding or "utf_8"
+    if isinstance(data, bytes):
+        encoding = aeidon.encodings.detect_bom(None, data) or encoding
+        data = str(data, encoding)
+    if format is None:
+        format = aeidon.util.detect_format(None, encoding, data)
+    file = new(format, None, encoding)
+    file.set_data(data)
+    try:
+        return file, file.read()
+    except UnicodeError:
+        raise
+    except Exception:
+        # As when opening files, syntactic problems in data
+        # and bugs in parsing code are both parse errors.
+        raise aeidon.ParseError("Failed to parse data")
+
+def serialize(subtitles, format, encoding=None, newline=None, header=None,
+              doc=None, f=None, template=None):
+    """
+    Return `subtitles` formatted in `format`.
+
+    Return a string if `encoding` is ``None``, else bytes encoded using
+    `encoding`. `newline` can be an :attr:`aeidon.newlines` item, ``None``
+    for system default. `header` can be ``None`` for the default header of
+    `format`. `doc` can be ``None`` for :attr:`aeidon.documents.MAIN`. If
+    file object `f` is given, write to it instead and return ``None``.
+    `template` can be an :class:`aeidon.SubtitleFile` instance to copy
+    properties from, such as the header, field order and UTF-16 BOM.
+
+    Raise :exc:`UnicodeError` if encoding fails.
+    """
+    file = new(format, None, encoding or "utf_8", newline)
+    if template is not None:
+        file.copy_from(template)
+    if header is not None:
+        file.header = header
+    doc = doc or aeidon.documents.MAIN
+    with io.StringIO(newline=file.newline.value) as buffer:
+        if encoding is not None:
+            file.write_bom(buffer)
+        file.write_to_file(subtitles, doc, buffer)
+        data = buffer.getvalue()
+    if encoding is not None:
+        data = data.encode(encoding)
+    if f is None: return data
+    f.write(data)
@@ -38,16 +38,25 @@ class AdvSubStationAlpha(SubStationAlpha):
             "Layer", "Start", "End", "Style", "Name",
             "MarginL", "MarginR", "MarginV", "Effect", "Text")
 
-    def _decode_field(self, field_name, value, subtitle):
-        """Save `value` of field as a subtitle attribute."""
-        if field_name == "Layer":
-            return setattr(subtitle.ssa, "layer", int(value))
-        decode = SubStationAlpha._decode_field
-        return decode(self, field_name, value, subtitle)
+    def _get_decoder(self, field_name):
+        """
+        Return a function to save a value of field as a subtitle attribute.
 
-    def _encode_field(self, field_name, subtitle, doc):
-        """Return value of field as string to be written to file."""
+        The returned function takes a subtitle and a string value from file.
+        """
+        if field_name == "Layer":
+            def decode(subtitle, value):
+                subtitle.ssa.layer = int(value)
+            return decode
+        return SubStationAlpha._get_decoder(self, field_name)
+
+    def _get_encoder(self, field_name, doc):
+        """
+        Return a function to get values of field to write to file.
+
+        The returned function takes a list of subtitles and returns a list
+        of corresponding string values.
+        """
         if field_name == "Layer":
-            return str(subtitle.ssa.layer)
-        encode = SubStationAlpha._encode_field
-        return encode(self, field_name, subtitle, doc)
+            return lambda subtitles: [str(x.ssa.layer) for x in subtitles]
+        return SubStationAlpha._get_encoder(self, field_name, doc)
@@ -32,31 +32,35 @@ class LRC(aeidon.SubtitleFile):
     mode = aeidon.modes.TIME
     _re_line = re.compile(r"^\[(-?\d\d:\d\d.\d\d)\](.*)$")
 
-    def read(self):
+    def iter_subtitles(self):
         """
-        Read file and return subtitles.
+        Read file and iterate over subtitles.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
         self.header = ""
-        subtitles = [self._get_subtitle()]
-        for line in self._read_lines():
+        previous = None
+        for line in self._iter_lines():
             match = self._re_line.match(line)
-            if match is None and len(subtitles) == 1:
+            if match is None and previous is None:
                 # Read line into file header.
                 if self.header:
                     self.header += "\n"
                 self.header += line
             elif match is not None:
+                # Subtitles end when the next one starts.
                 subtitle = self._get_subtitle()
-                normalize = subtitle.calc.normalize_time
-                subtitle.start_time = normalize(match.group(1))
-                subtitles[-1].end_time = subtitle.start_time
+                start = self._calc.normalize_time(match.group(1))
+                subtitle.start_time = start
                 subtitle.main_text = match.group(2) or ""
-                subtitles.append(subtitle)
-        subtitles[-1].duration_seconds = 5
-        return subtitles[1:]
+                if previous is not None:
+                    previous.end_time = start
+                    yield previous
+                previous = subtitle
+        if previous is not None:
+            previous.duration_seconds = 5
+            yield previous
 
     def write_to_file(self, subtitles, doc, f):
         """
@@ -67,10 +71,13 @@ class LRC(aeidon.SubtitleFile):
         """
         if self.header.strip():
             f.write(self.header.strip() + "\n\n")
-        for subtitle in subtitles:
-            start = subtitle.calc.round(subtitle.start_time, 2)
-            sign = "-" if start.startswith("-") else ""
-            first = 4 if start.startswith("-") else 3
-            start = sign + start[first:-1]
-            text = subtitle.get_text(doc).replace("\n", " ")
-            f.write(f"[{start}]{text}\n")
+        for chunk in self._iter_chunks(subtitles):
+            starts = self._get_times(chunk, "start", 2)
+            lines = []
+            for subtitle, start in zip(chunk, starts):
+                sign = "-" if start.startswith("-") else ""
+                first = 4 if start.startswith("-") else 3
+                start = sign + start[first:-1]
+                text = subtitle.get_text(doc).replace("\n", " ")
+                lines.append(f"[{start}]{text}\n")
+            f.write("".join(lines))
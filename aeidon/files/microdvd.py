@@ -28,25 +28,23 @@ class MicroDVD(aeidon.SubtitleFile):
     mode = aeidon.modes.FRAME
     _re_line = re.compile(r"^\{(-?\d+)\}\{(-?\d+)\}(.*?)$")
 
-    def read(self):
+    def iter_subtitles(self):
         """
-        Read file and return subtitles.
+        Read file and iterate over subtitles.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        subtitles = []
-        for line in self._read_lines():
+        for line in self._iter_lines():
             match = self._re_line.match(line)
             if match is not None:
                 subtitle = self._get_subtitle()
                 subtitle.start_frame = int(match.group(1))
                 subtitle.end_frame = int(match.group(2))
                 subtitle.main_text = match.group(3).replace("|", "\n")
-                subtitles.append(subtitle)
+                yield subtitle
             elif line.startswith("{DEFAULT}"):
                 self.header = line
-        return subtitles
 
     def write_to_file(self, subtitles, doc, f):
         """
@@ -57,8 +55,8 @@ class MicroDVD(aeidon.SubtitleFile):
         """
         if self.header.strip():
             f.write(self.header + "\n")
-        for subtitle in subtitles:
-            text = subtitle.get_text(doc).replace("\n", "|")
-            start = subtitle.start_frame
-            end = subtitle.end_frame
-            f.write(f"{{{start:d}}}{{{end:d}}}{text}\n")
+        for chunk in self._iter_chunks(subtitles):
+            texts = [x.get_text(doc).replace("\n", "|") for x in chunk]
+            f.write("".join(
+                f"{{{x.start_frame:d}}}{{{x.end_frame:d}}}{text}\n"
+                for x, text in zip(chunk, texts)))
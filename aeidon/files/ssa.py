@@ -31,9 +31,7 @@ class SubStationAlpha(aeidon.SubtitleFile):
     format = aeidon.formats.SSA
     mode = aeidon.modes.TIME
 
-    _re_file_time = re.compile(r"^(-?)(.+)$")
     _re_separator = re.compile(r",\s*")
-    _re_subtitle_time = re.compile(r"(-?)\d(.{10})\d")
 
     def __init__(self, path, encoding, newline=None):
         """Initialize a :class:`SubStationAlpha` instance."""
@@ -48,83 +46,113 @@ class SubStationAlpha(aeidon.SubtitleFile):
         if self.format != other.format: return
         self.event_fields = tuple(other.event_fields)
 
-    def _decode_field(self, field_name, value, subtitle):
-        """Save string `value` from file as a subtitle attribute."""
+    def _get_decoder(self, field_name):
+        """
+        Return a function to save a value of field as a subtitle attribute.
+
+        The returned function takes a subtitle and a string value from file.
+        """
         if field_name == "Marked":
-            value = int(value.split("=")[-1])
-            return setattr(subtitle.ssa, "marked", value)
+            def decode(subtitle, value):
+                subtitle.ssa.marked = int(value.split("=")[-1])
+            return decode
         if field_name == "Start":
-            value = self._re_file_time.sub(r"\1\060\2\060", value)
-            return setattr(subtitle, "start_time", value)
+            def decode(subtitle, value):
+                subtitle._start = self._get_milliseconds(value)
+            return decode
         if field_name == "End":
-            value = self._re_file_time.sub(r"\1\060\2\060", value)
-            return setattr(subtitle, "end_time", value)
+            def decode(subtitle, value):
+                subtitle._end = self._get_milliseconds(value)
+            return decode
         if field_name == "Text":
-            value = value.replace("\\n", "\n")
-            value = value.replace("\\N", "\n")
-            return setattr(subtitle, "main_text", value)
+            def decode(subtitle, value):
+                value = value.replace("\\n", "\n")
+                subtitle.main_text = value.replace("\\N", "\n")
+            return decode
+        name = aeidon.util.title_to_lower_case(field_name)
         if field_name in ("MarginL", "MarginR", "MarginV"):
-            name = aeidon.util.title_to_lower_case(field_name)
-            return setattr(subtitle.ssa, name, int(value))
+            def decode(subtitle, value):
+                setattr(subtitle.ssa, name, int(value))
+            return decode
         # Set plain string container attribute value.
-        name = aeidon.util.title_to_lower_case(field_name)
-        setattr(subtitle.ssa, name, value)
+        def decode(subtitle, value):
+            setattr(subtitle.ssa, name, value)
+        return decode
+
+    def _get_encoder(self, field_name, doc):
+        """
+        Return a function to get values of field to write to file.
 
-    def _encode_field(self, field_name, subtitle, doc):
-        """Return value of field as string to be written to file."""
+        The returned function takes a list of subtitles and returns a list
+        of corresponding string values.
+        """
         if field_name == "Marked":
-            return f"Marked={subtitle.ssa.marked:d}"
+            return lambda subtitles: [f"Marked={x.ssa.marked:d}"
+                                      for x in subtitles]
         if field_name == "Start":
-            value = subtitle.calc.round(subtitle.start_time, 2)
-            return self._re_subtitle_time.sub(r"\1\2", value)
+            return lambda subtitles: list(map(
+                self._get_file_time, self._get_times(subtitles, "start", 2)))
         if field_name == "End":
-            value = subtitle.calc.round(subtitle.end_time, 2)
-            return self._re_subtitle_time.sub(r"\1\2", value)
+            return lambda subtitles: list(map(
+                self._get_file_time, self._get_times(subtitles, "end", 2)))
         if field_name == "Text":
-            value = subtitle.get_text(doc)
-            return value.replace("\n", "\\N")
+            return lambda subtitles: [x.get_text(doc).replace("\n", "\\N")
+                                      for x in subtitles]
+        name = aeidon.util.title_to_lower_case(field_name)
         if field_name in ("MarginL", "MarginR", "MarginV"):
-            name = aeidon.util.title_to_lower_case(field_name)
-            value = getattr(subtitle.ssa, name)
-            return f"{value:04d}"
+            return lambda subtitles: [f"{getattr(x.ssa, name):04d}"
+                                      for x in subtitles]
         # Return plain string container attribute value.
-        name = aeidon.util.title_to_lower_case(field_name)
-        return getattr(subtitle.ssa, name)
-
-    def read(self):
+        return lambda subtitles: [getattr(x.ssa, name) for x in subtitles]
+
+    def _get_file_time(self, time):
+        """Return `time` rounded to centiseconds in file format."""
+        # Drop the first digit of hours and last digit of seconds.
+        if time.startswith("-"):
+            return f"-{time[2:12]}"
+        return time[1:11]
+
+    def _get_milliseconds(self, time):
+        """Return `time` from file as milliseconds."""
+        # Add the first digit of hours and last digit of seconds.
+        if time.startswith("-"):
+            time = f"-0{time[1:]}0"
+        else:
+            time = f"0{time}0"
+        return self._calc.time_to_milliseconds(time)
+
+    def iter_subtitles(self):
         """
-        Read file and return subtitles.
+        Read file and iterate over subtitles.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        subtitles = []
-        lines = self._read_lines()
+        lines = self._iter_lines()
         self._read_header(lines)
+        fields = list(self.event_fields)
+        decoders = list(map(self._get_decoder, fields))
         for line in lines:
-            if not line.startswith("Format:"): continue
-            line = line.replace("Format:", "").strip()
-            fields = self._re_separator.split(line)
-            indices = dict((x, fields.index(x)) for x in fields)
-            max_split = len(fields) - 1
-        for line in lines:
-            if not line.startswith("Dialogue:"): continue
-            line = line.replace("Dialogue:", "").lstrip()
-            values = self._re_separator.split(line, max_split)
-            subtitle = self._get_subtitle()
-            for name, index in indices.items():
-                self._decode_field(name, values[index], subtitle)
-            subtitles.append(subtitle)
-        self.event_fields = tuple(fields)
-        return subtitles
+            if line.startswith("Dialogue:"):
+                line = line.replace("Dialogue:", "").lstrip()
+                values = self._re_separator.split(line, len(fields) - 1)
+                subtitle = self._get_subtitle()
+                for decode, value in zip(decoders, values):
+                    decode(subtitle, value)
+                yield subtitle
+            elif line.startswith("Format:"):
+                line = line.replace("Format:", "").strip()
+                fields = self._re_separator.split(line)
+                decoders = list(map(self._get_decoder, fields))
+                self.event_fields = tuple(fields)
 
     def _read_header(self, lines):
-        """Read header and remove its lines."""
-        self.header = ""
-        while not lines[0].startswith("[Events]"):
-            self.header += "\n"
-            self.header += lines.pop(0)
-        self.header = self.header.strip()
+        """Read header from `lines` up to the ``[Events]`` section."""
+        header = []
+        for line in lines:
+            if line.startswith("[Events]"): break
+            header.append(line)
+        self.header = "\n".join(header).strip()
 
     def write_to_file(self, subtitles, doc, f):
         """
@@ -137,8 +165,8 @@ class SubStationAlpha(aeidon.SubtitleFile):
         f.write("[Events]\n")
         fields = ", ".join(self.event_fields)
         f.write(f"Format: {fields}\n")
-        for subtitle in subtitles:
-            dialogue = ",".join(
-                self._encode_field(x, subtitle, doc)
-                for x in self.event_fields)
-            f.write(f"Dialogue: {dialogue}\n")
+        encoders = [self._get_encoder(x, doc) for x in self.event_fields]
+        for chunk in self._iter_chunks(subtitles):
+            columns = [encode(chunk) for encode in encoders]
+            f.write("".join(f"Dialogue: {','.join(x)}\n"
+                            for x in zip(*columns)))
@@ -34,47 +34,69 @@ class SubRip(aeidon.SubtitleFile):
         # that is farther from the decimal point.
         r"^(-?\d{1,2}:\d{1,2}:\d{1,2},\d{1,3}) -->"
         r" (-?\d{1,2}:\d{1,2}:\d{1,2},\d{1,3})"
-        r"(  X1:(\d+) X2:(\d+) Y1:(\d+) Y2:(\d+))?\s*$"))
+        r"(  X1:(\d+) X2:(\d+) Y1:(\d+) Y2:(\d+))?[^\S\n]*$"),
+        re.MULTILINE)
 
-    def read(self):
+    def _get_milliseconds(self, time):
+        """Return `time` from file as milliseconds."""
+        if len(time) != 12 or time.startswith("-"):
+            # Pad fields lacking zero-padding and handle sign.
+            time = self._calc.normalize_time(time)
+        return self._calc.time_to_milliseconds(time)
+
+    def _get_text(self, text, last):
+        """
+        Return subtitle text from `text` following a time line.
+
+        `text` should end in a newline or be blank. Unless `last` is ``True``,
+        `text` is assumed to end with the number of the next subtitle.
         """
-        Read file and return subtitles.
+        text = text[:-1]
+        if not last:
+            head, _, tail = text.rpartition("\n")
+            if tail.strip().isdigit():
+                # Remove number and blank line above it.
+                text = head
+                head, _, tail = head.rpartition("\n")
+                if not tail.strip():
+                    text = head
+        # Skip leading empty lines.
+        return text.lstrip("\n")
+
+    def iter_subtitles(self):
+        """
+        Read file and iterate over subtitles.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        subtitles = []
-        for line in self._read_lines():
-            match = self._re_time_line.match(line)
-            if match is None:
-                if subtitles[-1].main_text:
-                    subtitles[-1].main_text += "\n"
-                subtitles[-1].main_text += line
-                continue
-            subtitle = self._get_subtitle()
-            subtitle.start_time = subtitle.calc.normalize_time(match.group(1))
-            subtitle.end_time = subtitle.calc.normalize_time(match.group(2))
-            if match.group(3) is not None:
-                subtitle.subrip.x1 = int(match.group(4))
-                subtitle.subrip.x2 = int(match.group(5))
-                subtitle.subrip.y1 = int(match.group(6))
-                subtitle.subrip.y2 = int(match.group(7))
-            subtitles.append(subtitle)
-        return subtitles
-
-    def _read_lines(self):
-        """Read file to a unicoded list of lines."""
-        lines = ["\n"]
-        for line in aeidon.SubtitleFile._read_lines(self):
-            lines.append(line)
-            match = self._re_time_line.match(line)
-            if match is None: continue
-            # Remove numbers and blank lines above them.
-            if lines[-2].strip().isdigit():
-                if not lines[-3].strip():
-                    lines.pop(-3)
-                lines.pop(-2)
-        return lines
+        # Find time lines in text decoded a block at a time. Text following
+        # the last time line in a block is kept until the next time line.
+        subtitle = None
+        text = ""
+        for lines in self._iter_blocks():
+            pos = len(text)
+            text += "\n".join(lines) + "\n"
+            start = 0
+            for match in self._re_time_line.finditer(text, pos):
+                if subtitle is not None:
+                    block = text[start:match.start()]
+                    subtitle.main_text = self._get_text(block, False)
+                    yield subtitle
+                subtitle = self._get_subtitle()
+                subtitle._start = self._get_milliseconds(match.group(1))
+                subtitle._end = self._get_milliseconds(match.group(2))
+                if match.group(3) is not None:
+                    subtitle.subrip.x1 = int(match.group(4))
+                    subtitle.subrip.x2 = int(match.group(5))
+                    subtitle.subrip.y1 = int(match.group(6))
+                    subtitle.subrip.y2 = int(match.group(7))
+                start = match.end() + 1
+            # Text before the first time line is not part of any subtitle.
+            text = text[start:] if subtitle is not None else ""
+        if subtitle is not None:
+            subtitle.main_text = self._get_text(text, True)
+            yield subtitle
 
     def write_to_file(self, subtitles, doc, f):
         """
@@ -83,20 +105,25 @@ class SubRip(aeidon.SubtitleFile):
         Raise :exc:`IOError` if writing fails.
         Raise :exc:`UnicodeError` if encoding fails.
         """
-        for i, subtitle in enumerate(subtitles):
-            f.write(f"{i + 1:d}\n")
-            start = subtitle.start_time.replace(".", ",")
-            end = subtitle.end_time.replace(".", ",")
-            f.write(f"{start} --> {end}")
-            # Write Extended SubRip coordinates only if the container
-            # has been initialized and the coordinates make some sense.
-            if subtitle.has_container("subrip"):
-                x1 = subtitle.subrip.x1
-                x2 = subtitle.subrip.x2
-                y1 = subtitle.subrip.y1
-                y2 = subtitle.subrip.y2
-                if not x1 == x2 == y1 == y2 == 0:
-                    f.write(f"  X1:{x1:03d} X2:{x2:03d}")
-                    f.write(f" Y1:{y1:03d} Y2:{y2:03d}")
-            f.write(f"\n{subtitle.get_text(doc)}\n")
-            f.write("\n")
+        number = 0
+        for chunk in self._iter_chunks(subtitles):
+            starts = self._get_times(chunk, "start")
+            ends = self._get_times(chunk, "end")
+            lines = []
+            for subtitle, start, end in zip(chunk, starts, ends):
+                number += 1
+                start = start.replace(".", ",")
+                end = end.replace(".", ",")
+                lines.append(f"{number:d}\n{start} --> {end}")
+                # Write Extended SubRip coordinates only if the container
+                # has been initialized and the coordinates make some sense.
+                if subtitle.has_container("subrip"):
+                    x1 = subtitle.subrip.x1
+                    x2 = subtitle.subrip.x2
+                    y1 = subtitle.subrip.y1
+                    y2 = subtitle.subrip.y2
+                    if not x1 == x2 == y1 == y2 == 0:
+                        lines.append(f"  X1:{x1:03d} X2:{x2:03d}")
+                        lines.append(f" Y1:{y1:03d} Y2:{y2:03d}")
+                lines.append(f"\n{subtitle.get_text(doc)}\n\n")
+            f.write("".join(lines))
@@ -29,30 +29,37 @@ class SubViewer2(aeidon.SubtitleFile):
     _re_time_line = re.compile((r"^(-?\d\d:\d\d:\d\d.\d\d)"
                                 r",(-?\d\d:\d\d:\d\d.\d\d)\s*$"))
 
-    def read(self):
+    def iter_subtitles(self):
         """
-        Read file and return subtitles.
+        Read file and iterate over subtitles.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
         self.header = ""
-        subtitles = []
-        lines = self._read_lines()
-        while lines[0].startswith("["):
-            self.header += "\n"
-            self.header += lines.pop(0)
-        self.header = self.header.lstrip()
-        for i, line in enumerate(lines + [""]):
+        header = []
+        subtitle = None
+        for line in self._iter_lines():
+            if header is not None:
+                if line.startswith("["):
+                    header.append(line)
+                    continue
+                self.header = "\n".join(header).lstrip()
+                header = None
+            if subtitle is not None:
+                # Text is on the line following the time line.
+                subtitle.main_text = line.replace("[br]", "\n")
+                yield subtitle
+                subtitle = None
             match = self._re_time_line.match(line)
             if match is None: continue
             subtitle = self._get_subtitle()
             subtitle.start_time = match.group(1) + "0"
             subtitle.end_time = match.group(2) + "0"
-            text = lines[i+1].replace("[br]", "\n")
-            subtitle.main_text = text
-            subtitles.append(subtitle)
-        return subtitles
+        if header is not None:
+            self.header = "\n".join(header).lstrip()
+        if subtitle is not None:
+            yield subtitle
 
     def write_to_file(self, subtitles, doc, f):
         """
@@ -62,8 +69,10 @@ class SubViewer2(aeidon.SubtitleFile):
         Raise :exc:`UnicodeError` if encoding fails.
         """
         f.write(self.header + "\n")
-        for subtitle in subtitles:
-            start = subtitle.calc.round(subtitle.start_time, 2)[:-1]
-            end = subtitle.calc.round(subtitle.end_time, 2)[:-1]
-            text = subtitle.get_text(doc).replace("\n", "[br]")
-            f.write(f"\n{start},{end}\n{text}\n")
+        for chunk in self._iter_chunks(subtitles):
+            starts = self._get_times(chunk, "start", 2)
+            ends = self._get_times(chunk, "end", 2)
+            texts = [x.get_text(doc).replace("\n", "[br]") for x in chunk]
+            f.write("".join(
+                f"\n{start[:-1]},{end[:-1]}\n{text}\n"
+                for start, end, text in zip(starts, ends, texts)))
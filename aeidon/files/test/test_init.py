@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import aeidon
+import codecs
+import io
+import pytest
+
+class TestModule(aeidon.TestCase):
+
+    @pytest.mark.parametrize("format", aeidon.formats)
+    def test_parse(self, format):
+        path = self.new_temp_file(format)
+        project = self.new_project()
+        project.open_main(path, "ascii")
+        file, subtitles = aeidon.files.parse(path.read_text())
+        assert file.format == format
+        assert file.path is None
+        assert subtitles == project.subtitles
+
+    def test_parse__bytes(self):
+        data = codecs.BOM_UTF8 + self.new_subrip_file().read_bytes()
+        file, subtitles = aeidon.files.parse(data, encoding="ascii")
+        assert file.encoding == "utf_8_sig"
+        assert subtitles
+
+    def test_parse__file(self):
+        path = self.new_subrip_file()
+        with path.open("rb") as f:
+            file, subtitles = aeidon.files.parse(f)
+        assert file.format == aeidon.formats.SUBRIP
+        assert subtitles
+
+    def test_parse__format(self):
+        data = self.new_subrip_file().read_text()
+        file, subtitles = aeidon.files.parse(data, aeidon.formats.SUBRIP)
+        assert file.format == aeidon.formats.SUBRIP
+        assert subtitles
+
+    def test_parse__format_error(self):
+        with pytest.raises(aeidon.FormatError):
+            aeidon.files.parse("test")
+
+    def test_parse__newline(self):
+        data = self.new_subrip_file().read_text().replace("\n", "\r\n")
+        file, subtitles = aeidon.files.parse(data)
+        assert file.newline == aeidon.newlines.WINDOWS
+
+    @pytest.mark.parametrize("format", aeidon.formats)
+    def test_serialize(self, format):
+        text = self.get_sample_text(format)
+        file, subtitles = aeidon.files.parse(text, format)
+        newline = aeidon.newlines.UNIX
+        data = aeidon.files.serialize(subtitles,
+                                      format,
+                                      newline=newline,
+                                      header=file.header)
+
+        assert data.strip() == text
+
+    def test_serialize__encoding(self):
+        text = self.new_subrip_file().read_text()
+        file, subtitles = aeidon.files.parse(text)
+        data = aeidon.files.serialize(subtitles,
+                                      aeidon.formats.SUBRIP,
+                                      encoding="utf_16",
+                                      newline=aeidon.newlines.WINDOWS)
+
+        assert data.startswith(codecs.BOM_UTF16)
+        text = str(data, "utf_16")
+        assert "\r\n" in text
+        assert aeidon.files.parse(text)[1] == subtitles
+
+    def test_serialize__file(self):
+        text = self.new_subrip_file().read_text()
+        file, subtitles = aeidon.files.parse(text)
+        f = io.BytesIO()
+        format = aeidon.formats.SUBRIP
+        value = aeidon.files.serialize(subtitles, format, "ascii", f=f)
+        assert value is None
+        assert f.getvalue() == aeidon.files.serialize(subtitles,
+                                                      format,
+                                                      "ascii")
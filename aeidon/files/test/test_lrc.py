@@ -26,6 +26,10 @@ class TestLRC(aeidon.TestCase):
         path = self.new_temp_file(self.format, self.name)
         self.file = aeidon.files.new(self.format, path, "ascii")
 
+    def test_iter_subtitles(self):
+        subtitles = list(self.file.iter_subtitles())
+        assert subtitles == self.file.read()
+
     def test_read(self):
         assert self.file.read()
 
@@ -26,6 +26,10 @@ class TestMPL2(aeidon.TestCase):
                                      self.new_temp_file(self.format),
                                      "ascii")
 
+    def test_iter_subtitles(self):
+        subtitles = list(self.file.iter_subtitles())
+        assert subtitles == self.file.read()
+
     def test_read(self):
         assert self.file.read()
 
@@ -26,6 +26,10 @@ class TestSubStationAlpha(aeidon.TestCase):
                                      self.new_temp_file(self.format),
                                      "ascii")
 
+    def test_iter_subtitles(self):
+        subtitles = list(self.file.iter_subtitles())
+        assert subtitles == self.file.read()
+
     def test_read(self):
         assert self.file.read()
         assert self.file.header
@@ -34,3 +38,13 @@ class TestSubStationAlpha(aeidon.TestCase):
         self.file.write(self.file.read(), aeidon.documents.MAIN)
         text = self.file.path.read_text().strip()
         assert text == self.get_sample_text(self.format)
+
+    def test_write__reordered_fields(self):
+        subtitles = self.file.read()
+        subtitles[0].start = "-00:00:01.500"
+        subtitles[0].ssa.marginl = 7
+        # Text must be last, since it can contain commas.
+        fields = self.file.event_fields
+        self.file.event_fields = (*reversed(fields[:-1]), fields[-1])
+        self.file.write(subtitles, aeidon.documents.MAIN)
+        assert self.file.read() == subtitles
@@ -16,6 +16,7 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 import aeidon
+import pytest
 
 class TestSubRip(aeidon.TestCase):
 
@@ -26,9 +27,28 @@ class TestSubRip(aeidon.TestCase):
         path = self.new_temp_file(self.format, self.name)
         self.file = aeidon.files.new(self.format, path, "ascii")
 
+    def test_iter_subtitles(self):
+        subtitles = list(self.file.iter_subtitles())
+        assert subtitles == self.file.read()
+
     def test_read(self):
         assert self.file.read()
 
+    @pytest.mark.parametrize("block_size", [1, 1048576])
+    def test_read__lenient(self, block_size):
+        self.file.path.write_text(
+            "1\n0:0:1,5 --> 0:0:2,50\n\nFirst\n\n\n"
+            " 2 \n-00:00:03,000 --> 00:00:04,000\n1984\n"
+            "00:00:05,000 --> 00:00:06,000  \nThird\n\n4\n")
+        self.file._block_size = block_size
+        subtitles = self.file.read()
+        assert [x.start_time for x in subtitles] == [
+            "00:00:01.500", "-00:00:03.000", "00:00:05.000"]
+        assert [x.end_time for x in subtitles] == [
+            "00:00:02.500", "00:00:04.000", "00:00:06.000"]
+        assert [x.main_text for x in subtitles] == [
+            "First\n", "", "Third\n\n4"]
+
     def test_write(self):
         self.file.write(self.file.read(), aeidon.documents.MAIN)
         text = self.file.path.read_text().strip()
@@ -40,15 +40,16 @@ class TMPlayer(aeidon.SubtitleFile):
         if self.format != other.format: return
         self.two_digit_hour = other.two_digit_hour
 
-    def read(self):
+    def iter_subtitles(self):
         """
-        Read file and return subtitles.
+        Read file and iterate over subtitles.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        subtitles = [self._get_subtitle()]
-        for line in self._read_lines():
+        # Subtitles end when the next one starts.
+        previous = None
+        for line in self._iter_lines():
             match = self._re_one_digit_hour.search(line)
             if match is not None:
                 i = match.span()[1]
@@ -59,21 +60,26 @@ class TMPlayer(aeidon.SubtitleFile):
                     time = time[1:]
                 time = sign + "0" + time
                 subtitle.start_time = time
-                subtitles[-1].end_time = time
                 subtitle.main_text = line[i:].replace("|", "\n")
-                subtitles.append(subtitle)
+                if previous is not None:
+                    previous.end_time = time
+                    yield previous
+                previous = subtitle
                 self.two_digit_hour = False
             match = self._re_two_digit_hour.search(line)
             if match is not None:
                 i = match.span()[1]
                 subtitle = self._get_subtitle()
                 subtitle.start_time = line[:i-1] + ".000"
-                subtitles[-1].end_time = subtitle.start_time
                 subtitle.main_text = line[i:].replace("|", "\n")
-                subtitles.append(subtitle)
+                if previous is not None:
+                    previous.end_time = subtitle.start_time
+                    yield previous
+                previous = subtitle
                 self.two_digit_hour = True
-        subtitles[-1].duration_seconds = 5
-        return subtitles[1:]
+        if previous is not None:
+            previous.duration_seconds = 5
+            yield previous
 
     def write_to_file(self, subtitles, doc, f):
         """
@@ -82,12 +88,15 @@ class TMPlayer(aeidon.SubtitleFile):
         Raise :exc:`IOError` if writing fails.
         Raise :exc:`UnicodeError` if encoding fails.
         """
-        for subtitle in subtitles:
-            start = subtitle.calc.round(subtitle.start_time, 0)
-            start = (start[:-4] if self.two_digit_hour
-                     else ("-" + start[2:-4]
-                           if start.startswith("-")
-                           else start[1:-4]))
+        for chunk in self._iter_chunks(subtitles):
+            starts = self._get_times(chunk, "start", 0)
+            lines = []
+            for subtitle, start in zip(chunk, starts):
+                start = (start[:-4] if self.two_digit_hour
+                         else ("-" + start[2:-4]
+                               if start.startswith("-")
+                               else start[1:-4]))
 
-            text = subtitle.get_text(doc).replace("\n", "|")
-            f.write(f"{start}:{text}\n")
+                text = subtitle.get_text(doc).replace("\n", "|")
+                lines.append(f"{start}:{text}\n")
+            f.write("".join(lines))
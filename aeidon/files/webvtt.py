@@ -18,6 +18,8 @@
 """WebVTT file."""
 
 import aeidon
+import collections.abc
+import itertools
 import re
 
 class WebVTT(aeidon.SubtitleFile):
@@ -42,92 +44,100 @@ class WebVTT(aeidon.SubtitleFile):
         r" (-?(?:\d{1,2}:)?\d{1,2}:\d{1,2}\.\d{1,3})"
         r"(\s+.+)?\s*$"))
 
-    def read(self):
+    def _get_milliseconds(self, time):
+        """Return `time` from file as milliseconds."""
+        time = self._calc.normalize_time(time)
+        return self._calc.time_to_milliseconds(time)
+
+    def iter_subtitles(self):
         """
-        Read file and return subtitles.
+        Read file and iterate over subtitles.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        subtitles = []
+        # Lines are collected into lists and joined once the subtitle they
+        # belong to ends. A subtitle is created only once its time line is
+        # found, so blocks of styles and comments allocate nothing.
+        subtitle = None
         current = "header"
-        self.header = ""
-        lines = list(self._read_lines()) + [""]
-        for i, line in enumerate(lines):
+        previous = ""
+        header, styles, comments, texts = [], [], [], []
+        for line in itertools.chain(self._iter_lines(), [""]):
             if not line.strip():
                 # A blank line terminates the preceding block.
-                if current in ("header", "text"):
-                    subtitles.append(self._get_subtitle())
+                if current == "header":
+                    self.header = "\n".join(header)
+                if current == "text":
+                    if styles:
+                        subtitle.webvtt.style = "\n".join(styles)
+                    if comments:
+                        subtitle.webvtt.comment = "\n".join(comments)
+                    subtitle.main_text = "\n".join(texts)
+                    yield subtitle
+                    subtitle = None
+                    styles, comments, texts = [], [], []
                 current = None
             elif current == "header":
                 # Header should be one line, but allow a block.
-                if self.header:
-                    self.header += "\n"
-                self.header += line
-            elif (self._re_style.match(line) or
-                  current == "style"):
+                header.append(line)
+            elif current == "style" or self._re_style.match(line):
                 # Bind CSS styles to following subtitle.
-                subtitle = subtitles[-1]
-                if subtitle.webvtt.style:
-                    subtitle.webvtt.style += "\n"
-                subtitle.webvtt.style += line
+                styles.append(line)
                 current = "style"
-            elif (self._re_comment.match(line) or
-                  current == "comment"):
+            elif current == "comment" or self._re_comment.match(line):
                 # Bind comments to following subtitle.
-                subtitle = subtitles[-1]
-                if subtitle.webvtt.comment:
-                    subtitle.webvtt.comment += "\n"
-                subtitle.webvtt.comment += line
+                comments.append(line)
                 current = "comment"
-            elif self._re_time_line.match(line):
+            elif match := self._re_time_line.match(line):
                 # Time lines form a block with an optional preceding
                 # cue identifier and following text.
-                subtitle = subtitles[-1]
-                if lines[i-1].strip():
-                    subtitle.webvtt.id = lines[i-1]
-                match = self._re_time_line.match(line)
-                normalize = subtitle.calc.normalize_time
-                subtitle.start_time = normalize(match.group(1))
-                subtitle.end_time = normalize(match.group(2))
+                if subtitle is None:
+                    subtitle = self._get_subtitle()
+                if previous.strip():
+                    subtitle.webvtt.id = previous
+                subtitle._start = self._get_milliseconds(match.group(1))
+                subtitle._end = self._get_milliseconds(match.group(2))
                 subtitle.webvtt.settings = match.group(3) or ""
                 current = "text"
             elif current == "text":
-                # Append inividual lines to text block.
-                subtitle = subtitles[-1]
-                if subtitle.main_text:
-                    subtitle.main_text += "\n"
-                subtitle.main_text += line
-        # The last blank line has opened a new subtitle without times or text,
-        # which we skip. This also means that any possible styles or comments
-        # after the last actual subtitle are thrown out as well.
-        return subtitles[:-1]
+                # Append individual lines to text block.
+                texts.append(line)
+            previous = line
+        # Any styles or comments after the last subtitle are thrown out.
 
     def write_to_file(self, subtitles, doc, f):
         """
         Write `subtitles` from `doc` to file `f`.
 
+        Times are written as MM:SS.SSS if the last subtitle ends within the
+        first hour, else the usual HH:MM:SS.SSS. If `subtitles` is not a
+        sequence, the last subtitle isn't known in advance and hours are
+        always written.
+
         Raise :exc:`IOError` if writing fails.
         Raise :exc:`UnicodeError` if encoding fails.
         """
-        writen = lambda x: f.write(x + "\n")
-        nwriten = lambda x: f.write("\n" + x + "\n")
-        writen(self.header.strip() or "WEBVTT")
-        first = 3 if subtitles[-1].end_seconds < 3600 else 0
-        for i, subtitle in enumerate(subtitles):
-            if subtitle.webvtt.style:
-                nwriten(subtitle.webvtt.style)
-            if subtitle.webvtt.comment:
-                nwriten(subtitle.webvtt.comment)
-            f.write("\n")
-            if subtitle.webvtt.id:
-                writen(subtitle.webvtt.id)
-            # Write times as MM:SS.SSS if all times are less
-            # than an hour, else the usual HH:MM:SS.SSS.
-            start = subtitle.start_time[first:]
-            end = subtitle.end_time[first:]
-            f.write(f"{start} --> {end}")
-            if subtitle.webvtt.settings:
-                settings = subtitle.webvtt.settings.strip()
-                f.write(f" {settings}")
-            f.write(f"\n{subtitle.get_text(doc)}\n")
+        f.write((self.header.strip() or "WEBVTT") + "\n")
+        first = (3 if (isinstance(subtitles, collections.abc.Sequence) and
+                       subtitles and
+                       subtitles[-1].end_seconds < 3600) else 0)
+
+        for chunk in self._iter_chunks(subtitles):
+            starts = self._get_times(chunk, "start")
+            ends = self._get_times(chunk, "end")
+            lines = []
+            for subtitle, start, end in zip(chunk, starts, ends):
+                if subtitle.webvtt.style:
+                    lines.append(f"\n{subtitle.webvtt.style}\n")
+                if subtitle.webvtt.comment:
+                    lines.append(f"\n{subtitle.webvtt.comment}\n")
+                lines.append("\n")
+                if subtitle.webvtt.id:
+                    lines.append(f"{subtitle.webvtt.id}\n")
+                lines.append(f"{start[first:]} --> {end[first:]}")
+                if subtitle.webvtt.settings:
+                    settings = subtitle.webvtt.settings.strip()
+                    lines.append(f" {settings}")
+                lines.append(f"\n{subtitle.get_text(doc)}\n")
+            f.write("".join(lines))
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""Index of subtitle positions for lookups by time."""
+
+import aeidon
+import bisect
+import math
+
+class IntervalIndex:
+
+    """
+    Index of subtitle positions for lookups by time.
+
+    :ivar project: :class:`aeidon.Project` instance indexed
+
+    Subtitles are ordered by start position and their end positions are kept
+    in segment trees of minimum and maximum values, which allows finding
+    subtitles by time in logarithmic time, even if subtitles overlap. All
+    positions are in seconds and intervals include both start and end.
+
+    The index is kept up to date using project signals. Position changes that
+    don't change the order of subtitles are updated in place. Other changes,
+    such as inserting or removing subtitles, mark the index to be rebuilt on
+    the next lookup. Changes made directly to subtitles, bypassing project
+    methods, require calling :meth:`rebuild`.
+    """
+
+    _signals = (
+        "main-file-opened",
+        "notify::framerate",
+        "positions-changed",
+        "subtitles-inserted",
+        "subtitles-removed",
+        "translation-file-opened",
+    )
+
+    def __init__(self, project):
+        """Initialize an :class:`IntervalIndex` instance."""
+        self._dirty = True
+        self._ends = []
+        self._maxs = []
+        self._mins = []
+        self._order = []
+        self._ranks = []
+        self._size = 1
+        self._starts = []
+        self._subtitles = None
+        self.project = project
+        for signal in self._signals:
+            aeidon.util.connect(self, "project", signal)
+
+    def at(self, seconds):
+        """
+        Return index of subtitle shown at `seconds` or ``None``.
+
+        If multiple subtitles overlap at `seconds`, return the one that
+        starts last.
+        """
+        self._ensure_built()
+        limit = bisect.bisect_right(self._starts, seconds) - 1
+        match = lambda x: x >= seconds
+        pos = self._find_last(self._maxs, limit, match)
+        return self._order[pos] if pos >= 0 else None
+
+    def _build_tree(self, leaves, fill, function):
+        """Return a segment tree of `leaves` combined with `function`."""
+        tree = [fill] * self._size + leaves
+        tree.extend([fill] * (self._size - len(leaves)))
+        for i in reversed(range(1, self._size)):
+            tree[i] = function(tree[2*i], tree[2*i+1])
+        return tree
+
+    def _collect(self, tree, node, lo, hi, limit, match, result):
+        """Add all sorted positions up to `limit` with leaf matching."""
+        if lo > limit or not match(tree[node]): return
+        if node >= self._size:
+            result.append(lo)
+            return
+        mid = (lo + hi) // 2
+        self._collect(tree, 2*node, lo, mid, limit, match, result)
+        self._collect(tree, 2*node+1, mid+1, hi, limit, match, result)
+
+    def detach(self):
+        """Stop following changes in project."""
+        for signal in self._signals:
+            name = signal.replace("-", "_").replace("::", "_")
+            method = getattr(self, f"_on_project_{name}")
+            self.project.disconnect(signal, method)
+
+    def _ensure_built(self):
+        """Rebuild index if marked dirty or subtitles have been replaced."""
+        subtitles = self.project.subtitles
+        if (self._dirty or
+            subtitles is not self._subtitles or
+            len(subtitles) != len(self._ends)):
+            self.rebuild()
+
+    def _find_last(self, tree, limit, match):
+        """Return last sorted position up to `limit` with leaf matching."""
+        return self._find_last_in(tree, 1, 0, self._size - 1, limit, match)
+
+    def _find_last_in(self, tree, node, lo, hi, limit, match):
+        """Return last sorted position up to `limit` below `node` or -1."""
+        if lo > limit or not match(tree[node]): return -1
+        if node >= self._size: return lo
+        mid = (lo + hi) // 2
+        pos = self._find_last_in(tree, 2*node+1, mid+1, hi, limit, match)
+        if pos >= 0: return pos
+        return self._find_last_in(tree, 2*node, lo, mid, limit, match)
+
+    def next_after(self, seconds):
+        """Return index of first subtitle starting after `seconds`."""
+        self._ensure_built()
+        pos = bisect.bisect_right(self._starts, seconds)
+        return self._order[pos] if pos < len(self._order) else None
+
+    def _on_project_main_file_opened(self, *args):
+        """Mark index to be rebuilt."""
+        self._dirty = True
+
+    def _on_project_notify_framerate(self, *args):
+        """Mark index to be rebuilt."""
+        # Seconds of frame positions depend on framerate.
+        self._dirty = True
+
+    def _on_project_positions_changed(self, project, indices):
+        """Update positions at `indices` in place if possible."""
+        if self._dirty: return
+        if len(indices) > max(16, len(self._order) // 8):
+            # Rebuilding is faster than updating many in place.
+            self._dirty = True
+            return
+        for index in indices:
+            if not self._update(index):
+                self._dirty = True
+                return
+
+    def _on_project_subtitles_inserted(self, *args):
+        """Mark index to be rebuilt."""
+        # Following indices shift, which is no faster to update than rebuild.
+        self._dirty = True
+
+    def _on_project_subtitles_removed(self, *args):
+        """Mark index to be rebuilt."""
+        # Following indices shift, which is no faster to update than rebuild.
+        self._dirty = True
+
+    def _on_project_translation_file_opened(self, *args):
+        """Mark index to be rebuilt."""
+        # Aligning translations can insert subtitles with signals blocked.
+        self._dirty = True
+
+    def overlapping(self, start, end):
+        """Return indices of subtitles overlapping `start` to `end`."""
+        self._ensure_built()
+        limit = bisect.bisect_right(self._starts, end) - 1
+        match = lambda x: x >= start
+        result = []
+        self._collect(self._maxs, 1, 0, self._size - 1, limit, match, result)
+        return sorted(self._order[x] for x in result)
+
+    def previous_before(self, seconds):
+        """
+        Return index of last subtitle ending before `seconds` or ``None``.
+
+        If multiple subtitles end before `seconds`, return the one that
+        starts last.
+        """
+        self._ensure_built()
+        limit = bisect.bisect_left(self._starts, seconds) - 1
+        match = lambda x: x < seconds
+        pos = self._find_last(self._mins, limit, match)
+        return self._order[pos] if pos >= 0 else None
+
+    def rebuild(self):
+        """Build index from current positions of all subtitles."""
+        subtitles = self.project.subtitles
+        starts = [x.start_seconds for x in subtitles]
+        self._ends = [x.end_seconds for x in subtitles]
+        # Stable sort, subtitles starting at the same time stay in order.
+        self._order = sorted(range(len(starts)), key=starts.__getitem__)
+        self._ranks = [0] * len(starts)
+        for pos, index in enumerate(self._order):
+            self._ranks[index] = pos
+        self._starts = [starts[x] for x in self._order]
+        self._size = 1 << max(0, len(starts) - 1).bit_length()
+        leaves = [self._ends[x] for x in self._order]
+        self._maxs = self._build_tree(leaves, -math.inf, max)
+        self._mins = self._build_tree(leaves, math.inf, min)
+        self._subtitles = subtitles
+        self._dirty = False
+
+    def _update(self, index):
+        """
+        Update positions of subtitle at `index` in place.
+
+        Return ``False`` if not possible due to the order changing.
+        """
+        subtitle = self.project.subtitles[index]
+        start = subtitle.start_seconds
+        pos = self._ranks[index]
+        if pos > 0 and ((self._starts[pos-1], self._order[pos-1]) >
+                        (start, index)): return False
+        if (pos < len(self._starts) - 1 and
+            (start, index) > (self._starts[pos+1], self._order[pos+1])):
+            return False
+        self._starts[pos] = start
+        self._ends[index] = end = subtitle.end_seconds
+        node = self._size + pos
+        self._maxs[node] = self._mins[node] = end
+        while node > 1:
+            node //= 2
+            self._maxs[node] = max(self._maxs[2*node], self._maxs[2*node+1])
+            self._mins[node] = min(self._mins[2*node], self._mins[2*node+1])
+        return True
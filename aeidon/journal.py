@@ -0,0 +1,392 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""Crash-recovery journal of changes to a project."""
+
+import aeidon
+import json
+import os
+import shutil
+
+from pathlib import Path
+
+class Journal:
+
+    """
+    Crash-recovery journal of changes to a project.
+
+    :ivar compact_limit: Amount of records after which to write a snapshot
+    :ivar directory: Path to directory of snapshot and journal files
+    :ivar project: :class:`aeidon.Project` instance journaled
+
+    Changes are recorded using project signals as indices and new values,
+    collected into one record per action done, undone or redone. Records are
+    kept in memory until :meth:`flush` appends them to the journal file,
+    which costs relative to the size of the changes, not the project, and can
+    thus be called often, e.g. every few seconds. Once the journal grows to
+    :attr:`compact_limit` records, it is compacted into a snapshot of the
+    whole project. After opening or saving files, the journal is restarted
+    from a snapshot once the project has unsaved changes. Until then there is
+    nothing to recover and no files are kept.
+
+    After a crash, :meth:`restore` reads the snapshot, replays the journal
+    and continues journaling into the same directory. Changes made directly
+    to subtitles, bypassing project methods, are not recorded.
+    """
+
+    _signals = (
+        "action-done",
+        "action-redone",
+        "action-undone",
+        "main-file-opened",
+        "main-file-saved",
+        "main-texts-changed",
+        "notify::framerate",
+        "positions-changed",
+        "subtitles-changed",
+        "subtitles-inserted",
+        "subtitles-removed",
+        "translation-file-opened",
+        "translation-file-saved",
+        "translation-texts-changed",
+    )
+
+    def __init__(self, project, directory):
+        """Initialize a :class:`Journal` instance."""
+        self._count = 0
+        self._generation = None
+        self._ops = []
+        self._records = []
+        self._snapshot_needed = False
+        self.compact_limit = 1000
+        self.directory = Path(directory)
+        self.project = project
+        for signal in self._signals:
+            aeidon.util.connect(self, "project", signal)
+
+    def _apply(self, subtitles, framerate, op):
+        """Apply `op` to `subtitles` and return framerate."""
+        name, *args = op
+        if name == "framerate":
+            framerate = aeidon.framerates.find_item("name", args[0])
+            for subtitle in subtitles:
+                subtitle.framerate = framerate
+        if name == "insert":
+            for index, row in sorted(zip(*args)):
+                subtitles.insert(index, self._new_subtitle(row, framerate))
+        if name == "main":
+            for index, text in zip(*args):
+                subtitles[index].main_text = text
+        if name == "positions":
+            for index, (mode, start, end) in zip(*args):
+                subtitles[index].mode = aeidon.modes.find_item("name", mode)
+                subtitles[index]._start = start
+                subtitles[index]._end = end
+                subtitles[index]._start_time = None
+                subtitles[index]._end_time = None
+        if name == "remove":
+            for index in sorted(args[0], reverse=True):
+                del subtitles[index]
+        if name == "subtitles":
+            for index, row in zip(*args):
+                subtitles[index] = self._new_subtitle(row, framerate)
+        if name == "tran":
+            for index, text in zip(*args):
+                subtitles[index].tran_text = text
+        return framerate
+
+    def compact(self):
+        """
+        Write a snapshot of the whole project and empty the journal.
+
+        Raise :exc:`OSError` if writing fails.
+        """
+        aeidon.util.makedirs(self.directory)
+        generation = (self._generation or 0) + 1
+        snapshot = {
+            "framerate": self.project.framerate.name,
+            "generation": generation,
+            "main_changed": self.project.main_changed,
+            "main_file": self._get_file_state(self.project.main_file),
+            "subtitles": list(map(self._get_row, self.project.subtitles)),
+            "tran_changed": self.project.tran_changed,
+            "tran_file": self._get_file_state(self.project.tran_file),
+        }
+        # The snapshot replaces journal records of earlier generations.
+        # If interrupted before the journal is emptied, those records are
+        # skipped on restore, as they don't match the snapshot generation.
+        with aeidon.util.atomic_open(self._snapshot_path,
+                                     "w",
+                                     encoding="utf_8") as f:
+            json.dump(snapshot, f, ensure_ascii=False)
+        with aeidon.util.atomic_open(self._journal_path,
+                                     "w",
+                                     encoding="utf_8") as f:
+            f.write(json.dumps({"generation": generation}) + "\n")
+        self._count = 0
+        self._generation = generation
+        self._ops = []
+        self._records = []
+        self._snapshot_needed = False
+
+    def detach(self):
+        """Stop following changes in project."""
+        for signal in self._signals:
+            name = signal.replace("-", "_").replace("::", "_")
+            method = getattr(self, f"_on_project_{name}")
+            self.project.disconnect(signal, method)
+
+    def _discard(self):
+        """Remove snapshot and journal files and pending records."""
+        if self._generation is not None:
+            # Without a snapshot the journal is ignored on restore.
+            self._snapshot_path.unlink(missing_ok=True)
+            self._journal_path.unlink(missing_ok=True)
+        self._count = 0
+        self._generation = None
+        self._records = []
+        self._snapshot_needed = False
+
+    def _end_record(self):
+        """Collect operations recorded so far into one record."""
+        if not self._ops: return
+        self._records.append({
+            "main_changed": self.project.main_changed,
+            "ops": self._ops,
+            "tran_changed": self.project.tran_changed,
+        })
+        self._ops = []
+
+    def flush(self):
+        """
+        Append records of changes to the journal file.
+
+        Raise :exc:`OSError` if writing fails.
+        """
+        self._end_record()
+        if self._generation is None or self._snapshot_needed:
+            if not (self.project.main_changed or self.project.tran_changed):
+                # Files match the project, nothing to recover.
+                return self._discard()
+            # A snapshot includes all changes.
+            return self.compact()
+        if not self._records: return
+        text = "".join(json.dumps(x, ensure_ascii=False) + "\n"
+                       for x in self._records)
+        with open(self._journal_path, "a", encoding="utf_8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        self._count += len(self._records)
+        self._records = []
+        if self._count >= self.compact_limit:
+            self.compact()
+
+    def _get_file_state(self, file):
+        """Return properties of `file` needed to recreate it."""
+        if file is None: return None
+        return {
+            "encoding": file.encoding,
+            "format": file.format.name,
+            "has_utf_16_bom": file.has_utf_16_bom,
+            "header": file.header,
+            "newline": file.newline.name,
+            "path": str(file.path),
+        }
+
+    def _get_row(self, subtitle):
+        """Return values of `subtitle` as a list."""
+        row = [subtitle.mode.name,
+               subtitle._start,
+               subtitle._end,
+               subtitle.main_text,
+               subtitle.tran_text]
+
+        containers = {}
+        for name in aeidon.containers.NAMES:
+            if subtitle.has_container(name):
+                values = vars(getattr(subtitle, name))
+                if values:
+                    containers[name] = dict(values)
+        if containers:
+            row.append(containers)
+        return row
+
+    def _get_rows(self, indices):
+        """Return values of subtitles at `indices` as lists."""
+        return [self._get_row(self.project.subtitles[i]) for i in indices]
+
+    @property
+    def _journal_path(self):
+        return self.directory / "journal.jsonl"
+
+    def _new_file(self, state):
+        """Return a new :class:`aeidon.SubtitleFile` from `state`."""
+        if state is None: return None
+        format = aeidon.formats.find_item("name", state["format"])
+        newline = aeidon.newlines.find_item("name", state["newline"])
+        file = aeidon.files.new(format,
+                                state["path"],
+                                state["encoding"],
+                                newline)
+
+        file.has_utf_16_bom = state["has_utf_16_bom"]
+        file.header = state["header"]
+        return file
+
+    def _new_subtitle(self, row, framerate):
+        """Return a new subtitle from values in `row`."""
+        mode = aeidon.modes.find_item("name", row[0])
+        subtitle = aeidon.Subtitle(mode, framerate)
+        subtitle._start = row[1]
+        subtitle._end = row[2]
+        subtitle.main_text = row[3]
+        subtitle.tran_text = row[4]
+        for name, values in (row[5] if len(row) > 5 else {}).items():
+            container = getattr(subtitle, name)
+            for key, value in values.items():
+                setattr(container, key, value)
+        return subtitle
+
+    def _on_project_action_done(self, *args):
+        """End record of changes made by the action."""
+        self._end_record()
+
+    def _on_project_action_redone(self, *args):
+        """End record of changes made by the action."""
+        self._end_record()
+
+    def _on_project_action_undone(self, *args):
+        """End record of changes made by the action."""
+        self._end_record()
+
+    def _on_project_main_file_opened(self, *args):
+        """Mark journal to be restarted on the next flush."""
+        self._snapshot_needed = True
+
+    def _on_project_main_file_saved(self, *args):
+        """Mark journal to be restarted on the next flush."""
+        self._snapshot_needed = True
+
+    def _on_project_main_texts_changed(self, project, indices):
+        """Record new main texts at `indices`."""
+        indices = list(indices)
+        texts = [self.project.subtitles[i].main_text for i in indices]
+        self._ops.append(["main", indices, texts])
+
+    def _on_project_notify_framerate(self, *args):
+        """Record new framerate."""
+        self._ops.append(["framerate", self.project.framerate.name])
+
+    def _on_project_positions_changed(self, project, indices):
+        """Record new positions at `indices`."""
+        indices = list(indices)
+        positions = [[x.mode.name, x._start, x._end] for x in
+                     (self.project.subtitles[i] for i in indices)]
+        self._ops.append(["positions", indices, positions])
+
+    def _on_project_subtitles_changed(self, project, indices):
+        """Record new subtitles at `indices`."""
+        indices = list(indices)
+        self._ops.append(["subtitles", indices, self._get_rows(indices)])
+
+    def _on_project_subtitles_inserted(self, project, indices):
+        """Record subtitles inserted at `indices`."""
+        indices = list(indices)
+        self._ops.append(["insert", indices, self._get_rows(indices)])
+
+    def _on_project_subtitles_removed(self, project, indices):
+        """Record removal of subtitles at `indices`."""
+        self._ops.append(["remove", list(indices)])
+
+    def _on_project_translation_file_opened(self, *args):
+        """Mark journal to be restarted on the next flush."""
+        self._snapshot_needed = True
+
+    def _on_project_translation_file_saved(self, *args):
+        """Mark journal to be restarted on the next flush."""
+        self._snapshot_needed = True
+
+    def _on_project_translation_texts_changed(self, project, indices):
+        """Record new translation texts at `indices`."""
+        indices = list(indices)
+        texts = [self.project.subtitles[i].tran_text for i in indices]
+        self._ops.append(["tran", indices, texts])
+
+    def _read_records(self, generation):
+        """Return records in journal file of snapshot `generation`."""
+        if not self._journal_path.is_file(): return []
+        with open(self._journal_path, "r", encoding="utf_8") as f:
+            lines = f.readlines()
+        if not lines or not lines[0].endswith("\n"): return []
+        if json.loads(lines[0]).get("generation") != generation: return []
+        records = []
+        for line in lines[1:]:
+            # A crash while appending can leave the last line incomplete.
+            if not line.endswith("\n"): break
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                break
+        return records
+
+    def remove(self):
+        """Stop following changes in project and remove files."""
+        self.detach()
+        self._ops = []
+        self._records = []
+        self._snapshot_needed = False
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def restore(self):
+        """
+        Restore project from snapshot and journal files.
+
+        Return ``False`` if no snapshot found or the journaled project has no
+        unsaved changes, else ``True``.
+        Raise :exc:`OSError` if reading or writing fails.
+        Raise :exc:`ValueError` if snapshot is invalid.
+        """
+        if not self._snapshot_path.is_file(): return False
+        text = self._snapshot_path.read_text(encoding="utf_8")
+        snapshot = json.loads(text)
+        framerate = aeidon.framerates.find_item("name", snapshot["framerate"])
+        subtitles = [self._new_subtitle(x, framerate)
+                     for x in snapshot["subtitles"]]
+        main_changed = snapshot["main_changed"]
+        tran_changed = snapshot["tran_changed"]
+        for record in self._read_records(snapshot["generation"]):
+            for op in record["ops"]:
+                framerate = self._apply(subtitles, framerate, op)
+            main_changed = record["main_changed"]
+            tran_changed = record["tran_changed"]
+        if not (main_changed or tran_changed): return False
+        self._generation = snapshot["generation"]
+        self.project.framerate = framerate
+        self.project.calc = aeidon.Calculator(framerate)
+        self.project.main_file = self._new_file(snapshot["main_file"])
+        self.project.tran_file = self._new_file(snapshot["tran_file"])
+        self.project.subtitles = subtitles
+        self.project.main_changed = main_changed
+        self.project.tran_changed = tran_changed
+        # Fold replayed records into a new snapshot.
+        self.compact()
+        return True
+
+    @property
+    def _snapshot_path(self):
+        return self.directory / "snapshot.json"
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Reading multiple subtitle files in parallel.
+
+Parsing is CPU-bound and holds the GIL, so files are parsed in worker
+processes. Parsed files are returned from workers as built-in types using
+:func:`aeidon.cache.pack`, which are much faster to pass between processes
+than subtitle objects.
+
+Worker processes are started with the "spawn" method, which runs the main
+module of the program again in the workers, unless guarded with ``if
+__name__ == "__main__"``.
+
+Starting a worker process and importing aeidon in it takes a few hundred
+milliseconds, which is more than parsing a typical subtitle file takes, so
+processes are only used if there's enough data to read for each of them.
+"""
+
+import aeidon
+import concurrent.futures
+import multiprocessing
+import os
+import sys
+
+from pathlib import Path
+
+# Minimum amount of bytes to read per worker process,
+# below which starting the process is slower than reading.
+_WORKER_SIZE = 2 * 1024**2
+
+def _get_size(path):
+    """Return size of file at `path` in bytes or zero if unavailable."""
+    try:
+        return Path(path).stat().st_size
+    except OSError:
+        # Let reading raise the error.
+        return 0
+
+def _open(path, encodings, cache):
+    """Return file, sorted subtitles and sort count for `path`."""
+    data = Path(path).read_bytes()
+    project = aeidon.Project()
+    for encoding in encodings:
+        if encoding == "auto":
+            encoding = aeidon.encodings.detect(path, data, sample=True)
+            if encoding is None: continue
+        try:
+            sort_count = project.open_main(path, encoding, data, cache)
+        except UnicodeError:
+            continue
+        return project.main_file, project.subtitles, sort_count
+    raise UnicodeError(f"Failed to decode {str(path)!r}")
+
+def _read(path, encodings, cache):
+    """Return file at `path` read in a worker process as built-in types."""
+    return aeidon.cache.pack(*_open(path, encodings, cache))
+
+def read_main(paths, encodings, cache=False, max_workers=None):
+    """
+    Read and parse main files at `paths` in parallel.
+
+    `encodings` is a sequence of encodings to try in order, which can include
+    "auto" to detect the encoding. `cache` can be ``True`` to use
+    :mod:`aeidon.cache`. `max_workers` can be ``None`` to use as many worker
+    processes as there are CPUs, up to the amount of files.
+
+    Iterate over tuples of path and either a tuple of file, sorted subtitles
+    and sort count or the exception raised while reading, in the order of
+    `paths`, each as soon as it and those before it are done. Files are read
+    in the current process if there is too little to read to benefit from
+    multiple processes or processes can't be used.
+    """
+    paths = list(paths)
+    encodings = tuple(encodings)
+    size = sum(map(_get_size, paths))
+    max_workers = min(max_workers or os.cpu_count() or 1,
+                      size // _WORKER_SIZE,
+                      len(paths))
+
+    # A frozen installation can't start itself again as a worker.
+    if max_workers < 2 or hasattr(sys, "frozen"):
+        for path in paths:
+            try:
+                yield path, _open(path, encodings, cache)
+            except Exception as error:
+                yield path, error
+        return
+    context = multiprocessing.get_context("spawn")
+    executor = concurrent.futures.ProcessPoolExecutor(max_workers,
+                                                      mp_context=context)
+
+    try:
+        futures = [executor.submit(_read, str(x), encodings, cache)
+                   for x in paths]
+        for path, future in zip(paths, futures):
+            try:
+                data = future.result()
+            except Exception as error:
+                yield path, error
+                continue
+            yield path, aeidon.cache.unpack(path, data)
+    finally:
+        # Files not yet read are no longer needed if iteration stops early.
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -63,6 +63,11 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
     :ivar main_file: Main instance of :class:`aeidon.SubtitleFile`
     :ivar redoables: Stack of :class:`aeidon.RevertableAction` instances
     :ivar subtitles: List of :class:`aeidon.Subtitle` instances
+
+       If the project was created with ``columnar=True``, this is instead
+       a :class:`aeidon.SubtitleTable`, which uses much less memory per
+       subtitle. Any list assigned to :attr:`subtitles` is converted.
+
     :ivar tran_changed: Integer, status of translation document
 
        At unchanged state (i.e. file on disk corresponds to the state of the
@@ -106,12 +111,13 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
         "translation-texts-changed",
     )
 
-    def __init__(self, framerate=None):
+    def __init__(self, framerate=None, columnar=False):
         """Initialize a :class:`Project` instance."""
         aeidon.Observable.__init__(self)
         framerate = framerate or aeidon.framerates.FPS_23_976
         self.calc = aeidon.Calculator(framerate)
         self.clipboard = aeidon.Clipboard()
+        self._columnar = columnar
         self._delegations = {}
         self.framerate = framerate
         self.main_changed = 0
@@ -152,3 +158,17 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
                 # Remove class-level function added by ProjectMeta.
                 if hasattr(self.__class__, attr_name):
                     delattr(self.__class__, attr_name)
+
+    def _validate(self, name, value):
+        """Return `value` or an observable version if `value` is mutable."""
+        if name == "subtitles" and self._columnar:
+            if isinstance(value, aeidon.SubtitleTable):
+                value.master = self
+                value.name = name
+                return value
+            return aeidon.SubtitleTable(value,
+                                        framerate=self.framerate,
+                                        master=self,
+                                        name=name)
+
+        return aeidon.Observable._validate(self, name, value)
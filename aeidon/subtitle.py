@@ -18,7 +18,19 @@
 """Data store and basic position manipulation of a single subtitle."""
 
 import aeidon
-import copy
+
+def _container_property(name):
+    """Return a property for lazily instantiated container `name`."""
+    slot = f"_{name}"
+    def get(self):
+        container = getattr(self, slot)
+        if container is None:
+            container = aeidon.containers.new(name)
+            setattr(self, slot, container)
+        return container
+    def set(self, value):
+        setattr(self, slot, value)
+    return property(get, set, doc=f"Return {name} container.")
 
 class Subtitle:
 
@@ -47,43 +59,66 @@ class Subtitle:
     Use :func:`aeidon.as_time`, :func:`aeidon.as_frame` or
     :func:`aeidon.as_seconds` if necessary to ensure correct type.
 
+    Positions are stored internally as integers, milliseconds in time mode
+    and frames in frame mode, to avoid parsing and formatting time strings
+    in arithmetic and comparisons. Time strings are produced lazily and
+    cached until the corresponding position changes.
+
     Additional format-specific attributes are kept under separate containers,
     e.g. ``ssa`` for Sub Station Alpha formats, accessed as ``subtitle.ssa.*``.
     These containers are lazily created upon first use in order to avoid slow
     instantiation and excessive memory use when handling simpler formats.
+
+    To keep memory use low with large amounts of subtitles, attributes are
+    stored in slots and arbitrary attributes cannot be set. `calc` should be
+    passed when creating many subtitles with the same framerate, e.g. from
+    :attr:`aeidon.Project.calc`, to share the same calculator instance.
     """
 
-    def __init__(self, mode=None, framerate=None):
+    __slots__ = (
+        "_end",
+        "_end_time",
+        "_framerate",
+        "_main_text",
+        "_mode",
+        "_ssa",
+        "_start",
+        "_start_time",
+        "_subrip",
+        "_tran_text",
+        "_webvtt",
+        "calc",
+    )
+
+    ssa = _container_property("ssa")
+    subrip = _container_property("subrip")
+    webvtt = _container_property("webvtt")
+
+    def __init__(self, mode=None, framerate=None, calc=None):
         """Initialize a :class:`Subtitle` instance."""
-        self._start = None
-        self._end = None
+        self._start = 0
+        self._end = 0
+        self._start_time = None
+        self._end_time = None
         self._main_text = ""
         self._tran_text = ""
         self._mode = mode or aeidon.modes.TIME
         self._framerate = framerate or aeidon.framerates.FPS_23_976
-        self.calc = aeidon.Calculator(self._framerate)
-        self.start = "00:00:00.000"
-        self.end = "00:00:00.000"
+        self._ssa = None
+        self._subrip = None
+        self._webvtt = None
+        self.calc = calc or aeidon.Calculator(self._framerate)
 
     def __eq__(self, other):
         """Compare subtitle equality by value."""
         if not isinstance(other, Subtitle):
             raise NotImplementedError
-        return (self.start == other.start and
-                self.end == other.end and
+        return (self._mode == other._mode and
+                self._start == other._start and
+                self._end == other._end and
                 self.main_text == other.main_text and
                 self.tran_text == other.tran_text and
-                self.framerate == other.framerate and
-                self.mode == other.mode)
-
-    def __getattr__(self, name):
-        """Return lazily instantiated format-specific attribute container."""
-        if name in (x.container for x in aeidon.formats):
-            # Lazily instantiate a new container.
-            container = aeidon.containers.new(name)
-            object.__setattr__(self, name, container)
-            return container
-        raise AttributeError(f"Invalid container name: {name!r}")
+                self.framerate == other.framerate)
 
     def __ge__(self, other):
         """Compare start positions."""
@@ -117,6 +152,14 @@ class Subtitle:
             return self.start_frame < other.start_frame
         raise ValueError(f"Invalid mode: {self._mode!r}")
 
+    def _add(self, pos, value):
+        """Return native `pos` with position `value` added."""
+        if self._mode == aeidon.modes.TIME and not aeidon.is_time(value):
+            # Round the sum, not the parts, to match Calculator.add.
+            seconds = pos / 1000 + self.calc.to_seconds(value)
+            return self.calc.seconds_to_milliseconds(seconds)
+        return pos + self._convert_position(value)
+
     def convert_framerate(self, framerate):
         """Set framerate and convert positions to it."""
         coefficient = framerate.value / self._framerate.value
@@ -129,36 +172,38 @@ class Subtitle:
         self.framerate = framerate
 
     def _convert_position(self, value):
-        """Return `value` of position in correct mode."""
+        """Return `value` of position as an integer in native units."""
         if aeidon.is_time(value):
             if self._mode == aeidon.modes.TIME:
-                return value
+                return self.calc.time_to_milliseconds(value)
             if self._mode == aeidon.modes.FRAME:
                 return self.calc.time_to_frame(value)
         if aeidon.is_frame(value):
             if self._mode == aeidon.modes.TIME:
-                return self.calc.frame_to_time(value)
+                return self.calc.frame_to_milliseconds(value)
             if self._mode == aeidon.modes.FRAME:
                 return value
         if aeidon.is_seconds(value):
             if self._mode == aeidon.modes.TIME:
-                return self.calc.seconds_to_time(value)
+                return self.calc.seconds_to_milliseconds(value)
             if self._mode == aeidon.modes.FRAME:
                 return self.calc.seconds_to_frame(value)
         raise ValueError(f"Invalid type for value: {type(value)!r}")
 
     def copy(self):
         """Return a new subtitle instance with the same values."""
-        subtitle = Subtitle(self._mode, self._framerate)
+        subtitle = Subtitle(self._mode, self._framerate, self.calc)
         subtitle._start = self._start
         subtitle._end = self._end
+        subtitle._start_time = self._start_time
+        subtitle._end_time = self._end_time
         subtitle._main_text = self._main_text
         subtitle._tran_text = self._tran_text
-        # Copy all containers that have been instantiated.
-        containers = (x.container for x in aeidon.formats)
-        for name in set(dir(self)) & set(containers):
-            container = copy.deepcopy(getattr(self, name))
-            setattr(subtitle, name, container)
+        # Copy all containers that have been instantiated,
+        # values are shared until either copy is written to.
+        for name in aeidon.containers.NAMES:
+            if not self.has_container(name): continue
+            setattr(subtitle, name, getattr(self, name).copy())
         return subtitle
 
     @property
@@ -173,8 +218,8 @@ class Subtitle:
     @duration.setter
     def duration(self, value):
         """Set duration from `value`."""
-        value = self._convert_position(value)
-        self._end = self.calc.add(self._start, value)
+        self._end = self._add(self._start, value)
+        self._end_time = None
 
     @property
     def duration_frame(self):
@@ -189,6 +234,8 @@ class Subtitle:
     @property
     def duration_seconds(self):
         """Return duration as seconds."""
+        if self._mode == aeidon.modes.TIME:
+            return (self._end - self._start) / 1000
         return self.end_seconds - self.start_seconds
 
     @duration_seconds.setter
@@ -199,6 +246,8 @@ class Subtitle:
     @property
     def duration_time(self):
         """Return duration as time."""
+        if self._mode == aeidon.modes.TIME:
+            return self.calc.milliseconds_to_time(self._end - self._start)
         return self.calc.seconds_to_time(self.duration_seconds)
 
     @duration_time.setter
@@ -209,18 +258,23 @@ class Subtitle:
     @property
     def end(self):
         """Return end position in correct mode."""
-        return self._end
+        if self._mode == aeidon.modes.TIME:
+            return self.end_time
+        if self._mode == aeidon.modes.FRAME:
+            return self._end
+        raise ValueError(f"Invalid mode: {self._mode!r}")
 
     @end.setter
     def end(self, value):
         """Set end position from `value`."""
         self._end = self._convert_position(value)
+        self._end_time = None
 
     @property
     def end_frame(self):
         """Return end position as frames."""
         if self._mode == aeidon.modes.TIME:
-            return self.calc.time_to_frame(self._end)
+            return self.calc.milliseconds_to_frame(self._end)
         if self._mode == aeidon.modes.FRAME:
             return self._end
         raise ValueError(f"Invalid mode: {self._mode!r}")
@@ -233,7 +287,11 @@ class Subtitle:
     @property
     def end_seconds(self):
         """Return end position as seconds."""
-        return self.calc.time_to_seconds(self.end_time)
+        if self._mode == aeidon.modes.TIME:
+            return self._end / 1000
+        if self._mode == aeidon.modes.FRAME:
+            return self.calc.frame_to_milliseconds(self._end) / 1000
+        raise ValueError(f"Invalid mode: {self._mode!r}")
 
     @end_seconds.setter
     def end_seconds(self, value):
@@ -243,11 +301,10 @@ class Subtitle:
     @property
     def end_time(self):
         """Return end position as time."""
-        if self._mode == aeidon.modes.TIME:
-            return self._end
-        if self._mode == aeidon.modes.FRAME:
-            return self.calc.frame_to_time(self._end)
-        raise ValueError(f"Invalid mode: {self._mode!r}")
+        time = self._end_time
+        if time is None:
+            time = self._end_time = self._get_time(self._end)
+        return time
 
     @end_time.setter
     def end_time(self, value):
@@ -262,8 +319,13 @@ class Subtitle:
     @framerate.setter
     def framerate(self, value):
         """Set framerate from `value`."""
+        if value == self._framerate: return
         self._framerate = value
         self.calc = aeidon.Calculator(value)
+        if self._mode == aeidon.modes.FRAME:
+            # Times of frames depend on framerate.
+            self._start_time = None
+            self._end_time = None
 
     def get_duration(self, mode):
         """Return duration in `mode`."""
@@ -297,9 +359,17 @@ class Subtitle:
             return self._tran_text
         raise ValueError(f"Invalid document: {doc!r}")
 
+    def _get_time(self, pos):
+        """Return native `pos` as time."""
+        if self._mode == aeidon.modes.TIME:
+            return self.calc.milliseconds_to_time(pos)
+        if self._mode == aeidon.modes.FRAME:
+            return self.calc.frame_to_time(pos)
+        raise ValueError(f"Invalid mode: {self._mode!r}")
+
     def has_container(self, name):
         """Return ``True`` if container has been instantiated."""
-        return name in dir(self)
+        return getattr(self, f"_{name}", None) is not None
 
     @property
     def main_text(self):
@@ -319,19 +389,22 @@ class Subtitle:
     @mode.setter
     def mode(self, mode):
         """Set current position mode."""
+        if mode == self._mode: return
         if mode == aeidon.modes.TIME:
-            self._start = self.start_time
-            self._end = self.end_time
+            self._start = self.calc.frame_to_milliseconds(self._start)
+            self._end = self.calc.frame_to_milliseconds(self._end)
         if mode == aeidon.modes.FRAME:
-            self._start = self.start_frame
-            self._end = self.end_frame
+            self._start = self.calc.milliseconds_to_frame(self._start)
+            self._end = self.calc.milliseconds_to_frame(self._end)
+        self._start_time = None
+        self._end_time = None
         self._mode = mode
 
     def scale_positions(self, value):
         """Multiply start and end positions by `value`."""
         if self._mode == aeidon.modes.TIME:
-            self.start_seconds = self.start_seconds * value
-            self.end_seconds = self.end_seconds * value
+            self.start_seconds = self._start / 1000 * value
+            self.end_seconds = self._end / 1000 * value
         if self._mode == aeidon.modes.FRAME:
             self.start_frame = round(self._start * value)
             self.end_frame = round(self._end * value)
@@ -345,24 +418,31 @@ class Subtitle:
 
     def shift_positions(self, value):
         """Add `value` to start and end positions."""
-        self._start = self.calc.add(self._start, value)
-        self._end = self.calc.add(self._end, value)
+        self._start = self._add(self._start, value)
+        self._end = self._add(self._end, value)
+        self._start_time = None
+        self._end_time = None
 
     @property
     def start(self):
         """Return start position in correct mode."""
-        return self._start
+        if self._mode == aeidon.modes.TIME:
+            return self.start_time
+        if self._mode == aeidon.modes.FRAME:
+            return self._start
+        raise ValueError(f"Invalid mode: {self._mode!r}")
 
     @start.setter
     def start(self, value):
         """Set start position from `value`."""
         self._start = self._convert_position(value)
+        self._start_time = None
 
     @property
     def start_frame(self):
         """Return start position as frames."""
         if self._mode == aeidon.modes.TIME:
-            return self.calc.time_to_frame(self._start)
+            return self.calc.milliseconds_to_frame(self._start)
         if self._mode == aeidon.modes.FRAME:
             return self._start
         raise ValueError(f"Invalid mode: {self._mode!r}")
@@ -375,7 +455,11 @@ class Subtitle:
     @property
     def start_seconds(self):
         """Return start position as seconds."""
-        return self.calc.time_to_seconds(self.start_time)
+        if self._mode == aeidon.modes.TIME:
+            return self._start / 1000
+        if self._mode == aeidon.modes.FRAME:
+            return self.calc.frame_to_milliseconds(self._start) / 1000
+        raise ValueError(f"Invalid mode: {self._mode!r}")
 
     @start_seconds.setter
     def start_seconds(self, value):
@@ -385,11 +469,10 @@ class Subtitle:
     @property
     def start_time(self):
         """Return start position as time."""
-        if self._mode == aeidon.modes.TIME:
-            return self._start
-        if self._mode == aeidon.modes.FRAME:
-            return self.calc.frame_to_time(self._start)
-        raise ValueError(f"Invalid mode: {self._mode!r}")
+        time = self._start_time
+        if time is None:
+            time = self._start_time = self._get_time(self._start)
+        return time
 
     @start_time.setter
     def start_time(self, value):
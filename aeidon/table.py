@@ -0,0 +1,412 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""Columnar storage of subtitle data."""
+
+import aeidon
+import array
+import collections.abc
+import functools
+
+def _container_column(name):
+    """Return a property for container `name` of a :class:`SubtitleRow`."""
+    def get(self):
+        containers = self._table._containers[self._row]
+        return None if containers is None else containers.get(name)
+    def set(self, value):
+        containers = self._table._containers[self._row]
+        if containers is None:
+            containers = self._table._containers[self._row] = {}
+        containers[name] = value
+    return property(get, set)
+
+def _mutation(function):
+    """Decorator for sending a notification after mutating table."""
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        value = function(*args, **kwargs)
+        if args[0].master is not None:
+            args[0].master.notify(args[0].name)
+        return value
+    return wrapper
+
+class SubtitleRow(aeidon.Subtitle):
+
+    """
+    View of a single row in a :class:`SubtitleTable`.
+
+    Positions, texts and format-specific containers are read from and written
+    to the columns of the table. Mode and framerate are shared by all rows of
+    the table and setting either of them on a row sets it for the whole table.
+    Use :meth:`copy` to get a standalone :class:`aeidon.Subtitle`.
+    """
+
+    __slots__ = ("_row", "_table")
+
+    _ssa = _container_column("ssa")
+    _subrip = _container_column("subrip")
+    _webvtt = _container_column("webvtt")
+
+    def __init__(self, table, row):
+        """Initialize a :class:`SubtitleRow` instance."""
+        self._table = table
+        self._row = row
+
+    @property
+    def calc(self):
+        """Return :class:`aeidon.Calculator` instance of table."""
+        return self._table.calc
+
+    @property
+    def _end(self):
+        return self._table._ends[self._row]
+
+    @_end.setter
+    def _end(self, value):
+        self._table._ends[self._row] = value
+
+    @property
+    def _end_time(self):
+        # Rows are transient, cache nothing.
+        return None
+
+    @_end_time.setter
+    def _end_time(self, value):
+        pass
+
+    @property
+    def framerate(self):
+        """Return framerate of table."""
+        return self._table.framerate
+
+    @framerate.setter
+    def framerate(self, value):
+        """Set framerate of table from `value`."""
+        self._table.framerate = value
+
+    @property
+    def _framerate(self):
+        return self._table.framerate
+
+    @property
+    def _main_text(self):
+        return self._table._main_texts[self._row]
+
+    @_main_text.setter
+    def _main_text(self, value):
+        self._table._main_texts[self._row] = value
+
+    @property
+    def mode(self):
+        """Return position mode of table."""
+        return self._table.mode
+
+    @mode.setter
+    def mode(self, mode):
+        """Set position mode of table."""
+        self._table.mode = mode
+
+    @property
+    def _mode(self):
+        return self._table.mode
+
+    @property
+    def _start(self):
+        return self._table._starts[self._row]
+
+    @_start.setter
+    def _start(self, value):
+        self._table._starts[self._row] = value
+
+    @property
+    def _start_time(self):
+        # Rows are transient, cache nothing.
+        return None
+
+    @_start_time.setter
+    def _start_time(self, value):
+        pass
+
+    @property
+    def _tran_text(self):
+        return self._table._tran_texts[self._row]
+
+    @_tran_text.setter
+    def _tran_text(self, value):
+        self._table._tran_texts[self._row] = value
+
+class SubtitleTable(collections.abc.MutableSequence):
+
+    """
+    Columnar storage of subtitle data.
+
+    :ivar calc: :class:`aeidon.Calculator` instance used
+    :ivar framerate: :attr:`aeidon.framerates` item
+    :ivar master: Master instance with a ``notify`` method or ``None``
+    :ivar mode: :attr:`aeidon.modes` item
+    :ivar name: Argument passed when calling :attr:`master`'s ``notify`` method
+
+    :class:`SubtitleTable` is a drop-in replacement for a list of
+    :class:`aeidon.Subtitle` instances. Start and end positions are kept in
+    integer arrays, as milliseconds in time mode and frames in frame mode,
+    and texts and format-specific containers in lists. Items are returned as
+    :class:`SubtitleRow` views, which read and write the columns. Inserted
+    subtitles are copied into the columns and removed subtitles are returned
+    as standalone :class:`aeidon.Subtitle` instances.
+
+    Columns are indexed by row ids, which don't change when other rows are
+    inserted or removed, so row views remain valid across such changes. Ids
+    of removed rows are never reused, so a view of a removed row never reads
+    or writes another row. Their values are released, but their slots of a
+    few dozen bytes in the columns remain for the life of the table.
+    """
+
+    def __init__(self, subtitles=(), mode=None, framerate=None,
+                 master=None, name=None):
+        """Initialize a :class:`SubtitleTable` instance."""
+        subtitles = list(subtitles)
+        if mode is None and subtitles:
+            mode = subtitles[0].mode
+        self._containers = []
+        self._ends = array.array("q")
+        self._main_texts = []
+        self._mode = mode or aeidon.modes.TIME
+        self._rows = array.array("q")
+        self._starts = array.array("q")
+        self._tran_texts = []
+        self.framerate = framerate or aeidon.framerates.FPS_23_976
+        self.master = master
+        self.name = name
+        self._rows.extend(map(self._new_row, subtitles))
+
+    @_mutation
+    def __delitem__(self, index):
+        """Remove row at `index`."""
+        if isinstance(index, slice):
+            for row in self._rows[index]:
+                self._free_row(row)
+        else:
+            self._free_row(self._rows[index])
+        del self._rows[index]
+
+    def __eq__(self, other):
+        """Compare rows by value with a sequence of subtitles."""
+        if not isinstance(other, collections.abc.Sequence):
+            return NotImplemented
+        return (len(self) == len(other) and
+                all(x == y for x, y in zip(self, other)))
+
+    def __getitem__(self, index):
+        """Return view of row at `index`."""
+        if isinstance(index, slice):
+            return [SubtitleRow(self, x) for x in self._rows[index]]
+        return SubtitleRow(self, self._rows[index])
+
+    def __iter__(self):
+        """Iterate over views of all rows."""
+        for row in self._rows:
+            yield SubtitleRow(self, row)
+
+    def __len__(self):
+        """Return the amount of rows."""
+        return len(self._rows)
+
+    @_mutation
+    def __setitem__(self, index, value):
+        """Replace row at `index` with `value`."""
+        if isinstance(index, slice):
+            indices = range(*index.indices(len(self)))
+            value = [self._detach(x) for x in value]
+            if index.step in (None, 1):
+                del self[index]
+                for i, subtitle in enumerate(value):
+                    self.insert(indices.start + i, subtitle)
+                return
+            if len(indices) != len(value):
+                raise ValueError(f"Expected {len(indices)} values, "
+                                 f"got {len(value)}")
+            for i, subtitle in zip(indices, value):
+                self[i] = subtitle
+            return
+        row = self._rows[index]
+        if isinstance(value, SubtitleRow):
+            if value._table is self and value._row == row: return
+        self._set_row(row, value)
+
+    @property
+    def calc(self):
+        """Return :class:`aeidon.Calculator` instance used."""
+        return self._calc
+
+    def _detach(self, subtitle):
+        """Return `subtitle` as independent of the rows of this table."""
+        if isinstance(subtitle, SubtitleRow) and subtitle._table is self:
+            return subtitle.copy()
+        return subtitle
+
+    @property
+    def framerate(self):
+        """Return framerate."""
+        return self._framerate
+
+    @framerate.setter
+    def framerate(self, value):
+        """Set framerate from `value`."""
+        # Like with a list of subtitles, positions are not converted.
+        self._framerate = value
+        self._calc = aeidon.Calculator(value)
+
+    def _free_row(self, row):
+        """Release values of removed `row`."""
+        self._containers[row] = None
+        self._main_texts[row] = ""
+        self._tran_texts[row] = ""
+
+    def get_column(self, name, indices=None):
+        """
+        Return values of column `name` at `indices`.
+
+        `name` should be one of "start", "end", "main_text" or "tran_text".
+        `indices` can be ``None`` to return values of all rows. Positions
+        are returned as an integer array in native units, milliseconds in
+        time mode and frames in frame mode, texts as a list.
+        """
+        column = self._get_column(name)
+        rows = (self._rows if indices is None else
+                [self._rows[i] for i in indices])
+        if isinstance(column, array.array):
+            return array.array("q", map(column.__getitem__, rows))
+        return list(map(column.__getitem__, rows))
+
+    def _get_column(self, name):
+        """Return storage of column `name`, indexed by row id."""
+        if name == "start":
+            return self._starts
+        if name == "end":
+            return self._ends
+        if name == "main_text":
+            return self._main_texts
+        if name == "tran_text":
+            return self._tran_texts
+        raise ValueError(f"Invalid column name: {name!r}")
+
+    def _get_subtitle(self, row):
+        """Return a standalone subtitle with values of `row`."""
+        subtitle = aeidon.Subtitle(self._mode, self._framerate)
+        subtitle._start = self._starts[row]
+        subtitle._end = self._ends[row]
+        subtitle._main_text = self._main_texts[row]
+        subtitle._tran_text = self._tran_texts[row]
+        for name, container in (self._containers[row] or {}).items():
+            # Hand over containers as is, like a list would.
+            setattr(subtitle, name, container)
+        return subtitle
+
+    @_mutation
+    def insert(self, index, subtitle):
+        """Insert `subtitle` before `index`."""
+        row = self._new_row(self._detach(subtitle))
+        self._rows.insert(index, row)
+
+    @property
+    def mode(self):
+        """Return position mode."""
+        return self._mode
+
+    @mode.setter
+    def mode(self, mode):
+        """Set position mode and convert positions to it."""
+        if mode == self._mode: return
+        if mode == aeidon.modes.TIME:
+            convert = self._calc.frame_to_milliseconds
+        elif mode == aeidon.modes.FRAME:
+            convert = self._calc.milliseconds_to_frame
+        else:
+            raise ValueError(f"Invalid mode: {mode!r}")
+        self._starts = array.array("q", map(convert, self._starts))
+        self._ends = array.array("q", map(convert, self._ends))
+        self._mode = mode
+
+    def _new_row(self, subtitle):
+        """Store values of `subtitle` in a new row and return row id."""
+        self._containers.append(None)
+        self._ends.append(0)
+        self._main_texts.append("")
+        self._starts.append(0)
+        self._tran_texts.append("")
+        row = len(self._starts) - 1
+        self._set_row(row, subtitle)
+        return row
+
+    @_mutation
+    def pop(self, index=-1):
+        """Remove row at `index` and return it as a standalone subtitle."""
+        row = self._rows.pop(index)
+        subtitle = self._get_subtitle(row)
+        self._free_row(row)
+        return subtitle
+
+    @_mutation
+    def reverse(self):
+        """Reverse the order of rows."""
+        self._rows.reverse()
+
+    def set_column(self, name, values, indices=None):
+        """
+        Set values of column `name` at `indices`.
+
+        `name` should be one of "start", "end", "main_text" or "tran_text".
+        `indices` can be ``None`` to set values of all rows. Positions should
+        be integers in native units, see :meth:`get_column`.
+        """
+        column = self._get_column(name)
+        if indices is None:
+            indices = range(len(self._rows))
+        for index, value in zip(indices, values):
+            column[self._rows[index]] = value
+        if self.master is not None:
+            self.master.notify(self.name)
+
+    def _set_row(self, row, subtitle):
+        """Store values of `subtitle` in `row`."""
+        if subtitle.mode != self._mode:
+            subtitle = subtitle.copy()
+            subtitle.mode = self._mode
+        start, end = subtitle._start, subtitle._end
+        main_text, tran_text = subtitle._main_text, subtitle._tran_text
+        containers = {}
+        for name in aeidon.containers.NAMES:
+            if subtitle.has_container(name):
+                containers[name] = getattr(subtitle, name)
+        self._starts[row] = start
+        self._ends[row] = end
+        self._main_texts[row] = main_text
+        self._tran_texts[row] = tran_text
+        self._containers[row] = containers or None
+
+    @_mutation
+    def sort(self, key=None, reverse=False):
+        """Sort rows by `key` or start position if `key` is ``None``."""
+        if key is None:
+            key = self._starts.__getitem__
+            rows = sorted(self._rows, key=key, reverse=reverse)
+        else:
+            rows = sorted(self._rows,
+                          key=lambda x: key(SubtitleRow(self, x)),
+                          reverse=reverse)
+
+        self._rows = array.array("q", rows)
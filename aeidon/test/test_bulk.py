@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import aeidon
+import pytest
+import random
+
+MODES = [aeidon.modes.TIME, aeidon.modes.FRAME]
+
+class TestModule(aeidon.TestCase):
+
+    @pytest.fixture(autouse=True, params=[False, True], ids=["array", "numpy"])
+    def use_numpy(self, request, monkeypatch):
+        if request.param and not aeidon.util.numpy_available():
+            pytest.skip("numpy not available")
+        monkeypatch.setattr(aeidon.util,
+                            "numpy_available",
+                            lambda: request.param)
+
+    def new_subtitles(self, mode):
+        rng = random.Random(1)
+        subtitles = []
+        for i in range(1000):
+            subtitle = aeidon.Subtitle(mode)
+            # Include values right at rounding halves.
+            subtitle.start = (rng.randint(0, 10**7) if i % 2 else
+                              aeidon.as_seconds(rng.randint(0, 10**6) / 1000))
+            subtitle.end = subtitle.start_frame + rng.randint(0, 100)
+            subtitles.append(subtitle)
+        return subtitles
+
+    def positions(self, subtitles):
+        return ([x._start for x in subtitles],
+                [x._end for x in subtitles])
+
+    @pytest.mark.parametrize("mode", MODES)
+    def test_convert_framerate(self, mode):
+        subtitles = self.new_subtitles(mode)
+        starts, ends = self.positions(subtitles)
+        framerate = aeidon.framerates.FPS_25_000
+        coefficient = framerate.value / subtitles[0].framerate.value
+        for subtitle in subtitles:
+            subtitle.convert_framerate(framerate)
+        starts = aeidon.bulk.convert_framerate(starts, mode, coefficient)
+        ends = aeidon.bulk.convert_framerate(ends, mode, coefficient)
+        assert (list(starts), list(ends)) == self.positions(subtitles)
+
+    @pytest.mark.parametrize("mode", MODES)
+    def test_from_seconds(self, mode):
+        subtitles = self.new_subtitles(mode)
+        seconds = [x.start_seconds * 1.0005 for x in subtitles]
+        for subtitle, value in zip(subtitles, seconds):
+            subtitle.start_seconds = value
+        calc = aeidon.Calculator()
+        starts = aeidon.bulk.from_seconds(seconds, mode, calc)
+        assert list(starts) == self.positions(subtitles)[0]
+
+    @pytest.mark.parametrize("mode", MODES)
+    def test_scale_positions(self, mode):
+        subtitles = self.new_subtitles(mode)
+        starts, ends = self.positions(subtitles)
+        for subtitle in subtitles:
+            subtitle.scale_positions(1.0015)
+        starts = aeidon.bulk.scale_positions(starts, mode, 1.0015)
+        ends = aeidon.bulk.scale_positions(ends, mode, 1.0015)
+        assert (list(starts), list(ends)) == self.positions(subtitles)
+
+    @pytest.mark.parametrize("mode", MODES)
+    @pytest.mark.parametrize("value", ["-00:00:01.500",
+                                       aeidon.as_frame(-13),
+                                       aeidon.as_seconds(0.0125)])
+    def test_shift_positions(self, mode, value):
+        subtitles = self.new_subtitles(mode)
+        starts, ends = self.positions(subtitles)
+        for subtitle in subtitles:
+            subtitle.shift_positions(value)
+        calc = aeidon.Calculator()
+        starts = aeidon.bulk.shift_positions(starts, mode, value, calc)
+        ends = aeidon.bulk.shift_positions(ends, mode, value, calc)
+        assert (list(starts), list(ends)) == self.positions(subtitles)
+
+    @pytest.mark.parametrize("mode", MODES)
+    def test_to_seconds(self, mode):
+        subtitles = self.new_subtitles(mode)
+        calc = aeidon.Calculator()
+        starts = self.positions(subtitles)[0]
+        seconds = aeidon.bulk.to_seconds(starts, mode, calc)
+        assert list(seconds) == [x.start_seconds for x in subtitles]
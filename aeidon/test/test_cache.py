@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import aeidon
+import os
+import pytest
+
+class TestModule(aeidon.TestCase):
+
+    @pytest.fixture(autouse=True)
+    def config_home_dir(self, monkeypatch):
+        directory = aeidon.temp.create_directory()
+        monkeypatch.setattr(aeidon, "CONFIG_HOME_DIR", directory)
+
+    def store(self, format):
+        path = self.new_temp_file(format)
+        key = aeidon.cache.get_key(path, "ascii")
+        project = aeidon.Project()
+        project.open_main(path, "ascii")
+        aeidon.cache.store(key, project.main_file, project.subtitles, 0)
+        return path, project
+
+    @pytest.mark.parametrize("format", aeidon.formats)
+    def test_load(self, format):
+        path, project = self.store(format)
+        key = aeidon.cache.get_key(path, "ascii")
+        file, subtitles, sort_count = aeidon.cache.load(key)
+        assert vars(file).keys() == vars(project.main_file).keys()
+        assert file.format == project.main_file.format
+        assert file.header == project.main_file.header
+        assert file.newline == project.main_file.newline
+        assert file.path == project.main_file.path
+        assert subtitles == project.subtitles
+        for a, b in zip(subtitles, project.subtitles):
+            for name in aeidon.containers.NAMES:
+                assert a.has_container(name) == b.has_container(name)
+                if a.has_container(name):
+                    assert vars(getattr(a, name)) == vars(getattr(b, name))
+
+    def test_load__changed(self):
+        path, project = self.store(aeidon.formats.SUBRIP)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+        assert aeidon.cache.load(aeidon.cache.get_key(path, "ascii")) is None
+
+    def test_load__encoding(self):
+        path, project = self.store(aeidon.formats.SUBRIP)
+        assert aeidon.cache.load(aeidon.cache.get_key(path, "utf_8")) is None
+
+    def test_load__invalid(self):
+        path, project = self.store(aeidon.formats.SUBRIP)
+        key = aeidon.cache.get_key(path, "ascii")
+        cache_path = aeidon.cache._get_path(key)
+        cache_path.write_bytes(cache_path.read_bytes()[:-10])
+        assert aeidon.cache.load(key) is None
+
+    def test_load__missing(self):
+        path = self.new_subrip_file()
+        assert aeidon.cache.load(aeidon.cache.get_key(path, "ascii")) is None
+
+    def test_load__shared_containers(self):
+        path, project = self.store(aeidon.formats.ASS)
+        key = aeidon.cache.get_key(path, "ascii")
+        file, subtitles, sort_count = aeidon.cache.load(key)
+        assert subtitles[0].ssa.style == subtitles[1].ssa.style
+        subtitles[0].ssa.style = "test"
+        assert subtitles[1].ssa.style != "test"
+
+    def test_store__trim(self, monkeypatch):
+        monkeypatch.setattr(aeidon.cache, "_CACHE_SIZE", 2)
+        for i in range(4):
+            self.store(aeidon.formats.SUBRIP)
+        directory = aeidon.CONFIG_HOME_DIR / "cache"
+        assert len(list(directory.glob("*.bin"))) == 2
@@ -16,6 +16,7 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 import aeidon
+import pytest
 
 class TestCalculator(aeidon.TestCase):
 
@@ -43,6 +44,13 @@ class TestCalculator(aeidon.TestCase):
         assert self.calc.add("00:00:10.000",
                              "00:00:10.000") == "00:00:20.000"
 
+    def test_fps(self):
+        assert self.calc.fps == self.framerate.value
+        assert aeidon.Calculator(48.0).fps == 48.0
+
+    def test_frame_to_milliseconds(self):
+        assert self.calc.frame_to_milliseconds(2658) == 110861
+
     def test_frame_to_seconds(self):
         calc = aeidon.Calculator(aeidon.framerates.FPS_25_000)
         assert calc.frame_to_seconds(127) == 5.08
@@ -98,10 +106,30 @@ class TestCalculator(aeidon.TestCase):
         assert self.calc.is_valid_time("12:34:56.789")
         assert self.calc.is_valid_time("-12:34:56.789")
 
+    def test_milliseconds_to_frame(self):
+        assert self.calc.milliseconds_to_frame(4956144) == 118829
+
+    def test_milliseconds_to_time(self):
+        assert self.calc.milliseconds_to_time(68951154) == "19:09:11.154"
+        assert self.calc.milliseconds_to_time(-1500) == "-00:00:01.500"
+        assert self.calc.milliseconds_to_time(10**10) == "99:59:59.999"
+
+    @pytest.mark.parametrize("ndigits", [0, 2, 3])
+    def test_milliseconds_to_times(self, ndigits):
+        milliseconds = [0, 1235, 3723004, -1235, 359999999, 400000000]
+        times = [self.calc.milliseconds_to_time(x) for x in milliseconds]
+        times = self.calc.round_times(times, ndigits)
+        assert self.calc.milliseconds_to_times(milliseconds, ndigits) == times
+        milliseconds = list(range(0, 10**6, 97))
+        times = [self.calc.milliseconds_to_time(x) for x in milliseconds]
+        times = self.calc.round_times(times, ndigits)
+        assert self.calc.milliseconds_to_times(milliseconds, ndigits) == times
+
     def test_normalize_time(self):
         assert self.calc.normalize_time("1:2:3.4") == "01:02:03.400"
         assert self.calc.normalize_time("-1:2:3,4") == "-01:02:03.400"
         assert self.calc.normalize_time("12:34.567") == "00:12:34.567"
+        assert self.calc.normalize_time("00:00:01.000\n") == "00:00:01.000"
 
     def test_round__frame(self):
         assert self.calc.round(13, -1) == 10
@@ -112,15 +140,30 @@ class TestCalculator(aeidon.TestCase):
     def test_round__time(self):
         assert self.calc.round("12:34:56.789", 1) == "12:34:56.800"
 
+    def test_round_times(self):
+        times = ["00:00:01.234", "-00:00:01.235", "00:59:59.999"]
+        rounded = [self.calc.round(x, 2) for x in times]
+        assert self.calc.round_times(times, 2) == rounded
+        rounded = [self.calc.round(x, 0) for x in times]
+        assert self.calc.round_times(times, 0) == rounded
+
     def test_seconds_to_frame(self):
         assert self.calc.seconds_to_frame(6552) == 157091
 
+    def test_seconds_to_milliseconds(self):
+        assert self.calc.seconds_to_milliseconds(68951.15388) == 68951154
+        assert self.calc.seconds_to_milliseconds(-1.5) == -1500
+
     def test_seconds_to_time(self):
         assert self.calc.seconds_to_time(68951.15388) == "19:09:11.154"
 
     def test_time_to_frame(self):
         assert self.calc.time_to_frame("01:22:36.144") == 118829
 
+    def test_time_to_milliseconds(self):
+        assert self.calc.time_to_milliseconds("03:45:22.117") == 13522117
+        assert self.calc.time_to_milliseconds("-00:00:01.500") == -1500
+
     def test_time_to_seconds(self):
         assert self.calc.time_to_seconds("03:45:22.117") == 13522.117
 
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import aeidon
+import copy
+
+class TestContainer(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.container = aeidon.containers.new("ssa")
+        self.container.style = "test"
+
+    def test_copy(self):
+        container = self.container.copy()
+        assert container.style == "test"
+        assert container.__dict__ is self.container.__dict__
+
+    def test_copy__write_copy(self):
+        container = self.container.copy()
+        container.style = "copy"
+        assert container.style == "copy"
+        assert self.container.style == "test"
+
+    def test_copy__write_original(self):
+        container = self.container.copy()
+        self.container.margin_l = 10
+        del self.container.style
+        assert self.container.style == "Default"
+        assert container.style == "test"
+        assert container.margin_l == 0
+
+    def test___deepcopy__(self):
+        container = copy.deepcopy(self.container)
+        container.style = "copy"
+        assert self.container.style == "test"
+
+class TestModule(aeidon.TestCase):
+
+    def test_new(self):
+        for name in aeidon.containers.NAMES:
+            container = aeidon.containers.new(name)
+            assert isinstance(container, aeidon.containers.Container)
@@ -154,6 +154,64 @@ class TestModule(aeidon.TestCase):
         name = aeidon.encodings.detect(self.new_subrip_file())
         assert aeidon.encodings.is_valid_code(name)
 
+    def test_detect__data(self):
+        data = self.new_subrip_file().read_bytes()
+        name = aeidon.encodings.detect(None, data)
+        assert aeidon.encodings.is_valid_code(name)
+
+    def test_detect__sample(self, monkeypatch):
+        monkeypatch.setattr(aeidon, "CONFIG_HOME_DIR", aeidon.temp.create_directory())
+        path = self.new_subrip_file()
+        text = path.read_text().replace("a", "\xe4")
+        path.write_text(text * 100, encoding="utf_8")
+        assert aeidon.encodings.detect(path, sample=True) == "utf_8"
+        assert aeidon.encodings.detect(path, sample=True) == "utf_8"
+        cache = aeidon.encodings._read_cache()
+        assert cache[str(path)][2] == "utf_8"
+
+    def test_detect__sample_cached(self, monkeypatch):
+        monkeypatch.setattr(aeidon, "CONFIG_HOME_DIR", aeidon.temp.create_directory())
+        path = self.new_subrip_file()
+        assert aeidon.encodings.detect(path, sample=True) == "ascii"
+        with patch("aeidon.encodings._detect_sample", lambda *args: "utf_8"):
+            # Unchanged file is not detected again.
+            assert aeidon.encodings.detect(path, sample=True) == "ascii"
+            path.write_text(path.read_text() * 2)
+            assert aeidon.encodings.detect(path, sample=True) == "utf_8"
+
+    def test_detect__sample_outside(self, monkeypatch):
+        monkeypatch.setattr(aeidon, "CONFIG_HOME_DIR", aeidon.temp.create_directory())
+        path = self.new_subrip_file()
+        text = path.read_text() * 1000
+        # Non-ASCII character between the sampled chunks.
+        n = len(text) // 4
+        data = (text[:n] + "\xe4" + text[n:]).encode("utf_8")
+        path.write_bytes(data)
+        encoding = aeidon.encodings.detect(path, data, sample=True)
+        assert encoding != "ascii"
+        data.decode(encoding)
+        cache = aeidon.encodings._read_cache()
+        assert cache[str(path.resolve())][2] == encoding
+
+    def test_detect__sample_outside_path(self, monkeypatch):
+        monkeypatch.setattr(aeidon, "CONFIG_HOME_DIR", aeidon.temp.create_directory())
+        path = self.new_subrip_file()
+        text = path.read_text() * 1000
+        # Non-ASCII character between the sampled chunks.
+        n = len(text) // 4
+        data = (text[:n] + "\xe4" + text[n:]).encode("utf_8")
+        path.write_bytes(data)
+        encoding = aeidon.encodings.detect(path, sample=True)
+        assert encoding != "ascii"
+        data.decode(encoding)
+        assert aeidon.encodings.detect(path, sample=True) == encoding
+
+    @patch("aeidon.encodings.is_valid_code", lambda x: True)
+    def test_detect_bom__data(self):
+        data = codecs.BOM_UTF8 + self.new_subrip_file().read_bytes()
+        encoding = aeidon.encodings.detect_bom(None, data)
+        assert encoding == "utf_8_sig"
+
     def test_detect_bom__none(self):
         path = self.new_subrip_file()
         encoding = aeidon.encodings.detect_bom(path)
@@ -215,6 +273,12 @@ class TestModule(aeidon.TestCase):
             code, name, description = item
             assert aeidon.encodings.is_valid_code(code)
 
+    def test_is_decodable(self, monkeypatch):
+        monkeypatch.setattr(aeidon.encodings, "_DECODE_SIZE", 1)
+        assert aeidon.encodings.is_decodable("a\xe4".encode("utf_8"), "utf_8")
+        assert not aeidon.encodings.is_decodable(b"a\xe4", "utf_8")
+        assert not aeidon.encodings.is_decodable(b"a", "x")
+
     def test_is_valid_code(self):
         assert aeidon.encodings.is_valid_code("gbk")
         assert aeidon.encodings.is_valid_code("utf_16_be")
@@ -17,6 +17,7 @@
 
 import aeidon
 import codecs
+import pytest
 
 class PuppetSubtitleFile(aeidon.SubtitleFile):
 
@@ -61,3 +62,65 @@ class TestSubtitleFile(aeidon.TestCase):
         path.write_text(text, encoding="utf_8_sig")
         file = aeidon.files.new(aeidon.formats.SUBRIP, path, "utf_8")
         file.read()
+        assert file.encoding == "utf_8_sig"
+
+    def test_set_data(self):
+        path = self.new_subrip_file()
+        data = path.read_bytes().replace(b"\n", b"\r\n")
+        file = aeidon.files.new(aeidon.formats.SUBRIP, path, "ascii")
+        file.set_data(data)
+        assert file.read()
+        assert file.newline == aeidon.newlines.WINDOWS
+        # Data is used only once, after which file is read from disk.
+        assert file.read()
+        assert file.newline == aeidon.newlines.UNIX
+
+    def test_set_data__bytes(self, monkeypatch):
+        path = self.new_subrip_file()
+        file = aeidon.files.new(aeidon.formats.SUBRIP, path, "ascii")
+        file.set_data(path.read_bytes())
+        # Bytes are scanned a block at a time, not decoded as text.
+        monkeypatch.setattr(file, "_open_text", None)
+        assert file.read()
+
+    def test_iter_subtitles__lazy(self):
+        path = self.new_subrip_file()
+        data = b"\n\n".join([path.read_bytes()] * 100)
+        path.write_bytes(data + b"\n\n1\n00:00:01,000 --> 00:00:02,000\n\xff\n")
+        file = aeidon.files.new(aeidon.formats.SUBRIP, path, "ascii")
+        file._block_size = 1024
+        subtitles = file.iter_subtitles()
+        # Subtitles are parsed before decoding the rest of the file.
+        assert next(subtitles).main_text
+        with pytest.raises(UnicodeError):
+            list(subtitles)
+
+    @pytest.mark.parametrize("block_size", [1, 7, 1048576])
+    @pytest.mark.parametrize("newline", ["\n", "\r\n", "\r"])
+    def test_iter_subtitles__mapped(self, newline, block_size):
+        path = self.new_subrip_file()
+        text = path.read_text().replace("\n", newline)
+        path.write_bytes(("\ufeff" + text.replace("a", "\xe4")).encode("utf_8"))
+        file = aeidon.files.new(aeidon.formats.SUBRIP, path, "utf_8")
+        file._block_size = block_size
+        subtitles = file.read()
+        assert file.encoding == "utf_8_sig"
+        assert file.newline.value == newline
+        file = aeidon.files.new(aeidon.formats.SUBRIP, path, "utf_8")
+        file.set_data(path.read_bytes())
+        assert subtitles == file.read()
+
+    @pytest.mark.parametrize("format", aeidon.formats)
+    def test_write__iterable(self, format):
+        path = self.new_temp_file(format)
+        file = aeidon.files.new(format, path, "ascii")
+        subtitles = file.read()
+        file.write(subtitles, aeidon.documents.MAIN)
+        text = path.read_text()
+        file.write(iter(subtitles), aeidon.documents.MAIN)
+        if format == aeidon.formats.WEBVTT:
+            # Hours are always written if subtitles is not a sequence.
+            assert path.read_text() != text
+            assert file.read() == subtitles
+        else:
+            assert path.read_text() == text
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import aeidon
+import random
+
+class TestIntervalIndex(aeidon.TestCase):
+
+    def assert_consistent(self):
+        subtitles = self.project.subtitles
+        key = lambda i: (subtitles[i].start_seconds, i)
+        first = lambda x: min(x, key=key) if x else None
+        last = lambda x: max(x, key=key) if x else None
+        rng = random.Random(1)
+        end = max(x.end_seconds for x in subtitles) + 1
+        for seconds in [rng.uniform(-1, end) for i in range(200)]:
+            assert self.index.at(seconds) == last(
+                [i for i, x in enumerate(subtitles)
+                 if x.start_seconds <= seconds <= x.end_seconds])
+            assert self.index.next_after(seconds) == first(
+                [i for i, x in enumerate(subtitles)
+                 if x.start_seconds > seconds])
+            assert self.index.previous_before(seconds) == last(
+                [i for i, x in enumerate(subtitles)
+                 if x.end_seconds < seconds])
+            assert self.index.overlapping(seconds, seconds + 5) == [
+                i for i, x in enumerate(subtitles)
+                if x.start_seconds <= seconds + 5 and
+                x.end_seconds >= seconds]
+
+    def setup_method(self, method):
+        self.project = self.new_project()
+        self.index = self.project.get_interval_index()
+
+    def test_at(self):
+        subtitle = self.project.subtitles[3]
+        assert self.index.at(subtitle.start_seconds) == 3
+        assert self.index.at(subtitle.end_seconds) == 3
+        assert self.index.at(-100) is None
+        self.assert_consistent()
+
+    def test_at__overlapping(self):
+        self.project.set_end(0, self.project.subtitles[2].end)
+        assert self.index.at(self.project.subtitles[1].start_seconds) == 1
+        assert self.index.at(self.project.subtitles[2].end_seconds) == 2
+        self.assert_consistent()
+
+    def test_detach(self):
+        self.index.rebuild()
+        self.index.detach()
+        self.project.remove_subtitles([0])
+        assert not self.index._dirty
+
+    def test_get_interval_index(self):
+        assert self.project.get_interval_index() is self.index
+
+    def test_insert_subtitles(self):
+        self.index.rebuild()
+        self.project.insert_subtitles([0, 5])
+        self.assert_consistent()
+
+    def test_next_after(self):
+        subtitle = self.project.subtitles[3]
+        assert self.index.next_after(subtitle.start_seconds) == 4
+        assert self.index.next_after(-100) == 0
+        assert self.index.next_after(360000) is None
+
+    def test_overlapping(self):
+        start = self.project.subtitles[2].start_seconds + 0.001
+        end = self.project.subtitles[4].start_seconds
+        assert self.index.overlapping(start, end) == [2, 3, 4]
+        assert self.index.overlapping(-200, -100) == []
+
+    def test_previous_before(self):
+        subtitle = self.project.subtitles[3]
+        assert self.index.previous_before(subtitle.start_seconds) == 2
+        assert self.index.previous_before(-100) is None
+
+    def test_remove_subtitles(self):
+        self.index.rebuild()
+        self.project.remove_subtitles([1, 2])
+        self.assert_consistent()
+        self.project.undo()
+        self.assert_consistent()
+
+    def test_set_framerate(self):
+        self.project.open_main(self.new_microdvd_file(), "ascii")
+        self.index.rebuild()
+        self.project.set_framerate(aeidon.framerates.FPS_25_000)
+        self.assert_consistent()
+
+    def test_set_start(self):
+        self.index.rebuild()
+        self.project.set_end(2, aeidon.as_seconds(1000))
+        assert not self.index._dirty
+        self.assert_consistent()
+        self.project.set_start(2, self.project.subtitles[9].start)
+        self.assert_consistent()
+
+    def test_shift_positions(self):
+        self.index.rebuild()
+        self.project.shift_positions([1, 3], aeidon.as_seconds(0.5))
+        self.assert_consistent()
+        self.project.shift_positions([2], aeidon.as_seconds(300))
+        self.assert_consistent()
+        self.project.undo(2)
+        self.assert_consistent()
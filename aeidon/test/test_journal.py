@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import aeidon
+
+class TestJournal(aeidon.TestCase):
+
+    def assert_restored(self):
+        project = aeidon.Project()
+        journal = aeidon.Journal(project, self.journal.directory)
+        assert journal.restore()
+        assert project.subtitles == self.project.subtitles
+        assert project.framerate == self.project.framerate
+        assert project.main_changed == self.project.main_changed
+        assert project.tran_changed == self.project.tran_changed
+        assert project.main_file.path == self.project.main_file.path
+        assert project.main_file.format == self.project.main_file.format
+        assert project.main_file.header == self.project.main_file.header
+        journal.detach()
+        return project
+
+    def edit(self):
+        self.project.set_text(0, aeidon.documents.MAIN, "foo")
+        self.project.set_text(1, aeidon.documents.TRAN, "bar")
+        self.project.set_start(2, "00:00:00.000")
+        self.project.insert_subtitles((3, 4))
+        self.project.remove_subtitles((5, 7))
+        self.project.merge_subtitles((0, 1))
+        self.project.shift_positions(None, aeidon.as_seconds(1.5))
+        self.project.undo()
+        self.project.redo()
+        self.project.undo(2)
+        self.project.set_framerate(aeidon.framerates.FPS_25_000)
+
+    def setup_method(self, method):
+        self.project = self.new_project()
+        directory = aeidon.temp.create_directory()
+        self.journal = aeidon.Journal(self.project, directory)
+
+    def test_compact(self):
+        self.journal.compact()
+        self.edit()
+        self.journal.compact()
+        text = self.journal._journal_path.read_text()
+        assert len(text.splitlines()) == 1
+        self.assert_restored()
+
+    def test_flush(self):
+        self.journal.flush()
+        assert not self.journal._snapshot_path.exists()
+        self.project.set_text(0, aeidon.documents.MAIN, "foo")
+        self.journal.flush()
+        assert self.journal._snapshot_path.exists()
+        self.edit()
+        self.journal.flush()
+        text = self.journal._journal_path.read_text()
+        assert len(text.splitlines()) > 1
+        self.assert_restored()
+
+    def test_flush__compact_limit(self):
+        self.journal.compact_limit = 3
+        self.journal.compact()
+        self.edit()
+        self.journal.flush()
+        text = self.journal._journal_path.read_text()
+        assert len(text.splitlines()) == 1
+        self.assert_restored()
+
+    def test_flush__incremental(self):
+        self.journal.compact()
+        for i in range(10):
+            self.project.set_text(i, aeidon.documents.MAIN, str(i))
+            self.journal.flush()
+        self.assert_restored()
+
+    def test_flush__opened(self):
+        self.project.open_main(self.new_subrip_file(), "ascii")
+        self.journal.flush()
+        assert not self.journal._snapshot_path.exists()
+        self.project.set_text(0, aeidon.documents.MAIN, "foo")
+        self.journal.flush()
+        self.assert_restored()
+
+    def test_flush__saved(self):
+        self.journal.compact()
+        self.project.set_text(0, aeidon.documents.MAIN, "foo")
+        self.project.save_main()
+        self.journal.flush()
+        assert not self.journal._snapshot_path.exists()
+        assert not self.journal._journal_path.exists()
+        self.project.set_text(0, aeidon.documents.MAIN, "bar")
+        self.journal.flush()
+        assert self.assert_restored().main_changed == 1
+
+    def test_remove(self):
+        self.journal.compact()
+        self.project.set_text(0, aeidon.documents.MAIN, "foo")
+        self.journal.remove()
+        self.journal.flush()
+        assert not self.journal.directory.exists()
+
+    def test_restore(self):
+        self.journal.compact()
+        self.edit()
+        self.journal.flush()
+        assert self.assert_restored().main_changed > 0
+
+    def test_restore__columnar(self):
+        self.project = self.new_project(columnar=True)
+        self.journal.detach()
+        self.journal = aeidon.Journal(self.project, self.journal.directory)
+        self.journal.compact()
+        self.edit()
+        self.journal.flush()
+        self.assert_restored()
+
+    def test_restore__containers(self):
+        self.project.subtitles[0].subrip.x1 = 10
+        self.journal.compact()
+        subtitle = self.project.new_subtitle()
+        subtitle.subrip.y2 = 20
+        self.project.insert_subtitles((1,), (subtitle,))
+        self.journal.flush()
+        project = self.assert_restored()
+        assert project.subtitles[0].subrip.x1 == 10
+        assert project.subtitles[1].subrip.y2 == 20
+        assert not project.subtitles[2].has_container("subrip")
+
+    def test_restore__incomplete(self):
+        self.journal.compact()
+        self.edit()
+        self.journal.flush()
+        with open(self.journal._journal_path, "a") as f:
+            f.write('{"main_changed": 1, "ops": [["main", [0], ["x')
+        self.assert_restored()
+
+    def test_restore__no_snapshot(self):
+        project = aeidon.Project()
+        journal = aeidon.Journal(project, self.journal.directory)
+        assert not journal.restore()
+
+    def test_restore__unchanged(self):
+        self.journal.compact()
+        self.project.set_text(0, aeidon.documents.MAIN, "foo")
+        self.journal.flush()
+        self.project.undo()
+        self.journal.flush()
+        project = aeidon.Project()
+        journal = aeidon.Journal(project, self.journal.directory)
+        assert not journal.restore()
+        assert not project.subtitles
+
+    def test_restore__stale_journal(self):
+        self.journal.compact()
+        self.edit()
+        self.journal.flush()
+        # Simulate a crash between writing snapshot and emptying journal.
+        text = self.journal._journal_path.read_text()
+        self.journal.compact()
+        self.journal._journal_path.write_text(text)
+        self.assert_restored()
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import aeidon
+import concurrent.futures
+import pytest
+
+class TestModule(aeidon.TestCase):
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_read_main(self, max_workers, monkeypatch):
+        monkeypatch.setattr(aeidon.parallel, "_WORKER_SIZE", 1)
+        paths = [self.new_subrip_file(), self.new_microdvd_file()]
+        results = list(aeidon.parallel.read_main(paths,
+                                                 ["ascii"],
+                                                 max_workers=max_workers))
+
+        assert [x[0] for x in results] == paths
+        for path, (file, subtitles, sort_count) in results:
+            project = self.new_project()
+            assert project.open_main(path, "ascii") == sort_count
+            assert file.path == path
+            assert file.format == project.main_file.format
+            assert subtitles == project.subtitles
+
+    def test_read_main__encodings(self):
+        path = self.new_subrip_file()
+        text = path.read_text(encoding="ascii")
+        path.write_text(text.replace("a", "\xe4", 1), encoding="utf_8")
+        results = list(aeidon.parallel.read_main([path], ["ascii", "utf_8"]))
+        assert results[0][1][0].encoding == "utf_8"
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_read_main__error(self, max_workers, monkeypatch):
+        monkeypatch.setattr(aeidon.parallel, "_WORKER_SIZE", 1)
+        path = self.new_subrip_file()
+        path.write_bytes(b"\x80\x81\x82")
+        paths = [path, self.new_subrip_file()]
+        results = list(aeidon.parallel.read_main(paths,
+                                                 ["ascii"],
+                                                 max_workers=max_workers))
+
+        assert isinstance(results[0][1], UnicodeError)
+        assert len(results[1][1][1]) > 0
+
+    def test_read_main__small(self, monkeypatch):
+        # Too little to read to start worker processes.
+        monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", None)
+        paths = [self.new_subrip_file(), self.new_microdvd_file()]
+        results = list(aeidon.parallel.read_main(paths,
+                                                 ["ascii"],
+                                                 max_workers=2))
+
+        assert [x[0] for x in results] == paths
+        assert all(len(x[1][1]) > 0 for x in results)
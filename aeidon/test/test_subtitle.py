@@ -16,6 +16,7 @@
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 import aeidon
+import tracemalloc
 
 MAIN  = aeidon.documents.MAIN
 TRAN  = aeidon.documents.TRAN
@@ -41,6 +42,18 @@ class TestSubtitle(aeidon.TestCase):
         self.fsub.main_text = "main"
         self.fsub.tran_text = "translation"
 
+    def test___slots__(self):
+        calc = aeidon.Calculator()
+        tracemalloc.start()
+        try:
+            subtitles = [aeidon.Subtitle(calc=calc) for i in range(1000)]
+            size = tracemalloc.get_traced_memory()[0] / len(subtitles)
+        finally:
+            tracemalloc.stop()
+        # Object with slots is 128 bytes on 64-bit CPython,
+        # with a dictionary for attributes well over 200.
+        assert size < 160
+
     def test_convert_framerate__frame(self):
         self.fsub.start = 100
         self.fsub.end = 200
@@ -59,6 +72,23 @@ class TestSubtitle(aeidon.TestCase):
         assert self.tsub.start == "00:00:01.043"
         assert self.tsub.end == "00:00:02.085"
 
+    def test_copy(self):
+        self.tsub.ssa.style = "test"
+        subtitle = self.tsub.copy()
+        assert subtitle == self.tsub
+        assert subtitle.calc is self.tsub.calc
+        assert subtitle.ssa.style == "test"
+        assert subtitle.ssa is not self.tsub.ssa
+        assert not subtitle.has_container("subrip")
+
+    def test_copy__copy_on_write(self):
+        self.tsub.ssa.style = "test"
+        subtitle = self.tsub.copy()
+        subtitle.ssa.style = "copy"
+        assert self.tsub.ssa.style == "test"
+        self.tsub.ssa.name = "test"
+        assert subtitle.ssa.name == ""
+
     def test_duration__get(self):
         assert self.tsub.duration == "00:00:02.000"
         assert self.fsub.duration == 200
@@ -177,6 +207,13 @@ class TestSubtitle(aeidon.TestCase):
         assert self.tsub.get_text(MAIN) == "main"
         assert self.tsub.get_text(TRAN) == "translation"
 
+    def test_has_container(self):
+        assert not self.tsub.has_container("ssa")
+        self.tsub.ssa.style = "test"
+        assert self.tsub.has_container("ssa")
+        assert not self.tsub.has_container("webvtt")
+        assert not self.tsub.has_container("test")
+
     def test_main_text__get(self):
         assert self.tsub.main_text == "main"
         assert self.fsub.main_text == "main"
@@ -192,8 +229,10 @@ class TestSubtitle(aeidon.TestCase):
     def test_mode__set_frame(self):
         self.fsub.mode = FRAME
         self.fsub.mode = TIME
-        assert self.fsub._start == "00:00:04.000"
-        assert self.fsub._end == "00:00:12.000"
+        assert self.fsub._start == 4000
+        assert self.fsub._end == 12000
+        assert self.fsub.start == "00:00:04.000"
+        assert self.fsub.end == "00:00:12.000"
 
     def test_mode__set_time(self):
         self.tsub.mode = TIME
@@ -224,13 +263,13 @@ class TestSubtitle(aeidon.TestCase):
 
     def test_shift_positions__seconds(self):
         self.tsub.shift_positions(1.0)
-        assert self.tsub._start == "00:00:02.000"
-        assert self.tsub._end == "00:00:04.000"
+        assert self.tsub._start == 2000
+        assert self.tsub._end == 4000
 
     def test_shift_positions__time(self):
         self.tsub.shift_positions("00:00:01.000")
-        assert self.tsub._start == "00:00:02.000"
-        assert self.tsub._end == "00:00:04.000"
+        assert self.tsub._start == 2000
+        assert self.tsub._end == 4000
 
     def test_start__get(self):
         assert self.tsub.start == "00:00:01.000"
@@ -272,6 +311,14 @@ class TestSubtitle(aeidon.TestCase):
         assert self.tsub.start_time == "00:00:01.000"
         assert self.fsub.start_time == "00:00:04.000"
 
+    def test_start_time__cache(self):
+        assert self.tsub.start_time == "00:00:01.000"
+        self.tsub.start_seconds = 2.5
+        assert self.tsub.start_time == "00:00:02.500"
+        assert self.fsub.start_time == "00:00:04.000"
+        self.fsub.framerate = aeidon.framerates.FPS_23_976
+        assert self.fsub.start_time == "00:00:04.171"
+
     def test_start_time__set(self):
         self.tsub.start_time = "00:00:00.100"
         assert self.tsub.start_time == "00:00:00.100"
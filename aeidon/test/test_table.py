@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+import aeidon
+
+from aeidon.agents.test import test_edit
+from aeidon.agents.test import test_position
+from aeidon.agents.test import test_set
+
+FRAME = aeidon.modes.FRAME
+TIME  = aeidon.modes.TIME
+
+class TestColumnarEditAgent(test_edit.TestEditAgent):
+
+    def setup_method(self, method):
+        self.project = self.new_project(columnar=True)
+
+class TestColumnarPositionAgent(test_position.TestPositionAgent):
+
+    def setup_method(self, method):
+        self.project = self.new_project(columnar=True)
+
+class TestColumnarSetAgent(test_set.TestSetAgent):
+
+    def setup_method(self, method):
+        self.project = self.new_project(columnar=True)
+
+class TestSubtitleRow(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.table = aeidon.SubtitleTable()
+        for i in range(3):
+            subtitle = aeidon.Subtitle()
+            subtitle.start_seconds = i
+            subtitle.end_seconds = i + 0.5
+            subtitle.main_text = str(i)
+            self.table.append(subtitle)
+
+    def test_container(self):
+        row = self.table[1]
+        assert not row.has_container("ssa")
+        row.ssa.style = "test"
+        assert self.table[1].has_container("ssa")
+        assert self.table[1].ssa.style == "test"
+        assert not self.table[0].has_container("ssa")
+
+    def test_copy(self):
+        self.table[0].ssa.style = "test"
+        subtitle = self.table[0].copy()
+        assert not isinstance(subtitle, aeidon.SubtitleRow)
+        assert subtitle == self.table[0]
+        assert subtitle.ssa.style == "test"
+
+    def test_mode(self):
+        self.table[0].mode = FRAME
+        assert self.table.mode == FRAME
+        assert self.table[2].start == 48
+
+    def test_start(self):
+        row = self.table[1]
+        row.start = "00:00:05.000"
+        assert self.table[1].start_seconds == 5.0
+        self.table.insert(0, aeidon.Subtitle())
+        assert row.start == "00:00:05.000"
+
+    def test_text(self):
+        row = self.table[2]
+        row.main_text = "test"
+        assert self.table[2].main_text == "test"
+
+class TestSubtitleTable(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.subtitles = []
+        for i in range(3):
+            subtitle = aeidon.Subtitle()
+            subtitle.start_seconds = i
+            subtitle.end_seconds = i + 0.5
+            subtitle.main_text = str(i)
+            self.subtitles.append(subtitle)
+        self.table = aeidon.SubtitleTable(self.subtitles)
+
+    def test___delitem__(self):
+        del self.table[0]
+        assert self.table == self.subtitles[1:]
+
+    def test___delitem____slice(self):
+        del self.table[1:]
+        assert self.table == self.subtitles[:1]
+
+    def test___eq__(self):
+        assert self.table == self.subtitles
+        assert self.table != self.subtitles[1:]
+
+    def test___getitem__(self):
+        assert isinstance(self.table[0], aeidon.SubtitleRow)
+        assert self.table[0] == self.subtitles[0]
+        assert self.table[-1] == self.subtitles[-1]
+        assert self.table[1:] == self.subtitles[1:]
+
+    def test___len__(self):
+        assert len(self.table) == 3
+
+    def test___setitem__(self):
+        self.table[0] = self.subtitles[2]
+        assert self.table[0] == self.subtitles[2]
+
+    def test___setitem____slice(self):
+        self.table[0:2] = self.subtitles[1:]
+        assert self.table == self.subtitles[1:] + self.subtitles[2:]
+
+    def test_framerate(self):
+        self.table.framerate = aeidon.framerates.FPS_25_000
+        assert self.table[1].framerate == aeidon.framerates.FPS_25_000
+        assert self.table[1].start_frame == 25
+
+    def test_get_column(self):
+        assert list(self.table.get_column("start")) == [0, 1000, 2000]
+        assert self.table.get_column("main_text", (0, 2)) == ["0", "2"]
+
+    def test_insert(self):
+        subtitle = aeidon.Subtitle(FRAME)
+        subtitle.start_frame = 24
+        self.table.insert(1, subtitle)
+        assert len(self.table) == 4
+        assert self.table[1].start_frame == 24
+        assert self.table[2] == self.subtitles[1]
+
+    def test_mode(self):
+        self.table.mode = FRAME
+        assert list(self.table.get_column("start")) == [0, 24, 48]
+        self.table.mode = TIME
+        assert list(self.table.get_column("start")) == [0, 1001, 2002]
+
+    def test_pop(self):
+        self.table[1].ssa.style = "test"
+        subtitle = self.table.pop(1)
+        assert not isinstance(subtitle, aeidon.SubtitleRow)
+        assert subtitle == self.subtitles[1]
+        assert subtitle.ssa.style == "test"
+        assert self.table == self.subtitles[::2]
+        self.table.append(aeidon.Subtitle())
+        assert not self.table[-1].has_container("ssa")
+
+    def test_pop__stale_view(self):
+        row = self.table[0]
+        self.table.pop(0)
+        self.table.insert(0, aeidon.Subtitle())
+        row.main_text = "test"
+        assert "test" not in self.table.get_column("main_text")
+
+    def test_reverse(self):
+        self.table.reverse()
+        assert self.table == self.subtitles[::-1]
+
+    def test_set_column(self):
+        self.table.set_column("end", (5000, 6000), (1, 2))
+        assert list(self.table.get_column("end")) == [500, 5000, 6000]
+
+    def test_sort(self):
+        self.table.reverse()
+        self.table.sort()
+        assert self.table == self.subtitles
@@ -34,6 +34,22 @@ class TestModule(aeidon.TestCase):
         text = path.read_text()
         assert text == "test\n"
 
+    @pytest.mark.parametrize("durability", ["fsync", "rename-only", "direct"])
+    def test_atomic_open__durability(self, durability):
+        path = self.new_subrip_file()
+        with aeidon.util.atomic_open(path, "w", durability=durability) as f:
+            f.write("test\n")
+        text = path.read_text()
+        assert text == "test\n"
+        assert [x.name for x in path.parent.iterdir()
+                if x.name.startswith(f".{path.name}.tmp")] == []
+
+    def test_atomic_open__invalid_durability(self):
+        path = self.new_subrip_file()
+        with pytest.raises(ValueError):
+            with aeidon.util.atomic_open(path, "w", durability="none"):
+                pass
+
     def test_compare_versions(self):
         assert aeidon.util.compare_versions("0.1.1", "0.1"  ) ==  1
         assert aeidon.util.compare_versions("0.2"  , "0.1"  ) ==  1
@@ -46,12 +62,27 @@ class TestModule(aeidon.TestCase):
         path = self.new_temp_file(format)
         assert aeidon.util.detect_format(path, "ascii") == format
 
+    @pytest.mark.parametrize("format", aeidon.formats)
+    def test_detect_format__text(self, format):
+        text = self.new_temp_file(format).read_text()
+        assert aeidon.util.detect_format(None, "ascii", text) == format
+
+    @pytest.mark.parametrize("window", [1, 10, 65536])
+    def test_detect_format__window(self, window):
+        text = "ScriptType:\n v4.00+\n\n{1}{2}x\n{3}{4}y\n"
+        format = aeidon.util.detect_format(None, "ascii", text, window)
+        assert format == aeidon.formats.MICRODVD
+
     def test_detect_newlines__mac(self):
         path = aeidon.temp.create()
         path.write_text("a\rb\rc\r", newline="")
         newlines = aeidon.util.detect_newlines(path)
         assert newlines == aeidon.newlines.MAC
 
+    def test_detect_newlines__text(self):
+        newlines = aeidon.util.detect_newlines(None, "a\r\nb\r\nc\r\n")
+        assert newlines == aeidon.newlines.WINDOWS
+
     def test_detect_newlines__unix(self):
         path = aeidon.temp.create()
         path.write_text("a\nb\nc\n", newline="")
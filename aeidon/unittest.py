@@ -60,9 +60,9 @@ class TestCase:
         """Return path to a new temporary MicroDVD file."""
         return self.new_temp_file(aeidon.formats.MICRODVD)
 
-    def new_project(self):
+    def new_project(self, columnar=False):
         """Return a new project with both main and translation files."""
-        project = aeidon.Project()
+        project = aeidon.Project(columnar=columnar)
         project.open_main(self.new_subrip_file(), "ascii")
         project.open_translation(self.new_microdvd_file(), "ascii")
         return project
@@ -20,6 +20,7 @@
 import aeidon
 import collections
 import contextlib
+import io
 import locale
 import mimetypes
 import os
@@ -52,7 +53,7 @@ def affirm(value):
         raise aeidon.AffirmationError(f"Not True: {value!r}")
 
 @contextlib.contextmanager
-def atomic_open(path, mode="w", *args, **kwargs):
+def atomic_open(path, mode="w", *args, durability="fsync", **kwargs):
     """
     A context manager for atomically writing a file.
 
@@ -60,8 +61,21 @@ def atomic_open(path, mode="w", *args, **kwargs):
     fsynced and then renamed to replace the existing file. This should
     (probably) be atomic on any Unix system. On Windows, it should (probably)
     be atomic if using Python 3.3 or greater.
+
+    `durability` can be "fsync" to do all of the above, "rename-only" to skip
+    the flush and fsync, leaving it to the operating system when to write the
+    file to disk, or "direct" to write directly to `path` without a temporary
+    file, in which case the file can be left partially written on failure.
+    The cheaper modes are intended for throwaway files and for bulk writing
+    where durability is handled elsewhere.
     """
+    if durability not in ("fsync", "rename-only", "direct"):
+        raise ValueError(f"Invalid durability: {durability!r}")
     path = Path(path).resolve()
+    if durability == "direct":
+        with open(path, mode, *args, **kwargs) as f:
+            yield f
+        return
     chars = list("abcdefghijklmnopqrstuvwxyz0123456789")
     while True:
         # Let's use a hidden temporary file to avoid a file
@@ -79,8 +93,9 @@ def atomic_open(path, mode="w", *args, **kwargs):
             temp_path.chmod(stat.S_IMODE(st.st_mode))
         with open(temp_path, mode, *args, **kwargs) as f:
             yield f
-            f.flush()
-            os.fsync(f.fileno())
+            if durability == "fsync":
+                f.flush()
+                os.fsync(f.fileno())
         try:
             # This should be atomic on Windows too.
             # Path.replace will fail if path and temp_path
@@ -138,45 +153,55 @@ def connect(observer, observable, signal, *args):
         observable = getattr(observer, observable)
     return observable.connect(signal, method, *args)
 
-def detect_format(path, encoding):
+def detect_format(path, encoding, text=None, window=65536):
     """
     Detect and return format of subtitle file at `path`.
 
+    `text` can be the decoded content of the file, if already read, or a
+    text file object to read it from, which is closed once done. `window`
+    is the amount of characters to read and search at once, so usually
+    only the beginning of the file needs to be read.
     Raise :exc:`IOError` if reading fails.
     Raise :exc:`UnicodeError` if decoding fails.
     Raise :exc:`aeidon.FormatError` if unable to detect format.
     Return an :attr:`aeidon.formats` enumeration item.
     """
-    re_ids = [(x, re.compile(x.identifier)) for x in aeidon.formats]
-    with open(path, "r", encoding=encoding) as f:
-        for line in f:
-            for format, re_id in re_ids:
-                if re_id.search(line) is not None:
-                    return format
+    re_id = _get_format_identifier(
+        tuple((x.name, x.identifier) for x in aeidon.formats))
+    if text is None:
+        text = open(path, "r", encoding=encoding)
+    if isinstance(text, str):
+        text = io.StringIO(text, newline=None)
+    with text as f:
+        # Complete the last line, so that windows end at line breaks.
+        while (head := f.read(window) + f.readline()):
+            pos = 0
+            while (match := re_id.search(head, pos)) is not None:
+                # Check the whole line, since a pattern searched across lines,
+                # e.g. one containing '\s', could match where it wouldn't
+                # match the line alone.
+                start = head.rfind("\n", 0, match.start()) + 1
+                end = head.find("\n", match.start()) + 1 or len(head)
+                match = re_id.search(head[start:end])
+                if match is not None:
+                    return aeidon.formats.find_item("name", match.lastgroup)
+                pos = end
     raise aeidon.FormatError(f"Failed to detect format of file {path!r}")
 
-def detect_newlines(path):
-    """Detect and return the newline type of file at `path` or ``None``."""
+def detect_newlines(path, text=None):
+    """
+    Detect and return the newline type of file at `path` or ``None``.
+
+    `text` can be the decoded content of the file, if already read.
+    """
     try:
-        with open(path, "r", newline="") as f:
+        with (open(path, "r", newline="") if text is None else
+              io.StringIO(text, newline=None)) as f:
             f.read()
             chars = f.newlines
     except Exception:
         return None
-    if chars is None:
-        return None
-    if isinstance(chars, str):
-        return aeidon.newlines.find_item("value", chars)
-    if isinstance(chars, tuple):
-        if len(chars) == 1:
-            return aeidon.newlines.find_item("value", chars[0])
-        # This is not actually correct. If both CR and LF are detected,
-        # it could mean a mixture of Mac and Unix newlines on separate
-        # lines or one Windows newline in a mostly something else file.
-        # We could count the frequencies, but it's probably not worth
-        # the effort.
-        return aeidon.newlines.WINDOWS
-    return None
+    return get_newline(chars)
 
 @aeidon.deco.listify
 def flatten(lst):
@@ -192,6 +217,18 @@ def flatten(lst):
         else: # Non-list item.
             yield item
 
+@aeidon.deco.memoize(10)
+def _get_format_identifier(identifiers):
+    """Return regular expression matching any of named `identifiers`."""
+    # Alternatives are tried in order, so the first matching format of the
+    # enumeration is returned for a line, as when searching one at a time.
+    anchor = "^" if all(x.startswith("^") for _, x in identifiers) else ""
+    # Factor out a common anchor so that the search is quickly rejected
+    # at positions other than beginnings of lines.
+    pattern = "|".join(f"(?P<{name}>{identifier[len(anchor):]})"
+                       for name, identifier in identifiers)
+    return re.compile(f"{anchor}(?:{pattern})", re.MULTILINE)
+
 def get_chardet_version():
     """Return :mod:`charset_normalizer` version number as string or ``None``."""
     try:
@@ -239,6 +276,28 @@ def get_ranges(lst):
             ranges.append([item])
     return ranges
 
+def get_newline(chars):
+    """
+    Return :attr:`aeidon.newlines` item matching `chars` or ``None``.
+
+    `chars` should be the ``newlines`` attribute of a file object read in
+    text mode with universal newlines.
+    """
+    if chars is None:
+        return None
+    if isinstance(chars, str):
+        return aeidon.newlines.find_item("value", chars)
+    if isinstance(chars, tuple):
+        if len(chars) == 1:
+            return aeidon.newlines.find_item("value", chars[0])
+        # This is not actually correct. If both CR and LF are detected,
+        # it could mean a mixture of Mac and Unix newlines on separate
+        # lines or one Windows newline in a mostly something else file.
+        # We could count the frequencies, but it's probably not worth
+        # the effort.
+        return aeidon.newlines.WINDOWS
+    return None
+
 def get_template_header(format):
     """
     Read and return the template header for `format`.
@@ -300,6 +359,14 @@ def normalize_newlines(text):
     re_newline_char = re.compile(r"\r\n?")
     return re_newline_char.sub("\n", text)
 
+def numpy_available():
+    """Return ``True`` if :mod:`numpy` module is available."""
+    try:
+        import numpy # noqa
+        return True
+    except ImportError:
+        return False
+
 def path_to_uri(path):
     """Convert local filepath to URI."""
     path = str(path)
@@ -92,6 +92,7 @@ from gaupol.renderers import TimeCellRenderer
 from gaupol.toast import Toast
 from gaupol.spell import SpellChecker
 from gaupol.view import View
+from gaupol.loader import Loader
 from gaupol.page import Page
 from gaupol.player import VideoPlayer
 from gaupol.dialogs.builder import BuilderDialog
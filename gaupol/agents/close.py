@@ -33,11 +33,16 @@ class CloseAgent(aeidon.Delegate):
         if confirm:
             self._confirm_close(page)
         if not page in self.pages: return
+        if page.loader is not None:
+            page.loader.cancel()
         index = self.pages.index(page)
         if self.notebook.get_current_page() == index:
             self.notebook.next_page()
         self.notebook.remove_page(index)
         self.pages.remove(page)
+        if page.journal is not None:
+            page.journal.remove()
+            page.journal = None
         self.update_gui()
         self.emit("page-closed", page)
 
@@ -144,6 +149,12 @@ class CloseAgent(aeidon.Delegate):
             for page in self.pages:
                 if self._need_confirmation(page):
                     self._confirm_close(page)
+        for page in self.pages:
+            # Changes are saved or discarded, journals no longer needed.
+            if page.journal is not None:
+                page.journal.remove()
+                page.journal = None
+        self.stop_autosave()
         if not gaupol.conf.application_window.maximized:
             conf = gaupol.conf.application_window
             conf.size = list(self.window.get_default_size())
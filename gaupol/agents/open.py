@@ -18,8 +18,12 @@
 """Opening subtitle files and creating new projects."""
 
 import aeidon
+import concurrent.futures
 import contextlib
 import gaupol
+import os
+import sys
+import tempfile
 
 from aeidon.i18n   import _
 from gi.repository import Gdk
@@ -27,6 +31,9 @@ from gi.repository import Gio
 from gi.repository import Gtk
 from pathlib import Path
 
+# Size in bytes of main files to read in a worker thread.
+_LOAD_SIZE = 262144
+
 class OpenAgent(aeidon.Delegate):
 
     """Opening subtitle files and creating new projects."""
@@ -35,6 +42,9 @@ class OpenAgent(aeidon.Delegate):
     def add_page(self, page):
         """Add `page` to the application."""
         self.pages.append(page)
+        if page.journal is None and gaupol.conf.file.autosave_interval > 0:
+            directory = self._new_journal_directory()
+            page.journal = aeidon.Journal(page.project, directory)
         page.connect("close-request", self._on_page_close_request)
         page.project.connect("action-done", self._on_project_action_done)
         page.project.connect("action-redone", self._on_project_action_redone)
@@ -149,6 +159,41 @@ class OpenAgent(aeidon.Delegate):
             gesture.connect("pressed", self._on_view_header_pressed)
             button.add_controller(gesture)
 
+    def _decode(self, path, encodings, data):
+        """
+        Return a sequence of `encodings` to try and `data` to open.
+
+        For large files, decode `data` with all `encodings` concurrently and
+        return the first of them that decodes it and the decoded text, so
+        that the file is decoded and parsed only once.
+        """
+        if len(encodings) < 2 or len(data) < 4194304:
+            # For small files, trying encodings one by one fails fast
+            # enough without the overhead of threads.
+            return encodings, data
+        if getattr(sys, "_is_gil_enabled", lambda: True)():
+            # Decoding holds the GIL, threads would run one at a time.
+            return encodings, data
+        if aeidon.encodings.detect_bom(path, data) is not None:
+            # Encoding is taken from the BOM regardless.
+            return encodings, data
+        def decode(encoding):
+            with contextlib.suppress(UnicodeError):
+                return str(data, encoding)
+        n = list(encodings).index("auto") if "auto" in encodings else None
+        executor = concurrent.futures.ThreadPoolExecutor()
+        try:
+            futures = [executor.submit(decode, x) for x in encodings[:n]]
+            for encoding, future in zip(encodings, futures):
+                text = future.result()
+                if text is not None:
+                    return (encoding,), text
+            # Detection needs the bytes, try the rest one by one.
+            return encodings[n:] if n is not None else (), data
+        finally:
+            # Encodings of lower priority are no longer needed.
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def _get_encodings(self, first=None):
         """Return a sequence of encodings to try when opening files."""
         encodings = [first]
@@ -163,6 +208,25 @@ class OpenAgent(aeidon.Delegate):
         encodings = encodings or ["utf_8"]
         return tuple(aeidon.util.get_unique(encodings))
 
+    def _load_file(self, page, path, encodings, data):
+        """Start reading file at `path` in a worker thread."""
+        loader = gaupol.Loader(page.project, path, encodings, data)
+        loader.connect("failed", self._on_loader_failed, page)
+        loader.connect("finished", self._on_loader_finished, page)
+        loader.connect("read", self._on_loader_read, page)
+        page.loader = loader
+        # Allow scrolling while loading, but not editing.
+        page.view.set_sensitive(False)
+        page.progress_bar.set_visible(True)
+        page.update_tab_label()
+        loader.start()
+
+    def _new_journal_directory(self):
+        """Return path to a new directory for a journal of changes."""
+        root = aeidon.util.makedirs(aeidon.CONFIG_HOME_DIR / "journal")
+        # Prefix name with process ID to know if the journal is in use.
+        return Path(tempfile.mkdtemp(prefix=f"{os.getpid():d}-", dir=root))
+
     @aeidon.deco.export
     @aeidon.deco.silent(gaupol.Default)
     def _on_append_file_activate(self, *args):
@@ -180,6 +244,41 @@ class OpenAgent(aeidon.Delegate):
         gaupol.util.iterate_main()
         self.append_file(paths[0], encoding)
 
+    def _on_loader_failed(self, loader, error, page):
+        """Close `page` and report failure to read file."""
+        self.close(page, confirm=False)
+        basename = Path(loader.path).name
+        if isinstance(error, UnicodeError):
+            return self._show_encoding_error_dialog(basename)
+        if isinstance(error, aeidon.FormatError):
+            return self._show_format_error_dialog(basename)
+        if isinstance(error, aeidon.ParseError):
+            format = loader.file.format
+            return self._show_parse_error_dialog(basename, format)
+        if isinstance(error, IOError):
+            return self._show_io_error_dialog(basename, str(error))
+        raise error
+
+    def _on_loader_finished(self, loader, page):
+        """Use file read as the main file of `page`."""
+        sort_count = page.project.set_main_file(loader.file, loader.subtitles)
+        page.loader = None
+        page.view.set_sensitive(True)
+        page.progress_bar.set_visible(False)
+        format = page.project.main_file.format
+        self.add_to_recent_files(loader.path, format, aeidon.documents.MAIN)
+        page.view.set_focus(0, page.view.columns.MAIN_TEXT)
+        self.update_gui()
+        try:
+            self._check_sort_count(loader.path, sort_count)
+        except gaupol.Default:
+            self.close(page, confirm=False)
+
+    def _on_loader_read(self, loader, subtitles, page):
+        """Show `subtitles` read and update progress."""
+        page.extend_view(subtitles)
+        page.progress_bar.set_fraction(loader.fraction)
+
     @aeidon.deco.export
     def _on_new_project_activate(self, *args):
         """Create a new project."""
@@ -252,23 +351,19 @@ class OpenAgent(aeidon.Delegate):
         """Split the current project in two."""
         gaupol.util.flash_dialog(gaupol.SplitDialog(self.window, self))
 
-    def _open_file(self, path, encodings, doc, check_open=True):
-        """Open file at `path` and return corresponding page if successful."""
+    def _open_file(self, path, encodings, doc, check_open=True, load=False):
+        """
+        Open file at `path` and return corresponding page if successful.
+
+        See :meth:`_read_file` for `load`.
+        """
         self._check_file_exists(path)
         if check_open:
             self._check_file_not_open(path)
         self._check_file_size(path)
-        basename = Path(path).name
         page = (gaupol.Page() if doc == aeidon.documents.MAIN
                 else self.get_current_page())
-        for encoding in encodings:
-            with contextlib.suppress(UnicodeError):
-                n = self._try_open_file(page, doc, path, encoding)
-                self._check_sort_count(path, n)
-                return page
-        # Report if all codecs failed to decode file.
-        self._show_encoding_error_dialog(basename)
-        raise gaupol.Default
+        return self._read_file(page, path, encodings, doc, load)
 
     @aeidon.deco.export
     @aeidon.deco.silent(gaupol.Default)
@@ -277,8 +372,11 @@ class OpenAgent(aeidon.Delegate):
         if gaupol.fields.TRAN_TEXT in gaupol.conf.editor.visible_fields:
             gaupol.conf.editor.visible_fields.remove(gaupol.fields.TRAN_TEXT)
         encodings = self._get_encodings(encoding)
+        paths = list(aeidon.util.flatten([path]))
+        if len(paths) > 1:
+            return self._open_main_files(paths, encodings)
         gaupol.util.set_cursor_busy(self.window)
-        for path in aeidon.util.flatten([path]):
+        for path in paths:
             try:
                 # Skip files that are already open,
                 # but show a status message when that happens.
@@ -286,11 +384,16 @@ class OpenAgent(aeidon.Delegate):
             except gaupol.Default:
                 continue
             try:
-                page = self._open_file(path, encodings, aeidon.documents.MAIN)
+                page = self._open_file(path,
+                                       encodings,
+                                       aeidon.documents.MAIN,
+                                       load=True)
             except gaupol.Default:
                 gaupol.util.set_cursor_normal(self.window)
                 raise # gaupol.Default
             self.add_page(page)
+            # Loader finishes opening once done reading.
+            if page.loader is not None: continue
             format = page.project.main_file.format
             self.add_to_recent_files(path, format, aeidon.documents.MAIN)
             # Refresh view to get row heights etc. correct.
@@ -298,6 +401,44 @@ class OpenAgent(aeidon.Delegate):
         gaupol.util.set_cursor_normal(self.window)
         self.update_gui()
 
+    def _open_main_files(self, paths, encodings):
+        """Open files at `paths` as main files reading them in parallel."""
+        gaupol.util.set_cursor_busy(self.window)
+        checked = []
+        for path in paths:
+            try:
+                # Skip files that are already open,
+                # but show a status message when that happens.
+                self._check_file_not_open(path)
+                if Path(path).resolve() in checked: continue
+                self._check_file_exists(path)
+                self._check_file_size(path)
+            except gaupol.Default:
+                continue
+            checked.append(Path(path).resolve())
+        cache = gaupol.conf.file.use_cache
+        try:
+            for path, result in aeidon.parallel.read_main(checked,
+                                                          encodings,
+                                                          cache):
+                page = gaupol.Page()
+                if isinstance(result, Exception):
+                    # Retry to show the appropriate error dialog.
+                    doc = aeidon.documents.MAIN
+                    self._read_file(page, path, encodings, doc)
+                else:
+                    file, subtitles, sort_count = result
+                    self._check_sort_count(path, sort_count)
+                    page.project.set_main_file(file, subtitles)
+                self.add_page(page)
+                format = page.project.main_file.format
+                self.add_to_recent_files(path, format, aeidon.documents.MAIN)
+                page.view.set_focus(0, page.view.columns.MAIN_TEXT)
+                gaupol.util.iterate_main()
+        finally:
+            gaupol.util.set_cursor_normal(self.window)
+            self.update_gui()
+
     @aeidon.deco.export
     @aeidon.deco.silent(gaupol.Default)
     def open_translation(self, path, encoding=None, align_method=None):
@@ -314,6 +455,65 @@ class OpenAgent(aeidon.Delegate):
         self.add_to_recent_files(path, format, aeidon.documents.TRAN)
         gaupol.util.set_cursor_normal(self.window)
 
+    def _read_file(self, page, path, encodings, doc, load=False):
+        """
+        Read file at `path` to `page` and return `page` if successful.
+
+        If `load` is ``True``, large main files are read in a worker thread
+        and :attr:`gaupol.Page.loader` of the page returned is set.
+        """
+        basename = Path(path).name
+        try:
+            # Read file once for trying all encodings.
+            data = Path(path).read_bytes()
+        except IOError as error:
+            self._show_io_error_dialog(basename, str(error))
+            raise gaupol.Default
+        encodings, data = self._decode(path, encodings, data)
+        if (load and
+            doc == aeidon.documents.MAIN and
+            len(data) >= _LOAD_SIZE):
+            self._load_file(page, path, encodings, data)
+            return page
+        for encoding in encodings:
+            with contextlib.suppress(UnicodeError):
+                n = self._try_open_file(page, doc, path, encoding, data)
+                self._check_sort_count(path, n)
+                return page
+        # Report if all codecs failed to decode file.
+        self._show_encoding_error_dialog(basename)
+        raise gaupol.Default
+
+    @aeidon.deco.export
+    def restore_journals(self):
+        """Restore projects from journals left behind by crashes."""
+        root = aeidon.CONFIG_HOME_DIR / "journal"
+        if not root.is_dir(): return
+        for directory in sorted(root.iterdir()):
+            pid, sep, name = directory.name.partition("-")
+            if not pid.isdigit() or not sep: continue
+            if gaupol.util.is_process_running(int(pid)): continue
+            # Claim journal for this process, which also keeps
+            # other instances starting up from restoring it.
+            target = directory.with_name(f"{os.getpid():d}-{name}")
+            try:
+                directory.rename(target)
+            except OSError:
+                continue
+            page = gaupol.Page(next(self.counter))
+            page.journal = aeidon.Journal(page.project, target)
+            try:
+                restored = page.journal.restore()
+            except (KeyError, OSError, ValueError):
+                restored = False
+            if not restored:
+                page.journal.remove()
+                continue
+            self.add_page(page)
+            page.reload_view_all()
+            page.update_tab_label()
+        self.update_gui()
+
     def _select_files(self, title, doc):
         """Show a :class:`gaupol.OpenDialog` to select files."""
         gaupol.util.set_cursor_busy(self.window)
@@ -404,12 +604,14 @@ class OpenAgent(aeidon.Delegate):
             return self.save_translation(page)
         gaupol.util.raise_default(response != Gtk.ResponseType.NO)
 
-    def _try_open_file(self, page, doc, path, encoding, **kwargs):
+    def _try_open_file(self, page, doc, path, encoding, data, **kwargs):
         """Try to open file at `path` and return subtitle sort count."""
         if encoding == "auto":
-            encoding = aeidon.encodings.detect(path)
+            encoding = aeidon.encodings.detect(path, data, sample=True)
             if encoding is None: raise UnicodeError
         kwargs["align_method"] = gaupol.conf.file.align_method
+        kwargs["cache"] = gaupol.conf.file.use_cache
+        kwargs["data"] = data
         basename = Path(path).name
         try:
             return page.project.open(doc, path, encoding, **kwargs)
@@ -418,9 +620,18 @@ class OpenAgent(aeidon.Delegate):
         except IOError as error:
             self._show_io_error_dialog(basename, str(error))
         except aeidon.ParseError:
-            bom_encoding = aeidon.encodings.detect_bom(path)
-            encoding = bom_encoding or encoding
+            format = None
             with contextlib.suppress(Exception):
-                format = aeidon.util.detect_format(path, encoding)
-            self._show_parse_error_dialog(basename, format)
+                if isinstance(data, str):
+                    # Already decoded, e.g. while checking encodings.
+                    text = data
+                else:
+                    bom_encoding = aeidon.encodings.detect_bom(path, data)
+                    encoding = bom_encoding or encoding
+                    text = str(data, encoding)
+                format = aeidon.util.detect_format(path, encoding, text)
+            if format is None:
+                self._show_format_error_dialog(basename)
+            else:
+                self._show_parse_error_dialog(basename, format)
         raise gaupol.Default
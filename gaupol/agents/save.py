@@ -20,14 +20,35 @@
 import aeidon
 import contextlib
 import gaupol
+import sys
 
 from aeidon.i18n   import _
+from gi.repository import GLib
 from gi.repository import Gtk
 
 class SaveAgent(aeidon.Delegate):
 
     """Saving documents."""
 
+    def __init__(self, master):
+        """Initialize a :class:`SaveAgent` instance."""
+        aeidon.Delegate.__init__(self, master)
+        self._autosave_id = None
+        interval = gaupol.conf.file.autosave_interval
+        if interval > 0:
+            self._autosave_id = GLib.timeout_add_seconds(
+                interval, self._on_autosave_timeout)
+
+    def _on_autosave_timeout(self):
+        """Append changes in all projects to their journals."""
+        for page in self.pages:
+            if page.journal is None: continue
+            try:
+                page.journal.flush()
+            except OSError as error:
+                print(f"Failed to write journal: {error!s}", file=sys.stderr)
+        return True # to be called again.
+
     @aeidon.deco.export
     def _on_save_all_documents_activate(self, *args):
         """Save all open documents."""
@@ -212,3 +233,10 @@ class SaveAgent(aeidon.Delegate):
         dialog.add_button(_("_OK"), Gtk.ResponseType.OK)
         dialog.set_default_response(Gtk.ResponseType.OK)
         gaupol.util.flash_dialog(dialog)
+
+    @aeidon.deco.export
+    def stop_autosave(self):
+        """Stop appending changes in projects to their journals."""
+        if self._autosave_id is None: return
+        GLib.source_remove(self._autosave_id)
+        self._autosave_id = None
@@ -51,6 +51,11 @@ class TestCloseAgent(gaupol.TestCase):
         self.application.pages[-1].project.remove_subtitles((0,))
         self.application.close(self.application.pages[-1], confirm=True)
 
+    def test_close__journal(self):
+        page = self.application.pages[-1]
+        self.application.close(page, confirm=False)
+        assert page.journal is None
+
     @patch("gaupol.util.flash_dialog", lambda *args: Gtk.ResponseType.NO)
     @aeidon.deco.silent(gaupol.Default)
     def test_close_all(self):
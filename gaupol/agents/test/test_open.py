@@ -17,6 +17,7 @@
 
 import aeidon
 import gaupol
+import pytest
 
 from gi.repository import Gtk
 from unittest.mock import patch
@@ -63,6 +64,22 @@ class TestOpenAgent(gaupol.TestCase):
         self.application.append_file(self.new_subrip_file())
         assert len(page.project.subtitles) > n
 
+    @patch("sys._is_gil_enabled", lambda: False, create=True)
+    def test__decode(self):
+        data = ("a" * 5000000 + "\xe4").encode("cp1252")
+        encodings = ("utf_8", "ascii", "cp1252", "auto")
+        encodings, text = self.delegate._decode(None, encodings, data)
+        assert encodings == ("cp1252",)
+        assert text == str(data, "cp1252")
+
+    @patch("sys._is_gil_enabled", lambda: False, create=True)
+    def test__decode__auto(self):
+        data = ("a" * 5000000 + "\xe4").encode("cp1252")
+        encodings = ("utf_8", "auto", "cp1252")
+        encodings, text = self.delegate._decode(None, encodings, data)
+        assert encodings == ("auto", "cp1252")
+        assert text is data
+
     def test__on_new_project_activate(self):
         n = len(self.application.pages)
         self.application.get_action("new-project").activate()
@@ -80,6 +97,95 @@ class TestOpenAgent(gaupol.TestCase):
         self.application.open_main(path)
         assert len(self.application.pages) == n + 1
 
+    @patch("gaupol.agents.open._LOAD_SIZE", 0)
+    def test_open_main__load(self):
+        path = self.new_subrip_file()
+        self.application.open_main(path)
+        page = self.application.get_current_page()
+        while page.loader is not None:
+            gaupol.util.iterate_main()
+        assert page.project.main_file.path == path
+        assert len(page.view.get_model()) == len(page.project.subtitles)
+
+    @patch("gaupol.agents.open._LOAD_SIZE", 0)
+    def test_open_main__load_cache(self, monkeypatch):
+        directory = aeidon.temp.create_directory()
+        monkeypatch.setattr(aeidon, "CONFIG_HOME_DIR", directory)
+        gaupol.conf.file.use_cache = True
+        path = self.new_subrip_file()
+        self.application.open_main(path)
+        page = self.application.get_current_page()
+        # Files not yet cached are read in a worker thread too.
+        assert page.loader is not None
+        while page.loader is not None:
+            gaupol.util.iterate_main()
+        assert list((directory / "cache").glob("*.bin"))
+
+    def test_open_main__multiple(self):
+        n = len(self.application.pages)
+        paths = [self.new_subrip_file(), self.new_microdvd_file()]
+        self.application.open_main(paths)
+        assert len(self.application.pages) == n + 2
+        pages = self.application.pages[-2:]
+        assert [x.project.main_file.path for x in pages] == paths
+
     def test_open_translation(self):
         path = self.new_subrip_file()
         self.application.open_translation(path)
+
+    @patch("sys._is_gil_enabled", lambda: False, create=True)
+    def test__read_file__parse_error(self, monkeypatch):
+        path = self.new_subrip_file()
+        path.write_text("\n" * 5000000 + path.read_text())
+        def iter_subtitles(file):
+            raise ValueError
+        monkeypatch.setattr(aeidon.files.SubRip,
+                            "iter_subtitles",
+                            iter_subtitles)
+
+        formats = []
+        monkeypatch.setattr(self.delegate,
+                            "_show_parse_error_dialog",
+                            lambda basename, format: formats.append(format))
+
+        page = self.application.get_current_page()
+        encodings = ("utf_8", "cp1252")
+        with pytest.raises(gaupol.Default):
+            self.delegate._read_file(page,
+                                     path,
+                                     encodings,
+                                     aeidon.documents.MAIN)
+
+        assert formats == [aeidon.formats.SUBRIP]
+
+    def test_restore_journals(self, monkeypatch):
+        directory = aeidon.temp.create_directory()
+        monkeypatch.setattr(aeidon, "CONFIG_HOME_DIR", directory)
+        monkeypatch.setattr(gaupol.util, "is_process_running", lambda x: False)
+        page = self.new_page()
+        directory = directory / "journal" / "1-test"
+        journal = aeidon.Journal(page.project, directory)
+        page.project.set_text(0, aeidon.documents.MAIN, "test")
+        journal.flush()
+        n = len(self.application.pages)
+        self.application.restore_journals()
+        assert len(self.application.pages) == n + 1
+        page = self.application.pages[-1]
+        assert page.project.subtitles[0].main_text == "test"
+        assert not directory.exists()
+
+    def test_restore_journals__unchanged(self, monkeypatch):
+        directory = aeidon.temp.create_directory()
+        monkeypatch.setattr(aeidon, "CONFIG_HOME_DIR", directory)
+        monkeypatch.setattr(gaupol.util, "is_process_running", lambda x: False)
+        page = self.new_page()
+        directory = directory / "journal" / "1-test"
+        journal = aeidon.Journal(page.project, directory)
+        page.project.set_text(0, aeidon.documents.MAIN, "test")
+        journal.flush()
+        page.project.undo()
+        journal.flush()
+        n = len(self.application.pages)
+        self.application.restore_journals()
+        assert len(self.application.pages) == n
+        assert not list(directory.parent.glob("*-test"))
@@ -45,3 +45,7 @@ class TestSaveAgent(gaupol.TestCase):
     def test_save_translation(self):
         page = self.application.get_current_page()
         self.application.save_translation(page)
+
+    def test_stop_autosave(self):
+        self.application.stop_autosave()
+        assert self.delegate._autosave_id is None
@@ -90,6 +90,9 @@ class UpdateAgent(aeidon.Delegate):
         rows = []
         with contextlib.suppress(AttributeError):
             rows = page.view.get_selected_rows()
+        if page is not None and page.loader is not None:
+            # Allow only actions not needing a page while loading.
+            page, rows = None, []
         for name in self.window.list_actions():
             action = self.get_action(name)
             action.update_enabled(self, page, rows)
@@ -38,15 +38,15 @@ class VideoAgent(aeidon.Delegate):
     def __init__(self, master):
         """Initialize an :class:`VideoAgent` instance."""
         aeidon.Delegate.__init__(self, master)
-        # Maintain an up-to-date cache of subtitle positions in seconds and
-        # subtitle texts in order to allow fast polled updates in video player.
-        # This cache must be updated when page or subtitle data changes.
-        self._cache = []
+        # Keep the interval index of the current page's subtitles in order
+        # to allow fast polled updates in video player. The index follows
+        # subtitle changes itself, but must be updated when page changes.
+        self._index = None
         self._update_handlers = []
 
     def _clear_subtitle_cache(self):
-        """Clear subtitle position and text cache."""
-        self._cache = []
+        """Clear subtitle position index."""
+        self._index = None
 
     def _init_cache_updates(self):
         """Initialize cache updates on application signals."""
@@ -233,9 +233,9 @@ class VideoAgent(aeidon.Delegate):
         pos = self.player.get_position(aeidon.modes.SECONDS)
         if pos is None:
             return True # to be called again.
-        subtitles = list(filter(lambda x: x[0] <= pos <= x[1], self._cache))
-        if subtitles:
-            text = subtitles[-1][2]
+        index = None if self._index is None else self._index.at(pos)
+        if index is not None:
+            text = self._index.project.subtitles[index].main_text
             if text != self.player.subtitle_text_raw:
                 self.player.subtitle_text = text
         else:
@@ -275,18 +275,22 @@ class VideoAgent(aeidon.Delegate):
         """Seek to the start of the next subtitle."""
         pos = self.player.get_position(aeidon.modes.SECONDS)
         if pos is None: return
-        subtitles = list(filter(lambda x: x[0] > pos + 0.001, self._cache))
-        if not subtitles: return
-        self.player.seek(subtitles[0][0])
+        if self._index is None: return
+        index = self._index.next_after(pos + 0.001)
+        if index is None: return
+        subtitle = self._index.project.subtitles[index]
+        self.player.seek(subtitle.start_seconds)
 
     @aeidon.deco.export
     def _on_seek_previous_activate(self, *args):
         """Seek to the start of the previous subtitle."""
         pos = self.player.get_position(aeidon.modes.SECONDS)
         if pos is None: return
-        subtitles = list(filter(lambda x: x[1] < pos - 0.001, self._cache))
-        if not subtitles: return
-        self.player.seek(subtitles[-1][0])
+        if self._index is None: return
+        index = self._index.previous_before(pos - 0.001)
+        if index is None: return
+        subtitle = self._index.project.subtitles[index]
+        self.player.seek(subtitle.start_seconds)
 
     @aeidon.deco.export
     def _on_seek_selection_end_activate(self, *args):
@@ -367,9 +371,8 @@ class VideoAgent(aeidon.Delegate):
                 action.set_state(str(i))
 
     def _update_subtitle_cache(self, *args, **kwargs):
-        """Update subtitle position and text cache."""
+        """Update subtitle position index."""
         page = self.get_current_page()
         if self.player is None or page is None:
             return self._clear_subtitle_cache()
-        self._cache = [(x.start_seconds, x.end_seconds, x.main_text)
-                       for x in page.project.subtitles]
+        self._index = page.project.get_interval_index()
@@ -50,6 +50,7 @@ class ApplicationManager(Gtk.Application):
     def _init_application(self, opts, args):
         """Initialize application and open files from `args`."""
         application = gaupol.Application()
+        application.restore_journals()
         paths = [Path(x).resolve() for x in args]
         application.open_main(paths, opts.encoding)
         page = application.get_current_page()
@@ -96,12 +96,14 @@ CONFIG_DEFAULTS = {
     },
     "file": {
         "align_method": aeidon.align_methods.POSITION,
+        "autosave_interval": 5,
         "directory": "",
         "encoding": "utf_8",
         "force_encoding": "",
         "force_newline": None,
         "format": aeidon.formats.SUBRIP,
         "newline": aeidon.util.get_default_newline(),
+        "use_cache": False,
     },
     "framerate_convert": {
         "target": gaupol.targets.CURRENT,
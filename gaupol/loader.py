@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""Reading a main file in a worker thread."""
+
+import aeidon
+import gaupol
+import threading
+
+class Loader(aeidon.Observable):
+
+    """
+    Reading a main file in a worker thread.
+
+    :ivar file: :class:`aeidon.SubtitleFile` read or ``None``
+    :ivar fraction: Fraction of the file read so far
+    :ivar path: Path to the file being read
+    :ivar subtitles: List of subtitles read so far
+
+    Signals and their arguments for callback functions:
+     * ``failed``: loader, exception
+     * ``finished``: loader
+     * ``read``: loader, subtitles
+
+    The file is decoded with the first of `encodings` that works and parsed
+    in batches, which are handed over to the main thread as they are read.
+    If :attr:`gaupol.conf.file.use_cache` is ``True``, a cached file is
+    loaded as a single batch and a file read is stored in the cache, both
+    in the worker thread.
+    All signals are emitted in the main thread, no more after :meth:`cancel`.
+    """
+
+    signals = ("failed", "finished", "read")
+
+    def __init__(self, project, path, encodings, data):
+        """Initialize a :class:`Loader` instance."""
+        aeidon.Observable.__init__(self)
+        self._cache = gaupol.conf.file.use_cache
+        self._cancelled = threading.Event()
+        self._data = data
+        self._encodings = encodings
+        self._framerate = project.framerate
+        self._project = project
+        self.file = None
+        self.fraction = 0
+        self.path = path
+        self.subtitles = []
+
+    def cancel(self):
+        """Stop reading and emitting signals."""
+        self._cancelled.set()
+
+    def _on_failed(self, error, file):
+        """Emit the ``failed`` signal in the main thread."""
+        if self._cancelled.is_set(): return
+        self.file = file
+        self.emit("failed", error)
+
+    def _on_finished(self, file):
+        """Emit the ``finished`` signal in the main thread."""
+        if self._cancelled.is_set(): return
+        self.file = file
+        self.emit("finished")
+
+    def _on_read(self, subtitles, fraction):
+        """Emit the ``read`` signal in the main thread."""
+        if self._cancelled.is_set(): return
+        self.subtitles.extend(subtitles)
+        self.fraction = fraction
+        self.emit("read", subtitles)
+
+    def _read(self, encoding):
+        """Read file in the worker thread."""
+        file, batches = self._project.read_main(self.path,
+                                                encoding,
+                                                self._data,
+                                                cache=self._cache)
+
+        try:
+            for subtitles, fraction in batches:
+                if self._cancelled.is_set(): return
+                # Match project framerate for positions shown while loading.
+                for subtitle in subtitles:
+                    subtitle.framerate = self._framerate
+                gaupol.util.idle_add(self._on_read, subtitles, fraction)
+        except Exception as error:
+            return gaupol.util.idle_add(self._on_failed, error, file)
+        gaupol.util.idle_add(self._on_finished, file)
+
+    def _run(self):
+        """Try encodings one by one in the worker thread."""
+        try:
+            for encoding in self._encodings:
+                if encoding == "auto":
+                    encoding = aeidon.encodings.detect(
+                        self.path, self._data, sample=True)
+                    if encoding is None: continue
+                try:
+                    return self._read(encoding)
+                except UnicodeError:
+                    continue
+            raise UnicodeError(f"Failed to decode {str(self.path)!r}")
+        except Exception as error:
+            gaupol.util.idle_add(self._on_failed, error, None)
+        finally:
+            self._data = None
+
+    def start(self):
+        """Start reading in a worker thread."""
+        # Callbacks added with idle_add are called in order, so batches
+        # are received in order and before the ``finished`` signal.
+        threading.Thread(target=self._run, daemon=True).start()
@@ -24,6 +24,7 @@ import sys
 from aeidon.i18n   import _
 from gi.repository import Gtk
 from gi.repository import Pango
+from pathlib import Path
 
 class Page(aeidon.Observable):
 
@@ -31,6 +32,9 @@ class Page(aeidon.Observable):
     User interface container and controller for :class:`aeidon.Project`.
 
     :ivar edit_mode: :attr:`aeidon.modes` item corresponding to editing mode
+    :ivar journal: :class:`aeidon.Journal` of project changes or ``None``
+    :ivar loader: :class:`gaupol.Loader` reading the main file or ``None``
+    :ivar progress_bar: :class:`Gtk.ProgressBar` of :attr:`loader`
     :ivar project: The associated :class:`aeidon.Project` instance
     :ivar tab_label: :class:`Gtk.Label` contained in :attr:`tab_widget`
     :ivar tab_widget: Widget that can be placed in a notebook tab
@@ -50,6 +54,9 @@ class Page(aeidon.Observable):
         """Initialize a :class:`Page` instance."""
         aeidon.Observable.__init__(self)
         self.edit_mode = gaupol.conf.editor.mode
+        self.journal = None
+        self.loader = None
+        self.progress_bar = None
         self.project = None
         self.tab_label = None
         self.tab_widget = None
@@ -69,6 +76,23 @@ class Page(aeidon.Observable):
             return self.view.columns.TRAN_TEXT
         raise ValueError(f"Invalid document: {doc!r}")
 
+    def extend_view(self, subtitles):
+        """Append rows for `subtitles` to the end of the view."""
+        store = self.view.get_model()
+        mode = self.edit_mode
+        for i, subtitle in enumerate(subtitles, len(store) + 1):
+            duration = (subtitle.duration_seconds
+                        if mode == aeidon.modes.TIME else
+                        subtitle.duration_frame)
+
+            # Append all values at once to update the view only once.
+            store.append((i,
+                          subtitle.get_start(mode),
+                          subtitle.get_end(mode),
+                          duration,
+                          subtitle.main_text,
+                          subtitle.tran_text))
+
     def get_basename(self, doc):
         """Return basename of `doc`."""
         if doc == aeidon.documents.MAIN:
@@ -81,6 +105,8 @@ class Page(aeidon.Observable):
         """Return basename of the main document."""
         if self.project.main_file is not None:
             return self.project.main_file.path.name
+        if self.loader is not None:
+            return Path(self.loader.path).name
         return self.untitle
 
     def _get_subtitle_value(self, row, field):
@@ -138,6 +164,7 @@ class Page(aeidon.Observable):
         """Initialize :class:`aeidon.Project` with proper properties."""
         framerate = gaupol.conf.editor.framerate
         self.project = aeidon.Project(framerate)
+        self.view.interval_index = self.project.get_interval_index()
 
     def _init_signal_handlers(self):
         """Initialize signal handlers."""
@@ -175,14 +202,23 @@ class Page(aeidon.Observable):
         width = gaupol.util.char_to_px(24)
         self.tab_label.set_size_request(width, -1)
         self.tab_label.set_tooltip_text(self.untitle)
+        self.progress_bar = Gtk.ProgressBar()
+        self.progress_bar.set_visible(False)
         button = self._get_tab_close_button()
+        vbox = gaupol.util.new_vbox(spacing=2)
+        gaupol.util.pack_start_expand(vbox, self.tab_label)
+        gaupol.util.pack_start(vbox, self.progress_bar)
         box = gaupol.util.new_hbox(spacing=4)
-        gaupol.util.pack_start_expand(box, self.tab_label)
+        gaupol.util.pack_start_expand(box, vbox)
         gaupol.util.pack_start(box, button)
         self.tab_widget = box
 
     def _on_project_main_file_opened(self, *args):
         """Reload the entire view."""
+        if (self.loader is not None and
+            self.project.subtitles == self.loader.subtitles):
+            # Rows were added in the same order while loading.
+            return gaupol.util.iterate_main()
         self.reload_view_all()
         gaupol.util.iterate_main()
 
@@ -62,6 +62,11 @@ class TestCase(aeidon.TestCase):
             if hasattr(self, name):
                 getattr(self, name).destroy()
         if hasattr(self, "application"):
+            for page in self.application.pages:
+                if page.journal is not None:
+                    page.journal.remove()
+                    page.journal = None
+            self.application.stop_autosave()
             self.application.window.set_visible(False)
             self.application.window.destroy()
         gaupol.util.iterate_main()
@@ -20,6 +20,7 @@
 import aeidon
 import contextlib
 import gaupol
+import os
 import sys
 import traceback
 import webbrowser
@@ -187,6 +188,24 @@ def idle_add(function, *args, **kwargs):
         return False # to not be called again.
     return GLib.idle_add(call_function, *args, **kwargs)
 
+def is_process_running(pid):
+    """Return ``True`` if a process with `pid` is running."""
+    if sys.platform == "win32":
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        # PROCESS_QUERY_LIMITED_INFORMATION
+        handle = kernel32.OpenProcess(0x1000, False, pid)
+        if not handle: return False
+        kernel32.CloseHandle(handle)
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
 def iterate_main():
     """Iterate the GLib main loop while events are pending."""
     context = GLib.MainContext.default()
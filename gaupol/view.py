@@ -38,6 +38,8 @@ class View(Gtk.TreeView):
        are updated when columns are added, removed or reordered. Note that
        these indices are not necessarily the same as the column indices in the
        underlying :class:`Gtk.ListStore` data model.
+
+    :ivar interval_index: :class:`aeidon.IntervalIndex` of subtitles shown
     """
 
     def __init__(self, edit_mode):
@@ -47,6 +49,7 @@ class View(Gtk.TreeView):
         self._calc = aeidon.Calculator()
         self._cell_editor = None
         self.columns = aeidon.Enumeration()
+        self.interval_index = None
         self._selection_changed_handlers = {}
         self._init_signal_handlers()
         self._init_props(edit_mode)
@@ -370,6 +373,12 @@ class View(Gtk.TreeView):
         if not self._calc.is_valid_time(time_key): return False
         time_iter = store[row][col]
         if not ":" in time_iter: return False
+        if self.interval_index is not None:
+            # Match the last subtitle starting at or before key.
+            seconds = self._calc.time_to_seconds(time_key)
+            index = self.interval_index.next_after(seconds)
+            index = len(store) if index is None else index
+            return row != index - 1
         try:
             time_next = store[row+1][col]
         except IndexError: